@@ -79,6 +79,10 @@ DATABASES = {
         'PASSWORD': os.getenv('DB_PASSWORD', 'crowdfunding_pass'),
         'HOST': os.getenv('DB_HOST', 'localhost'),
         'PORT': os.getenv('DB_PORT', '5437'),
+        # Reuse connections across requests, replacing them after this many
+        # seconds; health checks drop ones the server closed while idle
+        'CONN_MAX_AGE': int(os.getenv('DB_CONN_MAX_AGE', '600')),
+        'CONN_HEALTH_CHECKS': True,
     }
 }
 
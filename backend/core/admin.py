@@ -338,12 +338,8 @@ class EventAdmin(admin.ModelAdmin):
         if not obj.event_data:
             return 'No event data'
         
-        try:
-            data = json.loads(obj.event_data)
-            formatted = json.dumps(data, indent=2)
-            return format_html('<pre style="background: #f5f5f5; padding: 10px; border-radius: 4px;">{}</pre>', formatted)
-        except json.JSONDecodeError:
-            return format_html('<pre style="background: #f5f5f5; padding: 10px; border-radius: 4px;">{}</pre>', obj.event_data)
+        formatted = json.dumps(obj.event_data, indent=2)
+        return format_html('<pre style="background: #f5f5f5; padding: 10px; border-radius: 4px;">{}</pre>', formatted)
     formatted_event_data.short_description = 'Event Data (JSON)'
     
     actions = ['mark_removed', 'mark_not_removed', 'delete_selected_events']
@@ -156,6 +156,7 @@ class EventSerializer(serializers.ModelSerializer):
     
     # Normalize addresses
     address = serializers.SerializerMethodField()
+    event_data = serializers.SerializerMethodField()
     event_data_parsed = serializers.SerializerMethodField()
     
     class Meta:
@@ -181,14 +182,17 @@ class EventSerializer(serializers.ModelSerializer):
             return format_address(obj.address.address)
         return None
     
+    def get_event_data(self, obj):
+        """Return event_data as a JSON string (stored as JSONB)."""
+        if obj.event_data is None:
+            return None
+        return json.dumps(obj.event_data)
+    
     def get_event_data_parsed(self, obj):
-        """Parse JSON event_data if valid."""
+        """Return event_data as an object."""
         if not obj.event_data:
             return None
-        try:
-            return json.loads(obj.event_data)
-        except json.JSONDecodeError:
-            return None
+        return obj.event_data
 
 
 class CampaignDetailSerializer(CampaignSerializer):
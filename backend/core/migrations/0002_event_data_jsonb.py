@@ -0,0 +1,25 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    """Store events.event_data as JSONB instead of a JSON string in TEXT.
+
+    The events table is unmanaged, so the column type is changed with raw SQL
+    and the model state is updated separately.
+    """
+
+    dependencies = [
+        ('core', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            sql="ALTER TABLE events ALTER COLUMN event_data TYPE jsonb USING event_data::jsonb;",
+            reverse_sql="ALTER TABLE events ALTER COLUMN event_data TYPE text USING event_data::text;",
+        ),
+        migrations.AlterField(
+            model_name='event',
+            name='event_data',
+            field=models.JSONField(blank=True, null=True),
+        ),
+    ]
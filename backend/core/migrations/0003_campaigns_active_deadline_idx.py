@@ -0,0 +1,21 @@
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    """Partial index for the reconciliation query on expired ACTIVE campaigns."""
+
+    atomic = False  # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+
+    dependencies = [
+        ('core', '0002_event_data_jsonb'),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            sql=(
+                "CREATE INDEX CONCURRENTLY IF NOT EXISTS campaigns_active_deadline_idx "
+                "ON campaigns (deadline_ts) WHERE status = 'ACTIVE' AND NOT withdrawn;"
+            ),
+            reverse_sql="DROP INDEX CONCURRENTLY IF EXISTS campaigns_active_deadline_idx;",
+        ),
+    ]
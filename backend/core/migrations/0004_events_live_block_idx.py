@@ -0,0 +1,21 @@
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    """Partial index for reorg rollback and replay scans over live events."""
+
+    atomic = False  # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+
+    dependencies = [
+        ('core', '0003_campaigns_active_deadline_idx'),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            sql=(
+                "CREATE INDEX CONCURRENTLY IF NOT EXISTS events_live_chain_block_idx "
+                "ON events (chain_id, block_number, log_index) WHERE NOT removed;"
+            ),
+            reverse_sql="DROP INDEX CONCURRENTLY IF EXISTS events_live_chain_block_idx;",
+        ),
+    ]
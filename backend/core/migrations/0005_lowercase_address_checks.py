@@ -0,0 +1,29 @@
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    """Enforce lowercase addresses so the indexer can skip lower() on read."""
+
+    dependencies = [
+        ('core', '0004_events_live_block_idx'),
+    ]
+
+    operations = [
+        # NOT VALID + VALIDATE avoids holding an exclusive lock during the scan
+        migrations.RunSQL(
+            sql=(
+                "ALTER TABLE campaigns ADD CONSTRAINT campaigns_address_lower_chk "
+                "CHECK (address = lower(address)) NOT VALID;"
+                "ALTER TABLE campaigns VALIDATE CONSTRAINT campaigns_address_lower_chk;"
+            ),
+            reverse_sql="ALTER TABLE campaigns DROP CONSTRAINT IF EXISTS campaigns_address_lower_chk;",
+        ),
+        migrations.RunSQL(
+            sql=(
+                "ALTER TABLE events ADD CONSTRAINT events_address_lower_chk "
+                "CHECK (address = lower(address)) NOT VALID;"
+                "ALTER TABLE events VALIDATE CONSTRAINT events_address_lower_chk;"
+            ),
+            reverse_sql="ALTER TABLE events DROP CONSTRAINT IF EXISTS events_address_lower_chk;",
+        ),
+    ]
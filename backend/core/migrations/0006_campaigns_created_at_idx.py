@@ -0,0 +1,18 @@
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    """Index for the indexer's max(created_at) check on the campaign list."""
+
+    atomic = False  # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+
+    dependencies = [
+        ('core', '0005_lowercase_address_checks'),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            sql="CREATE INDEX CONCURRENTLY IF NOT EXISTS campaigns_created_at_idx ON campaigns (created_at);",
+            reverse_sql="DROP INDEX CONCURRENTLY IF EXISTS campaigns_created_at_idx;",
+        ),
+    ]
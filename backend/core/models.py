@@ -161,7 +161,7 @@ class Event(models.Model):
         related_name='events'
     )
     event_name = models.CharField(max_length=100)
-    event_data = models.TextField(null=True, blank=True)  # JSON string
+    event_data = models.JSONField(null=True, blank=True)  # JSONB
     removed = models.BooleanField(default=False)
     created_at = models.DateTimeField(auto_now_add=False)
     
@@ -1,6 +1,9 @@
 """CLI module for the indexer with producer/consumer/broker subcommands."""
 
 import argparse
+import functools
+import shutil
+import subprocess
 import sys
 
 from config import Config
@@ -13,11 +16,58 @@ from messaging.routing import ALL_EVENT_QUEUES, DLX_QUEUE_NAME
 logger = get_logger(__name__)
 
 
-def broker_setup(config: Config) -> None:
+@functools.lru_cache(maxsize=None)
+def _producer_main():
+    """Load the producer entry point on first use."""
+    from producer.main import main
+    return main
+
+
+@functools.lru_cache(maxsize=None)
+def _consumer_main():
+    """Load the consumer entry point on first use."""
+    from consumer.main import main
+    return main
+
+
+def apply_broker_stats_settings(stats_interval_ms: int, rates_mode: str) -> None:
+    """Lower RabbitMQ management statistics overhead.
+
+    Uses rabbitmqctl when it is available on this host (i.e. running on the
+    broker node); otherwise prints the equivalent rabbitmq.conf settings.
+    Runtime changes are lost on broker restart, so persist them in
+    rabbitmq.conf as well.
+
+    Args:
+        stats_interval_ms: Statistics collection interval in milliseconds
+        rates_mode: Management rates mode (basic, detailed, none)
+    """
+    commands = [
+        f"application:set_env(rabbit, collect_statistics_interval, {stats_interval_ms}).",
+        f"application:set_env(rabbitmq_management, rates_mode, {rates_mode}).",
+    ]
+
+    if shutil.which("rabbitmqctl") is None:
+        print("rabbitmqctl not found; add these lines to rabbitmq.conf and restart the broker:")
+        print(f"  collect_statistics_interval = {stats_interval_ms}")
+        print(f"  management.rates_mode = {rates_mode}")
+        return
+
+    for command in commands:
+        result = subprocess.run(["rabbitmqctl", "eval", command], capture_output=True, text=True)
+        if result.returncode != 0:
+            print(f"  Failed: rabbitmqctl eval '{command}': {result.stderr.strip()}", file=sys.stderr)
+            return
+
+    print(f"  Stats interval: {stats_interval_ms}ms, rates mode: {rates_mode}")
+
+
+def broker_setup(config: Config, low_overhead: bool = False) -> None:
     """Set up RabbitMQ exchanges, queues, and bindings.
     
     Args:
         config: Configuration object
+        low_overhead: Also reduce management statistics collection
     """
     print(f"Setting up RabbitMQ broker at {config.rabbitmq_host}:{config.rabbitmq_port}")
     
@@ -38,6 +88,14 @@ def broker_setup(config: Config) -> None:
         print(f"  DLQ: {DLX_QUEUE_NAME}")
     finally:
         connection.close()
+    
+    if low_overhead:
+        apply_broker_stats_settings(
+            max(config.rabbitmq_stats_interval_ms, 60000),
+            "none",
+        )
+    elif config.rabbitmq_stats_interval_ms != 5000 or config.rabbitmq_rates_mode != "basic":
+        apply_broker_stats_settings(config.rabbitmq_stats_interval_ms, config.rabbitmq_rates_mode)
 
 
 def broker_status(config: Config) -> None:
@@ -146,7 +204,13 @@ def create_parser() -> argparse.ArgumentParser:
     
     # consumer run
     consumer_run = consumer_subparsers.add_parser("run", help="Start consumer workers")
-    consumer_run.add_argument("--workers", "-w", type=int, help="Number of worker processes")
+    consumer_run.add_argument("--workers", "-w", type=int, help="Number of workers")
+    consumer_run.add_argument(
+        "--mode",
+        choices=["async", "thread", "process"],
+        help="Concurrency mode (default: CONSUMER_MODE or async)",
+    )
+    consumer_run.add_argument("--sync", action="store_true", help="Alias for --mode process")
     
     # consumer status
     consumer_status = consumer_subparsers.add_parser("status", help="Show consumer/queue status")
@@ -157,6 +221,11 @@ def create_parser() -> argparse.ArgumentParser:
     
     # broker setup
     broker_setup_parser = broker_subparsers.add_parser("setup", help="Set up exchanges and queues")
+    broker_setup_parser.add_argument(
+        "--low-overhead",
+        action="store_true",
+        help="Disable management rate stats and collect statistics every 60s",
+    )
     
     # broker status
     broker_status_parser = broker_subparsers.add_parser("status", help="Show queue status")
@@ -189,7 +258,6 @@ def main() -> None:
     # Load config
     try:
         config = Config.from_env()
-        config.validate()
     except Exception as e:
         print(f"Configuration error: {e}", file=sys.stderr)
         sys.exit(1)
@@ -204,27 +272,24 @@ def main() -> None:
                 print("Usage: python -m indexer producer {run|backfill|status}")
                 sys.exit(1)
             
-            from producer.main import main as producer_main
-            
             if args.subcommand == "run":
-                producer_main("run")
+                _producer_main()("run")
             elif args.subcommand == "backfill":
-                producer_main("backfill", args.from_block, args.to_block)
+                _producer_main()("backfill", args.from_block, args.to_block)
             elif args.subcommand == "status":
-                producer_main("status")
+                _producer_main()("status")
                 
         elif args.command == "consumer":
             if not args.subcommand:
                 print("Usage: python -m indexer consumer {run|status}")
                 sys.exit(1)
             
-            from consumer.main import main as consumer_main
-            
             if args.subcommand == "run":
                 workers = getattr(args, "workers", None)
-                consumer_main("run", workers)
+                mode = "process" if args.sync else args.mode
+                _consumer_main()("run", workers, mode)
             elif args.subcommand == "status":
-                consumer_main("status")
+                _consumer_main()("status")
                 
         elif args.command == "broker":
             if not args.subcommand:
@@ -232,7 +297,7 @@ def main() -> None:
                 sys.exit(1)
             
             if args.subcommand == "setup":
-                broker_setup(config)
+                broker_setup(config, args.low_overhead)
             elif args.subcommand == "status":
                 broker_status(config)
             elif args.subcommand == "purge":
@@ -241,18 +306,15 @@ def main() -> None:
         # Legacy commands (backward compatibility)
         elif args.command == "run":
             print("Note: 'run' is deprecated. Use 'producer run' instead.")
-            from producer.main import main as producer_main
-            producer_main("run")
+            _producer_main()("run")
             
         elif args.command == "backfill":
             print("Note: 'backfill' is deprecated. Use 'producer backfill' instead.")
-            from producer.main import main as producer_main
-            producer_main("backfill", args.from_block, args.to_block)
+            _producer_main()("backfill", args.from_block, args.to_block)
             
         elif args.command == "status":
             print("Note: 'status' is deprecated. Use 'producer status' or 'broker status' instead.")
-            from producer.main import main as producer_main
-            producer_main("status")
+            _producer_main()("status")
             
         else:
             parser.print_help()
@@ -1,115 +1,86 @@
 """Configuration management for """
 
-import os
-from dataclasses import dataclass
-from typing import Optional
+from pathlib import Path
+from typing import Literal, Optional
 
-from dotenv import load_dotenv
+from pydantic import Field
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
-# Load environment variables from .env file if present
-load_dotenv()
+# Next to this module, not the working directory, so the indexer finds it
+# however it is started
+ENV_FILE = Path(__file__).resolve().parent / ".env"
 
 
-@dataclass
-class Config:
-    """Indexer configuration."""
+class Config(BaseSettings):
+    """Indexer configuration.
+
+    Values are read from environment variables (and a .env file if present),
+    matched case-insensitively by field name, e.g. FACTORY_ADDRESS.
+    """
+
+    model_config = SettingsConfigDict(env_file=ENV_FILE, env_prefix="", extra="ignore")
 
     # Required
-    factory_address: str
-    db_url: str
+    factory_address: str = Field(min_length=1)
+    db_url: str = Field(min_length=1)
 
     # Blockchain settings
     rpc_url: str = "http://127.0.0.1:8545"
-    confirmations: int = 1
-    block_batch_size: int = 2000
-    poll_interval_seconds: int = 15
-    reorg_rollback_blocks: int = 50
+    ws_url: Optional[str] = None  # e.g. ws://127.0.0.1:8545; enables newHeads subscription
+    confirmations: int = Field(default=1, ge=0)
+    block_batch_size: int = Field(default=2000, gt=0)
+    poll_interval_seconds: int = Field(default=2, gt=0)
+    reorg_rollback_blocks: int = Field(default=50, gt=0)
     log_level: str = "INFO"
     chain_id: int = 31337  # Hardhat default
+    rpc_max_concurrency: int = Field(default=8, gt=0)  # Concurrent eth_getLogs requests
+    rpc_log_chunk_size: int = Field(default=500, gt=0)  # Blocks per eth_getLogs request
+    backfill_workers: int = Field(default=8, gt=0)  # Concurrent block-range partitions in producer backfill
+    latest_block_cache_ttl_ms: int = Field(default=1500, ge=0)  # 0 disables; keep under block time
 
     # RabbitMQ settings
     rabbitmq_host: str = "localhost"
-    rabbitmq_port: int = 5672
+    rabbitmq_port: int = Field(default=5672, gt=0)
     rabbitmq_user: str = "guest"
     rabbitmq_password: str = "guest"
     rabbitmq_vhost: str = "/"
     rabbitmq_exchange: str = "blockchain_events"
-    rabbitmq_prefetch_count: int = 10
+    rabbitmq_prefetch_count: int = Field(default=128, gt=0)
+    rabbitmq_stats_interval_ms: int = Field(default=5000, gt=0)  # Broker default
+    rabbitmq_rates_mode: Literal["basic", "detailed", "none"] = "basic"
 
     # Consumer settings
-    consumer_workers: int = 4
-    max_retries: int = 3
+    consumer_mode: Literal["async", "thread", "process"] = "async"
+    consumer_workers: int = Field(default=4, gt=0)
+    max_retries: int = Field(default=3, ge=0)
+    ack_batch_size: int = Field(default=32, gt=0)  # 1 disables ack batching
+    ack_flush_interval_ms: int = Field(default=50, gt=0)
+
+    # Database settings (keep pool size + overflow, per process, well under max_connections)
+    db_pool_size: int = Field(default=10, gt=0)
+    db_max_overflow: int = Field(default=20, ge=0)
+    db_pool_recycle: int = 3600  # Seconds; -1 disables
+    db_pool_timeout: int = Field(default=30, gt=0)  # Seconds to wait for a free connection
+    db_relaxed_durability: bool = False  # synchronous_commit=off
 
     # Reconciliation settings
     reconciliation_interval_seconds: int = 300
 
     @classmethod
-    def from_env(cls) -> "Config":
-        """Load configuration from environment variables."""
-        factory_address = os.getenv("FACTORY_ADDRESS")
-        if not factory_address:
-            raise ValueError("FACTORY_ADDRESS environment variable is required")
-
-        db_url = os.getenv("DB_URL")
-        if not db_url:
-            raise ValueError("DB_URL environment variable is required")
-
-        return cls(
-            factory_address=factory_address,
-            db_url=db_url,
-            # Blockchain settings
-            rpc_url=os.getenv("RPC_URL", "http://127.0.0.1:8545"),
-            confirmations=int(os.getenv("CONFIRMATIONS", "1")),
-            block_batch_size=int(os.getenv("BLOCK_BATCH_SIZE", "2000")),
-            poll_interval_seconds=int(os.getenv("POLL_INTERVAL_SECONDS", "2")),
-            reorg_rollback_blocks=int(os.getenv("REORG_ROLLBACK_BLOCKS", "50")),
-            log_level=os.getenv("LOG_LEVEL", "INFO"),
-            chain_id=int(os.getenv("CHAIN_ID", "31337")),
-            # RabbitMQ settings
-            rabbitmq_host=os.getenv("RABBITMQ_HOST", "localhost"),
-            rabbitmq_port=int(os.getenv("RABBITMQ_PORT", "5672")),
-            rabbitmq_user=os.getenv("RABBITMQ_USER", "guest"),
-            rabbitmq_password=os.getenv("RABBITMQ_PASSWORD", "guest"),
-            rabbitmq_vhost=os.getenv("RABBITMQ_VHOST", "/"),
-            rabbitmq_exchange=os.getenv("RABBITMQ_EXCHANGE", "blockchain_events"),
-            rabbitmq_prefetch_count=int(os.getenv("RABBITMQ_PREFETCH_COUNT", "10")),
-            # Consumer settings
-            consumer_workers=int(os.getenv("CONSUMER_WORKERS", "4")),
-            max_retries=int(os.getenv("MAX_RETRIES", "3")),
-            # Reconciliation settings
-            reconciliation_interval_seconds=int(os.getenv("RECONCILIATION_INTERVAL_SECONDS", "300")),
-        )
+    def from_env(cls, env_file: Optional[Path] = ENV_FILE) -> "Config":
+        """Load and validate configuration from environment variables.
 
-    def validate(self) -> None:
-        """Validate configuration values."""
-        if not self.factory_address:
-            raise ValueError("factory_address is required")
-        if not self.db_url:
-            raise ValueError("db_url is required")
-        if self.confirmations < 0:
-            raise ValueError("confirmations must be >= 0")
-        if self.block_batch_size <= 0:
-            raise ValueError("block_batch_size must be > 0")
-        if self.poll_interval_seconds <= 0:
-            raise ValueError("poll_interval_seconds must be > 0")
-        if self.reorg_rollback_blocks <= 0:
-            raise ValueError("reorg_rollback_blocks must be > 0")
-        if self.rabbitmq_port <= 0:
-            raise ValueError("rabbitmq_port must be > 0")
-        if self.rabbitmq_prefetch_count <= 0:
-            raise ValueError("rabbitmq_prefetch_count must be > 0")
-        if self.consumer_workers <= 0:
-            raise ValueError("consumer_workers must be > 0")
-        if self.max_retries < 0:
-            raise ValueError("max_retries must be >= 0")
+        Args:
+            env_file: .env file to read as well (None: environment only)
+
+        Raises:
+            pydantic.ValidationError: If a required value is missing or invalid
+        """
+        return cls(_env_file=env_file)
 
     def get_rabbitmq_connection_params(self) -> dict:
         """Get RabbitMQ connection parameters as a dictionary."""
-        return {
-            "host": self.rabbitmq_host,
-            "port": self.rabbitmq_port,
-            "user": self.rabbitmq_user,
-            "password": self.rabbitmq_password,
-            "vhost": self.rabbitmq_vhost,
-        }
-
+        params = self.model_dump(
+            include={"rabbitmq_host", "rabbitmq_port", "rabbitmq_user", "rabbitmq_password", "rabbitmq_vhost"}
+        )
+        return {key.removeprefix("rabbitmq_"): value for key, value in params.items()}
@@ -0,0 +1,281 @@
+"""Asyncio consumer - single event loop consuming all queues via aio-pika."""
+
+import asyncio
+import signal
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional, Set
+
+import aio_pika
+from aio_pika.abc import AbstractChannel, AbstractExchange, AbstractIncomingMessage, AbstractRobustConnection
+
+from config import Config
+from db.session import init_db
+from log import get_logger
+from messaging.routing import ALL_EVENT_QUEUES, RETRY_EXCHANGE_NAME
+from consumer.event_handler import EventHandler, TransientError, get_retry_count, increment_retry_count
+
+logger = get_logger(__name__)
+
+try:
+    import uvloop
+except ImportError:  # pragma: no cover - optional, not available on Windows
+    uvloop = None
+
+
+class AsyncConsumerWorker:
+    """Consumer worker running all queue consumers on one asyncio event loop.
+
+    Deliveries are handled as concurrent tasks, bounded by a semaphore sized to
+    the prefetch count. Database work still goes through the synchronous
+    EventHandler and runs on a thread pool no larger than the connection pool,
+    so the event loop never blocks on Postgres.
+    """
+
+    def __init__(
+        self,
+        config: Config,
+        worker_id: int = 0,
+        executor: Optional[ThreadPoolExecutor] = None,
+        connection: Optional[AbstractRobustConnection] = None,
+    ):
+        """Initialize async consumer worker.
+
+        Args:
+            config: Configuration object
+            worker_id: Worker ID for logging
+            executor: Thread pool shared with other workers (created if None)
+            connection: AMQP connection shared with other workers (opened if None)
+        """
+        self.config = config
+        self.worker_id = worker_id
+        self.prefetch_count = config.rabbitmq_prefetch_count
+        self.connection = connection
+        self._owns_connection = connection is None
+        self.event_handler: Optional[EventHandler] = None
+        self._executor = executor
+        self._owns_executor = executor is None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._stop_event: Optional[asyncio.Event] = None
+        self._retry_exchange: Optional[AbstractExchange] = None
+        self._tasks: Set[asyncio.Task] = set()
+
+    async def run(self, stop_event: asyncio.Event) -> None:
+        """Consume messages until stop_event is set.
+
+        Args:
+            stop_event: Event signalling graceful shutdown
+        """
+        logger.info(f"Worker {self.worker_id}: Starting (asyncio)")
+        self._stop_event = stop_event
+
+        init_db(self.config)
+        self.event_handler = EventHandler(self.config)
+        if self._owns_executor:
+            self._executor = ThreadPoolExecutor(
+                max_workers=min(self.prefetch_count, self.config.db_pool_size),
+                thread_name_prefix=f"consumer-{self.worker_id}",
+            )
+        self._semaphore = asyncio.Semaphore(self.prefetch_count)
+
+        if self._owns_connection:
+            self.connection = await connect(self.config)
+
+        # Prefetch is per channel, so each worker keeps its own window
+        channel = await self.connection.channel()
+        try:
+            await channel.set_qos(prefetch_count=self.prefetch_count)
+            self._retry_exchange = await channel.get_exchange(RETRY_EXCHANGE_NAME)
+
+            consumers = [
+                asyncio.create_task(self._consume(channel, queue_name))
+                for queue_name in ALL_EVENT_QUEUES
+            ]
+            logger.info(
+                f"Worker {self.worker_id}: Started, consuming from {len(ALL_EVENT_QUEUES)} queues "
+                f"(max in-flight={self.prefetch_count})"
+            )
+
+            await stop_event.wait()
+
+            # Stop receiving new deliveries, then drain in-flight handlers
+            for consumer in consumers:
+                consumer.cancel()
+            await asyncio.gather(*consumers, return_exceptions=True)
+            if self._tasks:
+                await asyncio.gather(*self._tasks, return_exceptions=True)
+        finally:
+            if self._owns_connection:
+                await self.connection.close()
+            elif not channel.is_closed:
+                await channel.close()
+            if self._owns_executor:
+                self._executor.shutdown(wait=True)
+            self.event_handler.close()
+            logger.info(
+                f"Worker {self.worker_id}: Stopped. "
+                f"Processed: {self.event_handler.events_processed}, "
+                f"Failed: {self.event_handler.events_failed}"
+            )
+
+    async def _consume(self, channel: AbstractChannel, queue_name: str) -> None:
+        """Consume a single queue, spawning one task per delivery.
+
+        Args:
+            channel: aio-pika channel
+            queue_name: Queue to consume from
+        """
+        try:
+            queue = await channel.get_queue(queue_name)
+            logger.info(f"Started consuming from {queue_name}")
+
+            async with queue.iterator() as queue_iter:
+                async for message in queue_iter:
+                    await self._semaphore.acquire()
+                    task = asyncio.create_task(self._bounded_handle(message))
+                    self._tasks.add(task)
+                    task.add_done_callback(self._tasks.discard)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Worker {self.worker_id}: Consumer for {queue_name} failed: {e}", exc_info=True)
+            self._stop_event.set()
+
+    async def _bounded_handle(self, message: AbstractIncomingMessage) -> None:
+        """Handle a delivery and release its semaphore slot.
+
+        Args:
+            message: Incoming message
+        """
+        try:
+            await self._on_message(message)
+        finally:
+            self._semaphore.release()
+
+    async def _on_message(self, message: AbstractIncomingMessage) -> None:
+        """Handle incoming message.
+
+        Args:
+            message: Incoming message (its headers carry the retry count)
+        """
+        loop = asyncio.get_running_loop()
+
+        try:
+            success = await loop.run_in_executor(
+                self._executor,
+                self.event_handler.handle_message,
+                message.body,
+                message,
+            )
+
+            if success:
+                await message.ack()
+            elif get_retry_count(message) >= self.config.max_retries:
+                logger.warning(f"Worker {self.worker_id}: Max retries exceeded, sending to DLQ")
+                await message.reject(requeue=False)
+            else:
+                await self._retry_later(message, increment_retry_count(message))
+
+        except TransientError as e:
+            # Retry after the delay without counting an attempt
+            logger.warning(f"Worker {self.worker_id}: Transient error, retrying later: {e}")
+            await self._retry_later(message, dict(message.headers or {}))
+
+        except Exception as e:
+            logger.error(f"Worker {self.worker_id}: Unexpected error: {e}", exc_info=True)
+            if get_retry_count(message) >= self.config.max_retries:
+                await message.reject(requeue=False)
+            else:
+                await self._retry_later(message, increment_retry_count(message))
+
+    async def _retry_later(self, message: AbstractIncomingMessage, headers: dict) -> None:
+        """Hand a message to the delayed-retry queue and ack the original.
+
+        Falls back to an immediate requeue if the copy cannot be published.
+
+        Args:
+            message: Incoming message
+            headers: Headers for the retried copy
+        """
+        try:
+            await self._retry_exchange.publish(
+                aio_pika.Message(
+                    message.body,
+                    headers=headers,
+                    content_type=message.content_type,
+                    delivery_mode=aio_pika.DeliveryMode.PERSISTENT,
+                ),
+                routing_key=message.routing_key,
+            )
+        except Exception as e:
+            logger.warning(f"Worker {self.worker_id}: Failed to publish retry, requeuing: {e}")
+            await message.nack(requeue=True)
+            return
+
+        await message.ack()
+
+
+async def connect(config: Config) -> AbstractRobustConnection:
+    """Open a robust AMQP connection to the configured broker.
+
+    Args:
+        config: Configuration object
+
+    Returns:
+        aio-pika robust connection
+    """
+    return await aio_pika.connect_robust(
+        host=config.rabbitmq_host,
+        port=config.rabbitmq_port,
+        login=config.rabbitmq_user,
+        password=config.rabbitmq_password,
+        virtualhost=config.rabbitmq_vhost,
+    )
+
+
+async def run_async_consumer(config: Config, num_workers: int = 1) -> None:
+    """Run asyncio consumer workers on one event loop until SIGINT/SIGTERM.
+
+    All workers share one AMQP connection, each on its own channel with its
+    own prefetch window, and one database thread pool sized to the
+    connection pool.
+
+    Args:
+        config: Configuration object
+        num_workers: Number of workers
+    """
+    stop_event = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop_event.set)
+
+    connection = await connect(config)
+    try:
+        with ThreadPoolExecutor(max_workers=config.db_pool_size, thread_name_prefix="consumer-db") as executor:
+            workers = [AsyncConsumerWorker(config, i, executor, connection) for i in range(num_workers)]
+            await asyncio.gather(*(worker.run(stop_event) for worker in workers))
+    finally:
+        await connection.close()
+
+
+def _loop_factory() -> Optional[Callable[[], asyncio.AbstractEventLoop]]:
+    """Get the event loop factory: uvloop when installed, else the default.
+
+    uvloop runs the socket I/O on libuv, which batches readiness handling and
+    cuts per-frame syscall and interpreter overhead versus the selector loop.
+    """
+    if uvloop is None:
+        logger.info("Event loop: asyncio (install uvloop for lower I/O overhead)")
+        return None
+    logger.info("Event loop: uvloop")
+    return uvloop.new_event_loop
+
+
+def run_async(config: Config, num_workers: int = 1) -> None:
+    """Run the asyncio consumer to completion on the best available loop.
+
+    Args:
+        config: Configuration object
+        num_workers: Number of workers
+    """
+    with asyncio.Runner(loop_factory=_loop_factory()) as runner:
+        runner.run(run_async_consumer(config, num_workers))
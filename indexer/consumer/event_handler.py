@@ -1,12 +1,16 @@
 """Event handler for consumer - dispatches messages to appropriate handlers."""
 
 import json
-from typing import Any, Dict, Optional
+import sys
+from contextlib import contextmanager
+from typing import Any, Dict, Generator, List, Optional
 
-from sqlalchemy.exc import IntegrityError, OperationalError
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session, scoped_session
 
 from config import Config
-from db.session import get_session
+from db.session import get_scoped_session
+from eth.address import canonical_address
 from log import get_logger
 from messaging.schema import EventMessage, RollbackMessage, ReconciliationMessage, parse_message
 from consumer.state_updater import ConsumerStateUpdater
@@ -35,11 +39,41 @@ class EventHandler:
         self.state_updater = ConsumerStateUpdater(config.chain_id)
         self.rollback_handler = RollbackHandler(config.chain_id)
         self.reconciliation_handler = ReconciliationHandler(config.chain_id)
+        self._sessions: Optional[scoped_session[Session]] = None
         
         # Stats
         self._events_processed = 0
         self._events_failed = 0
 
+    @contextmanager
+    def _transaction(self) -> Generator[Session, None, None]:
+        """Run one message in a transaction on the worker's long-lived session.
+
+        The session (one per thread) is reused across messages; only the
+        transaction is per message. The identity map is cleared afterwards so
+        later messages never see rows cached from an earlier one.
+
+        Yields:
+            SQLAlchemy Session
+        """
+        if self._sessions is None:
+            self._sessions = get_scoped_session()
+
+        session = self._sessions()
+        try:
+            yield session
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.expunge_all()
+
+    def close(self) -> None:
+        """Close the calling thread's session."""
+        if self._sessions is not None:
+            self._sessions.remove()
+
     def handle_message(
         self,
         body: bytes,
@@ -56,14 +90,13 @@ class EventHandler:
 
         Raises:
             TransientError: If a transient error occurred (should requeue)
-            IntegrityError: If event already exists (should acknowledge)
         """
         try:
             # Parse message
             data = json.loads(body)
             message_type = data.get("message_type")
 
-            logger.debug(f"Processing message: type={message_type}")
+            logger.debug("Processing message: type=%s", message_type)
 
             if message_type == "event":
                 return self._handle_event_message(data)
@@ -78,10 +111,6 @@ class EventHandler:
         except json.JSONDecodeError as e:
             logger.error(f"Failed to parse message JSON: {e}")
             return False
-        except IntegrityError:
-            # Event already exists - this is expected for idempotency
-            logger.debug("Event already exists (duplicate)")
-            raise
         except OperationalError as e:
             # Database temporarily unavailable
             logger.warning(f"Database error (transient): {e}")
@@ -91,23 +120,60 @@ class EventHandler:
             self._events_failed += 1
             return False
 
-    def _handle_event_message(self, data: Dict[str, Any]) -> bool:
-        """Handle an event message.
+    def handle_event_batch(self, messages: List[Dict[str, Any]]) -> None:
+        """Apply a batch of parsed event messages in a single transaction.
+
+        All events are inserted with one multi-row INSERT ... ON CONFLICT DO
+        NOTHING, and state is applied only for the ones that were new, as
+        aggregated statements (see ConsumerStateUpdater.apply_event_batch).
+        The end state matches handling the messages one by one.
 
         Args:
-            data: Parsed message data
+            messages: Parsed event messages, in delivery order
+
+        Raises:
+            Exception: Any database error; nothing from the batch is committed
+        """
+        rows = [self._event_row(data) for data in messages]
+
+        with self._transaction() as session:
+            # Campaigns must exist before their events (events.address FK)
+            for row in rows:
+                if row["event_name"] == "CampaignCreated":
+                    self.state_updater.apply_campaign_created(session, row["event_data"])
+
+            inserted = self.state_updater.insert_events(session, rows)
+            new_count = len(inserted)
+
+            new_events = []
+            for row in rows:
+                key = (row["tx_hash"], row["log_index"])
+                if key not in inserted:
+                    continue
+                inserted.discard(key)  # A redelivered duplicate within the batch applies once
+                if row["event_name"] != "CampaignCreated":
+                    new_events.append((row["event_name"], row["event_data"]))
+
+            if new_events:
+                self.state_updater.apply_event_batch(session, new_events)
+
+        self._events_processed += new_count
+        logger.info(f"Processed batch of {len(rows)} events ({new_count} new)")
+
+    def _event_row(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Extract the events-table columns from an event message.
+
+        Args:
+            data: Parsed event message
 
         Returns:
-            True if processed successfully
+            Dict with tx_hash, log_index, block_number, block_hash, address,
+            event_name and event_data
         """
-        event_type = data.get("event_type")
-        chain_id = data.get("chain_id")
-        block_number = data.get("block_number")
-        block_hash = data.get("block_hash", "")
-        tx_hash = data.get("tx_hash")
-        log_index = data.get("log_index")
-        address = data.get("address", "")
+        # Interned so the dispatch lookups on it compare by identity
+        event_type = sys.intern(data.get("event_type", ""))
         event_data = data.get("event_data", {})
+        address = canonical_address(data.get("address", ""))
 
         # For CampaignCreated events, the address should be the campaign address
         # (not the Factory address that emitted the event)
@@ -115,20 +181,47 @@ class EventHandler:
         if event_type == "CampaignCreated":
             campaign_address = event_data.get("campaign", "")
             if campaign_address:
-                address = str(campaign_address).lower()
-                logger.debug(f"CampaignCreated: using campaign address {address} instead of factory")
+                address = canonical_address(str(campaign_address))
+                logger.debug("CampaignCreated: using campaign address %s instead of factory", address)
+
+        return {
+            "tx_hash": canonical_address(data.get("tx_hash", "")),
+            "log_index": data.get("log_index"),
+            "block_number": data.get("block_number"),
+            "block_hash": canonical_address(data.get("block_hash", "")),
+            "address": address,
+            "event_name": event_type,
+            "event_data": event_data,
+        }
+
+    def _handle_event_message(self, data: Dict[str, Any]) -> bool:
+        """Handle an event message.
+
+        Args:
+            data: Parsed message data
+
+        Returns:
+            True if processed successfully
+        """
+        row = self._event_row(data)
+        event_type = row["event_name"]
+        event_data = row["event_data"]
+        block_number = row["block_number"]
+        block_hash = row["block_hash"]
+        tx_hash = row["tx_hash"]
+        log_index = row["log_index"]
+        address = row["address"]
 
         logger.debug(
-            f"Processing event: {event_type} at block {block_number}, "
-            f"tx={tx_hash}, log_index={log_index}"
+            "Processing event: %s at block %s, tx=%s, log_index=%s",
+            event_type, block_number, tx_hash, log_index,
         )
 
-        with get_session() as session:
+        with self._transaction() as session:
             # For CampaignCreated, we must create the campaign BEFORE inserting
             # the event, because events.address has a FK to campaigns.address
             if event_type == "CampaignCreated":
                 self.state_updater.apply_campaign_created(session, event_data)
-                session.flush()  # Ensure campaign exists before event insert
 
             # Insert event into events table (idempotent)
             event_inserted = self.state_updater.insert_event(
@@ -144,7 +237,7 @@ class EventHandler:
 
             if not event_inserted:
                 # Event already exists, skip state update
-                logger.debug(f"Event already exists, skipping: {tx_hash}:{log_index}")
+                logger.debug("Event already exists, skipping: %s:%s", tx_hash, log_index)
                 return True
 
             # Apply state update (skip CampaignCreated since we already did it above)
@@ -155,11 +248,8 @@ class EventHandler:
                     event_data=event_data,
                 )
 
-            # Commit transaction
-            session.commit()
-
         self._events_processed += 1
-        logger.info(f"Processed {event_type} event: tx={tx_hash}, log_index={log_index}")
+        logger.info("Processed %s event: tx=%s, log_index=%s", event_type, tx_hash, log_index)
         return True
 
     def _handle_rollback_message(self, data: Dict[str, Any]) -> bool:
@@ -178,14 +268,13 @@ class EventHandler:
 
         logger.info(f"Processing rollback: blocks {from_block}-{to_block}, reason={reason}")
 
-        with get_session() as session:
+        with self._transaction() as session:
             self.rollback_handler.handle_rollback(
                 session=session,
                 from_block=from_block,
                 to_block=to_block,
                 reason=reason,
             )
-            session.commit()
 
         logger.info(f"Rollback complete: blocks {from_block}-{to_block}")
         return True
@@ -204,12 +293,11 @@ class EventHandler:
 
         logger.info(f"Processing reconciliation: {reconciliation_type}")
 
-        with get_session() as session:
+        with self._transaction() as session:
             self.reconciliation_handler.handle_reconciliation(
                 session=session,
                 reconciliation_type=reconciliation_type,
             )
-            session.commit()
 
         logger.info(f"Reconciliation complete: {reconciliation_type}")
         return True
@@ -4,30 +4,33 @@ import json
 import multiprocessing
 import signal
 import sys
-import time
-from typing import Optional
+import threading
+from typing import Any, Dict, List, Optional, Tuple
 
-from sqlalchemy.exc import IntegrityError
+import pika
 
 from config import Config
 from db.healthcheck import check_tables_exist
 from db.session import init_db
-from log import get_logger, setup_logging
+from log import get_logger, setup_logging, shutdown_logging
 from messaging.rabbitmq import RabbitMQConnection, RabbitMQConsumer
-from messaging.routing import ALL_EVENT_QUEUES, DLX_QUEUE_NAME
-from consumer.event_handler import EventHandler, TransientError, get_retry_count
+from messaging.routing import ALL_EVENT_QUEUES, DLX_QUEUE_NAME, RETRY_EXCHANGE_NAME
+from consumer.async_worker import run_async
+from consumer.event_handler import EventHandler, TransientError, get_retry_count, increment_retry_count
 
 logger = get_logger(__name__)
 
-# Global flag for graceful shutdown
-_shutdown = False
+# Set on SIGINT/SIGTERM; workers running in this process are stopped directly
+_stop_event = threading.Event()
+_workers: List["ConsumerWorker"] = []
 
 
 def signal_handler(signum, frame):
     """Handle shutdown signals."""
-    global _shutdown
     logger.info("Shutdown signal received, stopping consumer...")
-    _shutdown = True
+    _stop_event.set()
+    for worker in _workers:
+        worker.request_stop()
 
 
 class ConsumerWorker:
@@ -47,6 +50,13 @@ class ConsumerWorker:
         self.event_handler: Optional[EventHandler] = None
         self._running = False
 
+        self._ack_batch_size = config.ack_batch_size
+        self._ack_flush_interval = config.ack_flush_interval_ms / 1000
+
+        # Event messages awaiting a batched apply: (method, properties, body, data)
+        self._event_buffer: List[Tuple[Any, Any, bytes, Dict[str, Any]]] = []
+        self._event_timer = None
+
     def start(self) -> None:
         """Start the consumer worker."""
         logger.info(f"Worker {self.worker_id}: Starting")
@@ -64,10 +74,23 @@ class ConsumerWorker:
         )
         self.connection.connect()
         
-        # Initialize consumer
+        # Initialize consumer (prefetch covers two ack batches so deliveries keep
+        # flowing while one batch is applied, instead of stalling on the timer)
+        prefetch = max(self.config.rabbitmq_prefetch_count, 2 * self._ack_batch_size)
+        if prefetch < 10:
+            logger.warning(
+                f"Worker {self.worker_id}: Low prefetch ({prefetch}), throughput will be RTT-bound"
+            )
+        if self.config.rabbitmq_prefetch_count < prefetch:
+            logger.warning(
+                f"Worker {self.worker_id}: RABBITMQ_PREFETCH_COUNT ({self.config.rabbitmq_prefetch_count}) "
+                f"< 2 * ACK_BATCH_SIZE ({self._ack_batch_size}), using {prefetch}"
+            )
         self.consumer = RabbitMQConsumer(
             self.connection,
-            prefetch_count=self.config.rabbitmq_prefetch_count,
+            prefetch_count=prefetch,
+            ack_batch_size=self._ack_batch_size,
+            ack_flush_interval=self._ack_flush_interval,
         )
         
         # Initialize event handler
@@ -82,7 +105,8 @@ class ConsumerWorker:
         
         # Start consuming (blocks until stopped)
         try:
-            self.consumer.start_consuming()
+            if not _stop_event.is_set():
+                self.consumer.start_consuming()
         except KeyboardInterrupt:
             logger.info(f"Worker {self.worker_id}: Interrupted")
         finally:
@@ -95,18 +119,99 @@ class ConsumerWorker:
         if self.consumer:
             self.consumer.stop_consuming()
         
+        try:
+            self._flush_events()
+            if self.consumer:
+                self.consumer.flush_acks()
+        except Exception as e:
+            logger.warning(f"Worker {self.worker_id}: Failed to flush pending acks: {e}")
+        
         if self.connection:
             self.connection.close()
         
+        if self.event_handler:
+            self.event_handler.close()
+        
         logger.info(
             f"Worker {self.worker_id}: Stopped. "
             f"Processed: {self.event_handler.events_processed if self.event_handler else 0}, "
             f"Failed: {self.event_handler.events_failed if self.event_handler else 0}"
         )
 
+    def request_stop(self) -> None:
+        """Ask the worker to stop consuming; safe to call from another thread."""
+        if self.connection and self.consumer:
+            self.connection.add_callback_threadsafe(self.consumer.stop_consuming)
+
+    def _on_event_timer(self) -> None:
+        """Flush a partial event batch so acknowledgement latency stays bounded."""
+        self._event_timer = None
+        self._flush_events()
+
+    def _flush_events(self) -> None:
+        """Apply buffered event messages in one transaction, then ack them.
+
+        If the batch fails as a whole, each message is retried on its own so
+        a single bad event gets the usual per-message retry/DLQ handling.
+        """
+        if self._event_timer is not None:
+            self.connection.remove_timeout(self._event_timer)
+            self._event_timer = None
+
+        buffer, self._event_buffer = self._event_buffer, []
+        if not buffer:
+            return
+
+        try:
+            self.event_handler.handle_event_batch([data for _, _, _, data in buffer])
+        except Exception as e:
+            logger.warning(
+                f"Worker {self.worker_id}: Batch of {len(buffer)} events failed, "
+                f"processing individually: {e}"
+            )
+            for method, properties, body, _ in buffer:
+                self._process_message(self.connection.channel, method, properties, body)
+            return
+
+        # Nothing older than the buffer is outstanding, so one multi-ack covers it
+        self.consumer.ack_up_to(buffer[-1][0].delivery_tag)
+
     def _on_message(self, channel, method, properties, body):
         """Handle incoming message.
-        
+
+        Event messages are buffered and applied together once an ack batch
+        fills (or the flush timer fires); other messages flush the buffer
+        first so rollbacks and reconciliation see every earlier event.
+
+        Args:
+            channel: RabbitMQ channel
+            method: Delivery method
+            properties: Message properties
+            body: Message body
+        """
+        if self._ack_batch_size > 1:
+            try:
+                data = json.loads(body)
+            except ValueError:
+                data = None
+
+            if isinstance(data, dict) and data.get("message_type") == "event":
+                self._event_buffer.append((method, properties, body, data))
+                if len(self._event_buffer) >= self._ack_batch_size:
+                    self._flush_events()
+                elif self._event_timer is None:
+                    self._event_timer = self.connection.call_later(
+                        self._ack_flush_interval, self._on_event_timer
+                    )
+                return
+
+            self._flush_events()
+
+        self._process_message(channel, method, properties, body)
+
+    def _process_message(self, channel, method, properties, body: bytes) -> None:
+        """Process a single message and settle it (ack, retry later or reject).
+
         Args:
             channel: RabbitMQ channel
             method: Delivery method
@@ -114,46 +219,76 @@ class ConsumerWorker:
             body: Message body
         """
         delivery_tag = method.delivery_tag
-        
+
         try:
             # Process message
             success = self.event_handler.handle_message(body, properties)
             
             if success:
-                # Acknowledge message
-                channel.basic_ack(delivery_tag=delivery_tag)
+                # Acknowledge message (batched)
+                self.consumer.maybe_ack(delivery_tag)
+                return
+            
+            # Processing failed, check retry count
+            retry_count = get_retry_count(properties)
+            if retry_count >= self.config.max_retries:
+                # Max retries exceeded, send to DLQ (reject without requeue)
+                logger.warning(
+                    f"Worker {self.worker_id}: Max retries exceeded, sending to DLQ"
+                )
+                # Settle earlier successes first so the multi-ack cannot cover this tag
+                self.consumer.flush_acks()
+                channel.basic_reject(delivery_tag=delivery_tag, requeue=False)
             else:
-                # Processing failed, check retry count
-                retry_count = get_retry_count(properties)
-                if retry_count >= self.config.max_retries:
-                    # Max retries exceeded, send to DLQ (reject without requeue)
-                    logger.warning(
-                        f"Worker {self.worker_id}: Max retries exceeded, sending to DLQ"
-                    )
-                    channel.basic_reject(delivery_tag=delivery_tag, requeue=False)
-                else:
-                    # Retry by rejecting with requeue
-                    channel.basic_nack(delivery_tag=delivery_tag, requeue=True)
+                self._retry_later(channel, method, properties, body, increment_retry_count(properties))
                     
-        except IntegrityError:
-            # Event already exists (duplicate) - acknowledge and skip
-            logger.debug(f"Worker {self.worker_id}: Duplicate event, acknowledging")
-            channel.basic_ack(delivery_tag=delivery_tag)
-            
         except TransientError as e:
-            # Transient error - requeue for retry
-            logger.warning(f"Worker {self.worker_id}: Transient error, requeuing: {e}")
-            channel.basic_nack(delivery_tag=delivery_tag, requeue=True)
-            time.sleep(1)  # Brief delay before processing next
+            # Transient error - retry after the delay without counting an attempt
+            logger.warning(f"Worker {self.worker_id}: Transient error, retrying later: {e}")
+            self._retry_later(channel, method, properties, body, dict(properties.headers or {}))
             
         except Exception as e:
             # Unexpected error
             logger.error(f"Worker {self.worker_id}: Unexpected error: {e}", exc_info=True)
             retry_count = get_retry_count(properties)
             if retry_count >= self.config.max_retries:
+                self.consumer.flush_acks()
                 channel.basic_reject(delivery_tag=delivery_tag, requeue=False)
             else:
-                channel.basic_nack(delivery_tag=delivery_tag, requeue=True)
+                self._retry_later(channel, method, properties, body, increment_retry_count(properties))
+
+    def _retry_later(self, channel, method, properties, body: bytes, headers: Dict[str, Any]) -> None:
+        """Hand a message to the delayed-retry queue and ack the original.
+
+        The broker holds the copy for RETRY_DELAY_MS and then routes it back
+        to its source queue, so the worker keeps consuming in the meantime.
+        Falls back to an immediate requeue if the copy cannot be published.
+
+        Args:
+            channel: RabbitMQ channel
+            method: Delivery method
+            properties: Message properties
+            body: Message body
+            headers: Headers for the retried copy
+        """
+        try:
+            channel.basic_publish(
+                exchange=RETRY_EXCHANGE_NAME,
+                routing_key=method.routing_key,
+                body=body,
+                properties=pika.BasicProperties(
+                    content_type=properties.content_type,
+                    delivery_mode=2,  # Persistent
+                    headers=headers,
+                ),
+            )
+        except Exception as e:
+            logger.warning(f"Worker {self.worker_id}: Failed to publish retry, requeuing: {e}")
+            self.consumer.flush_acks()
+            channel.basic_nack(delivery_tag=method.delivery_tag, requeue=True)
+            return
+
+        self.consumer.maybe_ack(method.delivery_tag)
 
 
 def run_worker(config: Config, worker_id: int) -> None:
@@ -171,29 +306,100 @@ def run_worker(config: Config, worker_id: int) -> None:
     signal.signal(signal.SIGTERM, signal_handler)
     
     worker = ConsumerWorker(config, worker_id)
-    worker.start()
+    _workers.append(worker)
+    try:
+        worker.start()
+    finally:
+        shutdown_logging()
+
+
+def run_threaded_workers(config: Config, num_workers: int) -> None:
+    """Run blocking consumer workers as threads in this process.
+
+    Each thread owns its pika connection (BlockingConnection is not thread
+    safe); all threads share the process's database connection pool.
+
+    Args:
+        config: Configuration object
+        num_workers: Number of worker threads
+    """
+    workers = [ConsumerWorker(config, i) for i in range(num_workers)]
+    _workers.extend(workers)
+    threads = []
+
+    for worker in workers:
+        t = threading.Thread(
+            target=worker.start,
+            name=f"consumer-{worker.worker_id}",
+            daemon=True,
+        )
+        t.start()
+        threads.append(t)
+        logger.info(f"Started worker thread {worker.worker_id}")
+
+    # Signals are delivered to the main thread; the handler stops every worker
+    while any(t.is_alive() for t in threads):
+        if _stop_event.wait(0.5):
+            break
+
+    logger.info("Shutting down workers...")
+    for worker in workers:
+        worker.request_stop()
+    for t in threads:
+        t.join(timeout=5)
+
+
+def _get_process_context() -> multiprocessing.context.BaseContext:
+    """Get the multiprocessing context for worker processes.
+
+    forkserver forks workers from a small template process (with the heavy
+    libraries preloaded) instead of from this process's heap, so workers start
+    faster and do not inherit sockets or copy-on-write pages from the parent.
+    Falls back to spawn where forkserver is unavailable (Windows).
+
+    Returns:
+        Multiprocessing context
+    """
+    if "forkserver" not in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("spawn")
+
+    ctx = multiprocessing.get_context("forkserver")
+    ctx.set_forkserver_preload(["sqlalchemy", "pika", "pydantic", "db.models", "consumer.event_handler"])
+    return ctx
+
 
+def run_consumer(config: Config, num_workers: int = None, mode: str = None) -> None:
+    """Run the consumer.
 
-def run_consumer(config: Config, num_workers: int = None) -> None:
-    """Run the consumer with multiple workers.
+    Modes:
+        async: asyncio workers on one event loop (aio-pika)
+        thread: blocking pika workers as threads in one process
+        process: blocking pika workers, one process each
 
     Args:
         config: Configuration object
-        num_workers: Number of worker processes (default: from config)
+        num_workers: Number of workers (default: from config)
+        mode: Concurrency mode (default: from config)
     """
+    mode = mode or config.consumer_mode
     num_workers = num_workers or config.consumer_workers
-    logger.info(f"Starting consumer with {num_workers} workers")
+    logger.info(f"Starting consumer with {num_workers} workers (mode={mode})")
     logger.info(f"RabbitMQ: {config.rabbitmq_host}:{config.rabbitmq_port}")
 
-    if num_workers == 1:
+    if mode == "async":
+        run_async(config, num_workers)
+    elif mode == "thread":
+        run_threaded_workers(config, num_workers)
+    elif num_workers == 1:
         # Single worker - run in main process
         run_worker(config, 0)
     else:
         # Multiple workers - use multiprocessing
+        ctx = _get_process_context()
         processes = []
         
         for i in range(num_workers):
-            p = multiprocessing.Process(
+            p = ctx.Process(
                 target=run_worker,
                 args=(config, i),
             )
@@ -257,17 +463,17 @@ def show_status(config: Config) -> None:
         sys.exit(1)
 
 
-def main(command: str, workers: int = None) -> None:
+def main(command: str, workers: int = None, mode: str = None) -> None:
     """Main entry point for consumer.
 
     Args:
         command: Command to run (run, status)
-        workers: Number of worker processes
+        workers: Number of workers
+        mode: Concurrency mode (async, thread, process)
     """
     # Load config
     try:
         config = Config.from_env()
-        config.validate()
     except Exception as e:
         print(f"Configuration error: {e}", file=sys.stderr)
         sys.exit(1)
@@ -291,7 +497,7 @@ def main(command: str, workers: int = None) -> None:
     # Execute command
     try:
         if command == "run":
-            run_consumer(config, workers)
+            run_consumer(config, workers, mode)
         elif command == "status":
             show_status(config)
         else:
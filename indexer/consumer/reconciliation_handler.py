@@ -2,6 +2,7 @@
 
 from datetime import datetime, timezone
 
+from sqlalchemy import update
 from sqlalchemy.orm import Session
 
 from db.models import Campaign
@@ -51,29 +52,25 @@ class ReconciliationHandler:
         now = datetime.now(timezone.utc)
         now_timestamp = int(now.timestamp())
 
-        # Find expired campaigns
-        expired_campaigns = (
-            session.query(Campaign)
-            .filter(
+        # Single set-based UPDATE; uses the partial index on ACTIVE deadlines
+        stmt = (
+            update(Campaign)
+            .where(
                 Campaign.status == "ACTIVE",
                 Campaign.deadline_ts < now_timestamp,
                 Campaign.withdrawn == False,
+                Campaign.total_raised_wei < Campaign.goal_wei,
             )
-            .all()
+            .values(status="FAILED")
+            .returning(Campaign.address)
+            .execution_options(synchronize_session=False)
         )
+        marked = session.execute(stmt).scalars().all()
 
-        marked_count = 0
-        for campaign in expired_campaigns:
-            # Check if goal was not met
-            if campaign.total_raised_wei < campaign.goal_wei:
-                campaign.status = "FAILED"
-                marked_count += 1
-                logger.info(
-                    f"Marked campaign {campaign.address} as FAILED "
-                    f"(raised {campaign.total_raised_wei} < goal {campaign.goal_wei})"
-                )
+        for address in marked:
+            logger.info(f"Marked campaign {address} as FAILED (deadline passed, goal not met)")
 
-        if marked_count > 0:
-            logger.info(f"Marked {marked_count} expired campaigns as FAILED")
+        if marked:
+            logger.info(f"Marked {len(marked)} expired campaigns as FAILED")
         else:
             logger.debug("No expired campaigns to mark as FAILED")
@@ -1,17 +1,20 @@
 """Rollback handler for consumer - handles blockchain reorganizations."""
 
-import json
-from typing import Dict, Any
+from typing import Set
 
+from sqlalchemy import case, select
 from sqlalchemy.orm import Session
 
+from db import bulk
 from db.models import Campaign, Contribution, Event
-from db.session import get_session
 from log import get_logger
 from consumer.state_updater import ConsumerStateUpdater
 
 logger = get_logger(__name__)
 
+# Events loaded and applied per aggregated batch during state rebuild
+REPLAY_WINDOW_SIZE = 1000
+
 
 class RollbackHandler:
     """Handles rollback messages for blockchain reorganizations."""
@@ -42,105 +45,85 @@ class RollbackHandler:
         """
         logger.warning(f"Handling rollback: blocks {from_block} to {to_block}, reason: {reason}")
 
-        # Mark affected events as removed
-        affected_events = (
-            session.query(Event)
-            .filter(
-                Event.chain_id == self.chain_id,
-                Event.block_number >= from_block,
-                Event.block_number <= to_block,
-                Event.removed == False,
-            )
-            .all()
+        # Mark affected events as removed (single UPDATE), noting whose they were
+        removed_count, affected_campaigns = bulk.mark_events_removed(
+            session, self.chain_id, from_block, to_block
         )
 
-        for event in affected_events:
-            event.removed = True
-            logger.debug(f"Marked event as removed: {event.tx_hash}:{event.log_index}")
-
-        logger.info(f"Marked {len(affected_events)} events as removed")
+        logger.info(f"Marked {removed_count} events as removed")
 
         # Rebuild state
-        self._rebuild_state(session, from_block, to_block)
+        self.rebuild_state(session, affected_campaigns)
+
+    def rebuild_state(self, session: Session, campaign_addresses: Set[str]) -> None:
+        """Rebuild campaign and contribution state from the surviving events.
 
-    def _rebuild_state(self, session: Session, from_block: int, to_block: int) -> None:
-        """Rebuild state by replaying events in the range.
+        The campaigns' totals and contributions are reset, then every event
+        of theirs not marked removed is replayed, from any block: state
+        before the rolled-back range is part of the result too.
 
         Args:
             session: Database session
-            from_block: Starting block
-            to_block: Ending block
+            campaign_addresses: Addresses whose events were removed (lowercase)
         """
-        logger.info(f"Rebuilding state for blocks {from_block} to {to_block}")
-
-        # Get all non-removed events in range, ordered by block and log index
-        events = (
-            session.query(Event)
-            .filter(
-                Event.chain_id == self.chain_id,
-                Event.block_number >= from_block,
-                Event.block_number <= to_block,
-                Event.removed == False,
-            )
-            .order_by(Event.block_number, Event.log_index)
-            .all()
-        )
-
-        if not events:
-            logger.info("No events to replay")
+        if not campaign_addresses:
+            logger.info("No campaigns affected, nothing to rebuild")
             return
 
-        logger.info(f"Replaying {len(events)} events")
+        logger.info(f"Rebuilding state for {len(campaign_addresses)} campaigns")
+
+        # Reset campaign state for affected campaigns (rebuilt by replaying events)
+        session.query(Campaign).filter(Campaign.address.in_(campaign_addresses)).update(
+            {
+                Campaign.total_raised_wei: 0,
+                Campaign.withdrawn: False,
+                Campaign.withdrawn_amount_wei: None,
+                Campaign.status: case(
+                    (Campaign.status == "WITHDRAWN", Campaign.status),
+                    else_="ACTIVE",
+                ),
+            },
+            synchronize_session=False,
+        )
 
-        # Get affected campaign addresses
-        affected_campaigns = {e.address.lower() for e in events if e.address}
+        # Reset contributions for affected campaigns
+        session.query(Contribution).filter(
+            Contribution.campaign_address.in_(campaign_addresses)
+        ).update(
+            {Contribution.contributed_wei: 0, Contribution.refunded_wei: 0},
+            synchronize_session=False,
+        )
 
-        # Reset campaign state for affected campaigns
-        for campaign_address in affected_campaigns:
-            campaign = (
-                session.query(Campaign)
-                .filter(Campaign.address == campaign_address)
-                .first()
+        # Replay surviving events in order, streaming one window at a time
+        result = session.execute(
+            select(Event.event_name, Event.event_data)
+            .where(
+                Event.chain_id == self.chain_id,
+                Event.address.in_(campaign_addresses),
+                Event.removed == False,
             )
-            if campaign:
-                # Reset to initial state (will be rebuilt by replaying events)
-                campaign.total_raised_wei = 0
-                campaign.withdrawn = False
-                campaign.withdrawn_amount_wei = None
-                if campaign.status not in ["WITHDRAWN"]:
-                    campaign.status = "ACTIVE"
-
-        # Reset contributions for affected campaigns
-        contributions = (
-            session.query(Contribution)
-            .filter(Contribution.campaign_address.in_(affected_campaigns))
-            .all()
+            .order_by(Event.block_number, Event.log_index)
+            .execution_options(yield_per=REPLAY_WINDOW_SIZE)
         )
-        for contribution in contributions:
-            contribution.contributed_wei = 0
-            contribution.refunded_wei = 0
 
-        # Replay events in order
-        for event in events:
-            try:
-                # Parse event data
-                event_data = json.loads(event.event_data) if event.event_data else {}
+        replayed = 0
+        for rows in result.partitions():
+            replay = []
+            for event_name, event_data in rows:
+                event_data = event_data or {}
 
                 # For messages, event_data contains the args directly
                 # Check if it has "args" key (old format) or not (new message format)
-                if "args" in event_data:
+                if isinstance(event_data, dict) and "args" in event_data:
                     args = event_data["args"]
                 else:
                     args = event_data
 
-                # Apply state update
-                self.state_updater.apply_event(
-                    session=session,
-                    event_type=event.event_name,
-                    event_data=args,
-                )
+                replay.append((event_name, args))
 
-            except Exception as e:
-                logger.error(f"Error replaying event {event.tx_hash}:{event.log_index}: {e}")
+            # Deltas are additive and totals last-wins, so windows apply independently
+            self.state_updater.apply_event_batch(session, replay)
+            replayed += len(replay)
 
+        logger.info(f"Replayed {replayed} events")
         logger.info("State rebuild complete")
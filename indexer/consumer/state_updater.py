@@ -1,17 +1,76 @@
 """State updater for consumer - applies event-driven state changes to database."""
 
-import json
-from typing import Any, Dict
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, List, Set, Tuple
 
+from sqlalchemy import and_, bindparam, case, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
+from db import bulk
 from db.models import Campaign, Contribution, Event
+from eth.address import canonical_address
 from log import get_logger
 
 logger = get_logger(__name__)
 
 
+@dataclass
+class AggregatedEvents:
+    """Net effect of a sequence of events, collapsed per campaign/contribution."""
+
+    created: List[Dict[str, Any]] = field(default_factory=list)
+    contrib_deltas: Dict[Tuple[str, str], int] = field(default_factory=dict)
+    campaign_totals: Dict[str, int] = field(default_factory=dict)
+    campaign_peaks: Dict[str, int] = field(default_factory=dict)
+    withdrawn: Dict[str, int] = field(default_factory=dict)
+    refunds: Dict[Tuple[str, str], int] = field(default_factory=dict)
+
+
+def _aggregate_events(events: List[Tuple[str, Dict[str, Any]]]) -> AggregatedEvents:
+    """Collapse ordered events into per-row deltas and final values.
+
+    Args:
+        events: (event_type, event_data) pairs, in block/log order
+
+    Returns:
+        AggregatedEvents with summed amounts and last/peak totals
+    """
+    agg = AggregatedEvents()
+
+    # Hot during large rollbacks: bind lookups to locals once
+    contrib_deltas = agg.contrib_deltas
+    campaign_totals = agg.campaign_totals
+    campaign_peaks = agg.campaign_peaks
+    refunds = agg.refunds
+
+    for event_type, event_data in events:
+        if event_type == "CampaignCreated":
+            agg.created.append(event_data)
+            continue
+
+        campaign_address = canonical_address(str(event_data.get("campaign", "")))
+
+        if event_type == "DonationReceived":
+            key = (campaign_address, canonical_address(str(event_data.get("donor", ""))))
+            new_total_raised = int(event_data.get("newTotalRaised", 0))
+            contrib_deltas[key] = contrib_deltas.get(key, 0) + int(event_data.get("amount", 0))
+            campaign_totals[campaign_address] = new_total_raised
+            if new_total_raised >= campaign_peaks.get(campaign_address, 0):
+                campaign_peaks[campaign_address] = new_total_raised
+        elif event_type == "Withdrawn":
+            agg.withdrawn[campaign_address] = int(event_data.get("amount", 0))
+        elif event_type == "Refunded":
+            key = (campaign_address, canonical_address(str(event_data.get("donor", ""))))
+            refunds[key] = refunds.get(key, 0) + int(event_data.get("amount", 0))
+        else:
+            logger.warning(f"Unknown event type: {event_type}")
+
+    return agg
+
+
 class ConsumerStateUpdater:
     """Handles state updates from consumed event messages."""
 
@@ -22,6 +81,12 @@ class ConsumerStateUpdater:
             chain_id: Chain ID for events
         """
         self.chain_id = chain_id
+        self._dispatch = {
+            "CampaignCreated": self.apply_campaign_created,
+            "DonationReceived": self.apply_donation_received,
+            "Withdrawn": self.apply_withdrawn,
+            "Refunded": self.apply_refunded,
+        }
 
     def insert_event(
         self,
@@ -34,7 +99,7 @@ class ConsumerStateUpdater:
         event_name: str,
         event_data: Dict[str, Any],
     ) -> bool:
-        """Insert event into database (idempotent).
+        """Insert event into database (idempotent via ON CONFLICT DO NOTHING).
 
         Args:
             session: Database session
@@ -49,23 +114,9 @@ class ConsumerStateUpdater:
         Returns:
             True if event was inserted, False if it already existed (idempotent)
         """
-        # Check if event already exists (avoid rollback issues)
-        existing = (
-            session.query(Event)
-            .filter(
-                Event.chain_id == self.chain_id,
-                Event.tx_hash == tx_hash,
-                Event.log_index == log_index,
-            )
-            .first()
-        )
-        
-        if existing:
-            logger.debug(f"Event already exists: {tx_hash}:{log_index}")
-            return False
-        
-        try:
-            event = Event(
+        stmt = (
+            pg_insert(Event)
+            .values(
                 chain_id=self.chain_id,
                 tx_hash=tx_hash,
                 log_index=log_index,
@@ -73,22 +124,19 @@ class ConsumerStateUpdater:
                 block_hash=block_hash,
                 address=address,
                 event_name=event_name,
-                event_data=json.dumps(event_data),
+                event_data=event_data,
                 removed=False,
             )
-            session.add(event)
-            session.flush()  # Flush to trigger constraint checks
-            return True
+            .on_conflict_do_nothing(index_elements=["chain_id", "tx_hash", "log_index"])
+        )
+
+        try:
+            result = session.execute(stmt)
         except IntegrityError as e:
+            # Duplicates never raise here (ON CONFLICT), so this is a FK or other violation
             session.rollback()
             error_str = str(e.orig) if e.orig else str(e)
             
-            # Check what kind of constraint violation it is
-            if "uq_events_chain_tx_log" in error_str.lower() or "duplicate key" in error_str.lower():
-                # Duplicate event (race condition with another worker)
-                logger.debug(f"Event already exists (race condition): {tx_hash}:{log_index}")
-                return False
-            
             # Foreign key violation - determine which one
             if "events_chain_id_fkey" in error_str.lower() or "chains" in error_str.lower():
                 logger.error(
@@ -117,6 +165,30 @@ class ConsumerStateUpdater:
             logger.error(f"Integrity error inserting event: {error_str}")
             raise
 
+        if result.rowcount != 1:
+            logger.debug("Event already exists: %s:%s", tx_hash, log_index)
+            return False
+        return True
+
+    def insert_events(
+        self,
+        session: Session,
+        rows: List[Dict[str, Any]],
+    ) -> Set[Tuple[str, int]]:
+        """Insert many events with multi-row INSERT ... ON CONFLICT DO NOTHING.
+
+        Args:
+            session: Database session
+            rows: Dicts with tx_hash, log_index, block_number, block_hash,
+                address, event_name and event_data
+
+        Returns:
+            (tx_hash, log_index) of the events that were newly inserted
+        """
+        return bulk.insert_events(
+            session, [{**row, "chain_id": self.chain_id, "removed": False} for row in rows]
+        )
+
     def apply_campaign_created(
         self,
         session: Session,
@@ -128,40 +200,45 @@ class ConsumerStateUpdater:
             session: Database session
             event_data: Decoded event data (the event_data field from message)
         """
-        campaign_address = str(event_data.get("campaign", "")).lower()
-        factory_address = str(event_data.get("factory", "")).lower()
-        creator_address = str(event_data.get("creator", "")).lower()
+        campaign_address = canonical_address(str(event_data.get("campaign", "")))
+        factory_address = canonical_address(str(event_data.get("factory", "")))
+        creator_address = canonical_address(str(event_data.get("creator", "")))
         goal_wei = int(event_data.get("goal", 0))
         deadline_ts = int(event_data.get("deadline", 0))
         cid = event_data.get("cid", "")
 
-        # Insert/update campaign
-        campaign = session.query(Campaign).filter(Campaign.address == campaign_address).first()
-
-        if campaign is None:
-            campaign = Campaign(
-                address=campaign_address,
-                factory_address=factory_address,
-                creator_address=creator_address,
-                goal_wei=goal_wei,
-                deadline_ts=deadline_ts,
-                cid=cid,
-                status="ACTIVE",
-                total_raised_wei=0,
-                withdrawn=False,
-            )
-            session.add(campaign)
-            logger.info(f"Created campaign: {campaign_address}")
-        else:
-            # Update existing campaign (shouldn't happen, but handle gracefully)
-            logger.debug(f"Campaign already exists: {campaign_address}, updating")
-            campaign.factory_address = factory_address
-            campaign.creator_address = creator_address
-            campaign.goal_wei = goal_wei
-            campaign.deadline_ts = deadline_ts
-            campaign.cid = cid
-            if campaign.status not in ["SUCCESS", "WITHDRAWN"]:
-                campaign.status = "ACTIVE"
+        # Upsert campaign; a replayed CampaignCreated must not regress a terminal status
+        now = datetime.utcnow()
+        stmt = pg_insert(Campaign).values(
+            address=campaign_address,
+            factory_address=factory_address,
+            creator_address=creator_address,
+            goal_wei=goal_wei,
+            deadline_ts=deadline_ts,
+            cid=cid,
+            status="ACTIVE",
+            total_raised_wei=0,
+            withdrawn=False,
+            created_at=now,
+            updated_at=now,
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[Campaign.address],
+            set_={
+                "factory_address": stmt.excluded.factory_address,
+                "creator_address": stmt.excluded.creator_address,
+                "goal_wei": stmt.excluded.goal_wei,
+                "deadline_ts": stmt.excluded.deadline_ts,
+                "cid": stmt.excluded.cid,
+                "status": case(
+                    (Campaign.status.in_(["SUCCESS", "WITHDRAWN"]), Campaign.status),
+                    else_="ACTIVE",
+                ),
+                "updated_at": now,
+            },
+        )
+        session.execute(stmt)
+        logger.info(f"Upserted campaign: {campaign_address}")
 
     def apply_donation_received(
         self,
@@ -174,45 +251,57 @@ class ConsumerStateUpdater:
             session: Database session
             event_data: Decoded event data
         """
-        campaign_address = str(event_data.get("campaign", "")).lower()
-        donor_address = str(event_data.get("donor", "")).lower()
+        campaign_address = canonical_address(str(event_data.get("campaign", "")))
+        donor_address = canonical_address(str(event_data.get("donor", "")))
         amount = int(event_data.get("amount", 0))
         new_total_raised = int(event_data.get("newTotalRaised", 0))
 
-        # Get or create campaign
-        campaign = session.query(Campaign).filter(Campaign.address == campaign_address).first()
-        if campaign is None:
+        campaigns = Campaign.__table__
+        contributions = Contribution.__table__
+        now = datetime.utcnow()
+
+        # Update campaign totals, raising ACTIVE to SUCCESS once the goal is met
+        campaign_row = session.execute(
+            update(campaigns)
+            .where(campaigns.c.address == campaign_address)
+            .values(
+                total_raised_wei=new_total_raised,
+                status=case(
+                    (
+                        and_(campaigns.c.status == "ACTIVE", campaigns.c.goal_wei <= new_total_raised),
+                        "SUCCESS",
+                    ),
+                    else_=campaigns.c.status,
+                ),
+                updated_at=now,
+            )
+            .returning(campaigns.c.status, campaigns.c.goal_wei)
+        ).first()
+        if campaign_row is None:
             logger.warning(f"Campaign not found for donation: {campaign_address}")
             return
 
-        # Upsert contribution
-        contribution = (
-            session.query(Contribution)
-            .filter(
-                Contribution.campaign_address == campaign_address,
-                Contribution.donor_address == donor_address,
-            )
-            .first()
+        # Upsert contribution, adding the amount in the database
+        stmt = pg_insert(contributions).values(
+            campaign_address=campaign_address,
+            donor_address=donor_address,
+            contributed_wei=amount,
+            refunded_wei=0,
+            created_at=now,
+            updated_at=now,
         )
-
-        if contribution is None:
-            contribution = Contribution(
-                campaign_address=campaign_address,
-                donor_address=donor_address,
-                contributed_wei=amount,
-                refunded_wei=0,
+        session.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[contributions.c.campaign_address, contributions.c.donor_address],
+                set_={
+                    "contributed_wei": contributions.c.contributed_wei + stmt.excluded.contributed_wei,
+                    "updated_at": now,
+                },
             )
-            session.add(contribution)
-        else:
-            contribution.contributed_wei += amount
-
-        # Update campaign totals
-        campaign.total_raised_wei = new_total_raised
+        )
 
-        # Update status if goal met
-        if new_total_raised >= campaign.goal_wei and campaign.status == "ACTIVE":
-            campaign.status = "SUCCESS"
-            logger.info(f"Campaign {campaign_address} reached goal: {new_total_raised} >= {campaign.goal_wei}")
+        if campaign_row.status == "SUCCESS" and new_total_raised >= campaign_row.goal_wei:
+            logger.info(f"Campaign {campaign_address} reached goal: {new_total_raised} >= {campaign_row.goal_wei}")
 
     def apply_withdrawn(
         self,
@@ -225,11 +314,11 @@ class ConsumerStateUpdater:
             session: Database session
             event_data: Decoded event data
         """
-        campaign_address = str(event_data.get("campaign", "")).lower()
+        campaign_address = canonical_address(str(event_data.get("campaign", "")))
         amount = int(event_data.get("amount", 0))
 
         # Get campaign
-        campaign = session.query(Campaign).filter(Campaign.address == campaign_address).first()
+        campaign = session.get(Campaign, campaign_address)
         if campaign is None:
             logger.warning(f"Campaign not found for withdrawal: {campaign_address}")
             return
@@ -251,8 +340,8 @@ class ConsumerStateUpdater:
             session: Database session
             event_data: Decoded event data
         """
-        campaign_address = str(event_data.get("campaign", "")).lower()
-        donor_address = str(event_data.get("donor", "")).lower()
+        campaign_address = canonical_address(str(event_data.get("campaign", "")))
+        donor_address = canonical_address(str(event_data.get("donor", "")))
         amount = int(event_data.get("amount", 0))
 
         # Get contribution
@@ -273,7 +362,7 @@ class ConsumerStateUpdater:
 
         # Update refunded amount (keep contributed_wei as lifetime total)
         contribution.refunded_wei += amount
-        logger.debug(f"Refunded {amount} wei to {donor_address} for campaign {campaign_address}")
+        logger.debug("Refunded %s wei to %s for campaign %s", amount, donor_address, campaign_address)
 
     def apply_event(
         self,
@@ -288,13 +377,130 @@ class ConsumerStateUpdater:
             event_type: Event type (CampaignCreated, DonationReceived, etc.)
             event_data: Decoded event data
         """
-        if event_type == "CampaignCreated":
-            self.apply_campaign_created(session, event_data)
-        elif event_type == "DonationReceived":
-            self.apply_donation_received(session, event_data)
-        elif event_type == "Withdrawn":
-            self.apply_withdrawn(session, event_data)
-        elif event_type == "Refunded":
-            self.apply_refunded(session, event_data)
-        else:
+        handler = self._dispatch.get(event_type)
+        if handler is None:
             logger.warning(f"Unknown event type: {event_type}")
+            return
+        handler(session, event_data)
+
+    def apply_event_batch(
+        self,
+        session: Session,
+        events: List[Tuple[str, Dict[str, Any]]],
+    ) -> None:
+        """Apply state updates for a batch of events as aggregated SQL.
+
+        Instead of per-event SELECT/UPDATE, amounts are summed per
+        (campaign, donor) and final totals taken per campaign, then written
+        with one executemany statement per kind of change. The end state
+        matches applying the events one by one in order.
+
+        Args:
+            session: Database session
+            events: (event_type, event_data) pairs, in block/log order
+        """
+        agg = _aggregate_events(events)
+
+        # Campaign creation must land before anything that references it
+        for event_data in agg.created:
+            self.apply_campaign_created(session, event_data)
+
+        touched = set(agg.campaign_totals) | set(agg.withdrawn) | {c for c, _ in agg.contrib_deltas}
+        existing = set()
+        if touched:
+            existing = set(
+                session.scalars(select(Campaign.address).where(Campaign.address.in_(touched)))
+            )
+            for campaign_address in touched - existing:
+                logger.warning(f"Campaign not found for batched events: {campaign_address}")
+
+        campaigns = Campaign.__table__
+        contributions = Contribution.__table__
+        now = datetime.utcnow()
+
+        contrib_rows = [
+            {
+                "campaign_address": campaign_address,
+                "donor_address": donor_address,
+                "contributed_wei": delta,
+                "refunded_wei": 0,
+                "created_at": now,
+                "updated_at": now,
+            }
+            for (campaign_address, donor_address), delta in agg.contrib_deltas.items()
+            if campaign_address in existing
+        ]
+        if contrib_rows:
+            stmt = pg_insert(contributions)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[contributions.c.campaign_address, contributions.c.donor_address],
+                set_={
+                    "contributed_wei": contributions.c.contributed_wei + stmt.excluded.contributed_wei,
+                    "updated_at": now,
+                },
+            )
+            session.execute(stmt, contrib_rows)
+
+        total_rows = [
+            {"b_address": address, "b_total": total, "b_peak": agg.campaign_peaks[address]}
+            for address, total in agg.campaign_totals.items()
+            if address in existing
+        ]
+        if total_rows:
+            session.execute(
+                update(campaigns)
+                .where(campaigns.c.address == bindparam("b_address"))
+                .values(
+                    total_raised_wei=bindparam("b_total"),
+                    status=case(
+                        (
+                            and_(campaigns.c.status == "ACTIVE", campaigns.c.goal_wei <= bindparam("b_peak")),
+                            "SUCCESS",
+                        ),
+                        else_=campaigns.c.status,
+                    ),
+                    updated_at=now,
+                ),
+                total_rows,
+            )
+
+        withdrawn_rows = [
+            {"b_address": address, "b_amount": amount}
+            for address, amount in agg.withdrawn.items()
+            if address in existing
+        ]
+        if withdrawn_rows:
+            session.execute(
+                update(campaigns)
+                .where(campaigns.c.address == bindparam("b_address"))
+                .values(
+                    withdrawn=True,
+                    withdrawn_amount_wei=bindparam("b_amount"),
+                    status="WITHDRAWN",
+                    updated_at=now,
+                ),
+                withdrawn_rows,
+            )
+
+        refund_rows = [
+            {"b_campaign": campaign_address, "b_donor": donor_address, "b_amount": amount}
+            for (campaign_address, donor_address), amount in agg.refunds.items()
+        ]
+        if refund_rows:
+            session.execute(
+                update(contributions)
+                .where(
+                    contributions.c.campaign_address == bindparam("b_campaign"),
+                    contributions.c.donor_address == bindparam("b_donor"),
+                )
+                .values(
+                    refunded_wei=contributions.c.refunded_wei + bindparam("b_amount"),
+                    updated_at=now,
+                ),
+                refund_rows,
+            )
+
+        logger.info(
+            f"Applied {len(events)} events as {len(contrib_rows)} contribution upserts, "
+            f"{len(total_rows) + len(withdrawn_rows)} campaign updates, {len(refund_rows)} refunds"
+        )
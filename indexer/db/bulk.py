@@ -0,0 +1,89 @@
+"""Bulk write helpers that bypass the ORM unit of work."""
+
+import logging
+from typing import Any, Dict, List, Set, Tuple
+
+from sqlalchemy import update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+
+from db.models import Event
+from log import get_logger
+
+logger = get_logger(__name__)
+
+# Rows per INSERT statement (keeps bind parameters well under Postgres' 65535 limit)
+BULK_CHUNK_SIZE = 500
+
+
+def insert_events(
+    session: Session,
+    rows: List[Dict[str, Any]],
+    chunk_size: int = BULK_CHUNK_SIZE,
+) -> Set[Tuple[str, int]]:
+    """Insert events with multi-row INSERT ... ON CONFLICT DO NOTHING.
+
+    Args:
+        session: Database session
+        rows: Event column dicts (chain_id, tx_hash, log_index, block_number,
+            block_hash, address, event_name, event_data, removed)
+        chunk_size: Rows per statement
+
+    Returns:
+        (tx_hash, log_index) of the events that were newly inserted
+    """
+    inserted: Set[Tuple[str, int]] = set()
+
+    for start in range(0, len(rows), chunk_size):
+        stmt = (
+            pg_insert(Event)
+            .values(rows[start : start + chunk_size])
+            .on_conflict_do_nothing(index_elements=["chain_id", "tx_hash", "log_index"])
+            .returning(Event.tx_hash, Event.log_index)
+        )
+        inserted.update((tx_hash, log_index) for tx_hash, log_index in session.execute(stmt))
+
+    return inserted
+
+
+def mark_events_removed(
+    session: Session,
+    chain_id: int,
+    from_block: int,
+    to_block: int,
+) -> Tuple[int, Set[str]]:
+    """Mark live events in a block range as removed with one UPDATE.
+
+    Events are not loaded; RETURNING brings back each event's address (plus
+    tx hash and log index when DEBUG logging lists the removed events), so
+    callers can rebuild the affected campaigns after the events are gone.
+
+    Args:
+        session: Database session
+        chain_id: Chain ID
+        from_block: Starting block (inclusive)
+        to_block: Ending block (inclusive)
+
+    Returns:
+        (number of events marked as removed, addresses of those events)
+    """
+    stmt = (
+        update(Event)
+        .where(
+            Event.chain_id == chain_id,
+            Event.block_number >= from_block,
+            Event.block_number <= to_block,
+            Event.removed == False,
+        )
+        .values(removed=True)
+        .execution_options(synchronize_session=False)
+    )
+
+    if logger.isEnabledFor(logging.DEBUG):
+        removed = session.execute(stmt.returning(Event.address, Event.tx_hash, Event.log_index)).all()
+        for _, tx_hash, log_index in removed:
+            logger.debug("Marked event as removed: %s:%s", tx_hash, log_index)
+    else:
+        removed = session.execute(stmt.returning(Event.address)).all()
+
+    return len(removed), {row[0] for row in removed if row[0]}
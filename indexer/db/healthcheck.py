@@ -1,9 +1,11 @@
 """Database health check - verify required tables exist."""
 
-from sqlalchemy import text
-from sqlalchemy.exc import ProgrammingError
+import time
+from typing import Dict
 
-from db.session import get_engine, get_session
+from sqlalchemy import select, text
+
+from db.session import get_engine, get_readonly_session
 from log import get_logger
 
 logger = get_logger(__name__)
@@ -17,6 +19,13 @@ REQUIRED_TABLES = [
     "events",
 ]
 
+# Positive results are cached for this long; failures are never cached, so a
+# fixed schema or newly inserted chain is picked up on the next check
+SCHEMA_CHECK_TTL_SECONDS = 300
+
+_schema_ok_until = 0.0
+_chain_ok_until: Dict[int, float] = {}
+
 
 def check_tables_exist() -> None:
     """Verify all required tables exist in the database.
@@ -24,24 +33,30 @@ def check_tables_exist() -> None:
     Raises:
         RuntimeError: If any required table is missing
     """
+    global _schema_ok_until
+
+    if time.monotonic() < _schema_ok_until:
+        return
+
     logger.info("Checking database schema...")
 
-    with get_session() as session:
-        for table_name in REQUIRED_TABLES:
-            try:
-                # Try to query the table (will fail if table doesn't exist)
-                session.execute(text(f"SELECT 1 FROM {table_name} LIMIT 1"))
-                logger.debug(f"Table '{table_name}' exists")
-            except ProgrammingError as e:
-                error_msg = str(e).lower()
-                if "does not exist" in error_msg or "relation" in error_msg:
-                    raise RuntimeError(
-                        f"DB schema missing. Table '{table_name}' does not exist. "
-                        "Run backend migrations first."
-                    ) from e
-                # Re-raise if it's a different error
-                raise
+    # to_regclass is a catalog lookup that honours search_path, never a table scan
+    with get_readonly_session() as session:
+        missing = session.execute(
+            text(
+                "SELECT name FROM unnest(CAST(:names AS text[])) WITH ORDINALITY AS t(name, n) "
+                "WHERE to_regclass(name) IS NULL ORDER BY n"
+            ),
+            {"names": REQUIRED_TABLES},
+        ).scalars().all()
+
+    if missing:
+        raise RuntimeError(
+            f"DB schema missing. Tables do not exist: {', '.join(missing)}. "
+            "Run backend migrations first."
+        )
 
+    _schema_ok_until = time.monotonic() + SCHEMA_CHECK_TTL_SECONDS
     logger.info("All required tables exist")
 
 
@@ -56,7 +71,15 @@ def check_chain_exists(chain_id: int) -> bool:
     """
     from db.models import Chain
 
-    with get_session() as session:
-        chain = session.query(Chain).filter(Chain.chain_id == chain_id).first()
-        return chain is not None
+    if time.monotonic() < _chain_ok_until.get(chain_id, 0.0):
+        return True
+
+    # Column-only select: no Chain instance or identity map entry
+    with get_readonly_session() as session:
+        found = session.scalar(select(Chain.chain_id).where(Chain.chain_id == chain_id).limit(1))
+
+    if found is None:
+        return False
+    _chain_ok_until[chain_id] = time.monotonic() + SCHEMA_CHECK_TTL_SECONDS
+    return True
 
@@ -10,14 +10,17 @@ from typing import Optional
 from sqlalchemy import (
     BigInteger,
     Boolean,
+    CheckConstraint,
     Column,
     DateTime,
     ForeignKey,
+    Index,
     Integer,
     String,
-    Text,
     UniqueConstraint,
+    text,
 )
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import declarative_base, relationship
 
 Base = declarative_base()
@@ -53,6 +56,21 @@ class Campaign(Base):
     """Campaign model (maps to existing 'campaigns' table)."""
 
     __tablename__ = "campaigns"
+    __table_args__ = (
+        # Created by backend migration 0003; serves the expired-campaign reconcile
+        # UPDATE better than a (status, deadline_ts) index, since it only holds
+        # rows that can still fail
+        Index(
+            "campaigns_active_deadline_idx",
+            "deadline_ts",
+            postgresql_where=text("status = 'ACTIVE' AND NOT withdrawn"),
+        ),
+        # Backend migration 0005; readers rely on addresses being stored lowercase
+        CheckConstraint("address = lower(address)", name="campaigns_address_lower_chk"),
+        # Backend migration 0006; makes max(created_at) an index lookup for the
+        # campaign indexers' known-address check
+        Index("campaigns_created_at_idx", "created_at"),
+    )
 
     address = Column(String(42), primary_key=True)  # Ethereum address (0x + 40 hex)
     factory_address = Column(String(42), nullable=False)
@@ -98,6 +116,15 @@ class Event(Base):
     __tablename__ = "events"
     __table_args__ = (
         UniqueConstraint("chain_id", "tx_hash", "log_index", name="uq_events_chain_tx_log"),
+        # Created by backend migration 0004; serves reorg rollback/replay range scans
+        Index(
+            "events_live_chain_block_idx",
+            "chain_id",
+            "block_number",
+            "log_index",
+            postgresql_where=text("NOT removed"),
+        ),
+        CheckConstraint("address = lower(address)", name="events_address_lower_chk"),
     )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
@@ -108,7 +135,7 @@ class Event(Base):
     block_hash = Column(String(66), nullable=False)  # 0x + 64 hex chars
     address = Column(String(42), ForeignKey("campaigns.address"), nullable=True)  # Campaign or Factory address
     event_name = Column(String(100), nullable=False)  # CampaignCreated, DonationReceived, etc.
-    event_data = Column(Text, nullable=True)  # JSON string of decoded event data
+    event_data = Column(JSONB, nullable=True)  # Decoded event data
     removed = Column(Boolean, nullable=False, default=False)  # True if event was removed in reorg
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
 
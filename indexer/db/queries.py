@@ -0,0 +1,15 @@
+"""Prebuilt statements for queries that run on every poll or batch.
+
+Building the statement once at import skips re-constructing it per call,
+and binding chain_id as a parameter keeps one entry in the engine's
+compiled-statement cache for every call.
+"""
+
+from sqlalchemy import bindparam, select
+
+from db.models import SyncState
+
+# Columns of a chain's sync_state row; execute with {"chain_id": ...}
+SYNC_STATE_BY_CHAIN = select(SyncState.last_block, SyncState.last_block_hash).where(
+    SyncState.chain_id == bindparam("chain_id")
+)
@@ -4,8 +4,9 @@ from contextlib import contextmanager
 from typing import Generator
 
 from sqlalchemy import create_engine, Engine
-from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.orm import Session, scoped_session, sessionmaker
 
+import jsonutil
 from config import Config
 
 # Global engine instance (singleton)
@@ -24,11 +25,24 @@ def init_db(config: Config) -> None:
     if _engine is not None:
         return  # Already initialized
 
+    connect_args = {}
+    if config.db_relaxed_durability:
+        # Commits return before the WAL is flushed; a crash can drop the last
+        # few hundred ms of commits, but never corrupts or half-applies one
+        connect_args["options"] = "-c synchronous_commit=off"
+
     _engine = create_engine(
         config.db_url,
-        pool_size=10,
-        max_overflow=20,
+        pool_size=config.db_pool_size,
+        max_overflow=config.db_max_overflow,
+        pool_timeout=config.db_pool_timeout,
+        pool_recycle=config.db_pool_recycle,  # Replace connections before idle timeouts drop them
         pool_pre_ping=True,  # Verify connections before using
+        pool_use_lifo=True,  # Reuse the warmest connection; surplus idle ones age out via pool_recycle
+        query_cache_size=1200,  # Compiled-statement cache; default 500 is tight with bulk upserts per batch size
+        json_serializer=jsonutil.dumps,  # JSONB columns (events.event_data)
+        json_deserializer=jsonutil.loads,
+        connect_args=connect_args,
         echo=False,  # Set to True for SQL debugging
     )
 
@@ -54,10 +68,33 @@ def get_engine() -> Engine:
     return _engine
 
 
+def get_scoped_session() -> scoped_session[Session]:
+    """Get a thread-local session registry for long-lived sessions.
+
+    Each thread calling the registry gets its own Session, reused across
+    calls until remove() is called from that thread.
+
+    Returns:
+        SQLAlchemy scoped_session registry
+
+    Raises:
+        RuntimeError: If database not initialized
+    """
+    if _SessionLocal is None:
+        raise RuntimeError("Database not initialized. Call init_db() first.")
+    return scoped_session(_SessionLocal)
+
+
 @contextmanager
 def get_session() -> Generator[Session, None, None]:
     """Get a database session with context manager.
 
+    Pending changes are flushed and every object is expunged before the
+    commit, so the identity map is released as soon as the block exits.
+    Objects stay usable afterwards as detached instances with their
+    loaded attributes, but unloaded attributes and relationships cannot
+    be lazy-loaded; copy what you need inside the block.
+
     Yields:
         SQLAlchemy Session
 
@@ -72,6 +109,8 @@ def get_session() -> Generator[Session, None, None]:
     session = _SessionLocal()
     try:
         yield session
+        session.flush()
+        session.expunge_all()
         session.commit()
     except Exception:
         session.rollback()
@@ -79,3 +118,25 @@ def get_session() -> Generator[Session, None, None]:
     finally:
         session.close()
 
+
+@contextmanager
+def get_readonly_session() -> Generator[Session, None, None]:
+    """Get a session for queries that never write.
+
+    The transaction is rolled back rather than committed and the identity
+    map is expunged on exit, with the same detached-object contract as
+    get_session().
+
+    Yields:
+        SQLAlchemy Session
+    """
+    if _SessionLocal is None:
+        raise RuntimeError("Database not initialized. Call init_db() first.")
+
+    session = _SessionLocal(autoflush=False)
+    try:
+        yield session
+    finally:
+        session.expunge_all()
+        session.close()
+
@@ -2,6 +2,7 @@
 
 import json
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict
 
@@ -13,9 +14,13 @@ logger = get_logger(__name__)
 ABI_DIR = Path(__file__).parent.parent / "abi"
 
 
+@lru_cache(maxsize=None)
 def load_abi(contract_name: str) -> list[Dict[str, Any]]:
     """Load ABI from JSON file.
 
+    The file is read once per process; later calls return the same cached
+    list, so callers must not mutate it.
+
     Args:
         contract_name: Contract name (e.g., "CampaignFactory" or "Campaign")
 
@@ -0,0 +1,20 @@
+"""Canonical forms for addresses and hashes."""
+
+import sys
+from functools import lru_cache
+
+
+@lru_cache(maxsize=8192)
+def canonical_address(value: str) -> str:
+    """Get the canonical (lowercase, interned) form of an address or hash.
+
+    The same few contract addresses recur across most events, so caching the
+    lowered string and interning it lets equal values share one object.
+
+    Args:
+        value: Address or hash hex string, any case
+
+    Returns:
+        Lowercase interned string
+    """
+    return sys.intern(value.lower())
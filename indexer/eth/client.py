@@ -1,16 +1,152 @@
 """Web3 client for Ethereum RPC interactions."""
 
+import random
+import threading
 import time
-from typing import Any, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Union
 
+import requests
+from requests.adapters import HTTPAdapter
 from web3 import Web3
-from web3.types import BlockIdentifier, LogReceipt
+from web3.types import BlockData, BlockIdentifier, LogReceipt
 
 from config import Config
 from log import get_logger
 
 logger = get_logger(__name__)
 
+# Seconds before an RPC request is abandoned
+RPC_TIMEOUT_SECONDS = 30
+
+# get_logs retries: exponential backoff with jitter, transient errors only
+RPC_MAX_RETRIES = 3
+RPC_RETRY_BASE_DELAY = 1.0
+RPC_RETRY_MAX_DELAY = 30.0
+
+# Calls per JSON-RPC batch (providers commonly cap batches at 100-1000)
+RPC_BATCH_SIZE = 100
+
+# Hashes of blocks deeper than the reorg window, kept per client
+BLOCK_HASH_CACHE_SIZE = 4096
+
+# Contract addresses per eth_getLogs filter (Infura caps the address list at 1000)
+LOG_FILTER_MAX_ADDRESSES = 1000
+
+# eth_getLogs filter arguments: one or more contracts; per-position topic (list = OR)
+LogAddress = Optional[Union[str, Sequence[str]]]
+LogTopics = Optional[List[Union[str, List[str], None]]]
+
+# Word-level markers only: bare status digits also occur in block numbers and hashes
+_TRANSIENT_ERROR_MARKERS = (
+    "too many requests",
+    "rate limit",
+    "timeout",
+    "timed out",
+    "temporarily unavailable",
+)
+
+# JSON-RPC error codes for limit exceeded (rate limiting) and internal node errors
+_TRANSIENT_RPC_CODES = frozenset({-32005, -32603})
+
+
+_RESULT_LIMIT_MARKERS = (
+    "query returned more than",
+    "more than 10000 results",
+    "response size exceeded",
+    "block range is too large",
+    "block range too large",
+)
+
+# Node errors for an eth_getLogs address list it does not accept (e.g. geth's
+# "cannot unmarshal array into Go value of type common.Address")
+_ADDRESS_LIST_REJECTION_MARKERS = (
+    "cannot unmarshal array",
+    "invalid address",
+    "address must be a string",
+    "expected address",
+)
+
+
+def is_result_limit_error(error: Exception) -> bool:
+    """Check whether an eth_getLogs error means the range returned too many logs.
+
+    Args:
+        error: Exception raised by the RPC call
+
+    Returns:
+        True if the same query over a smaller block range may succeed
+    """
+    if isinstance(error, requests.HTTPError) and error.response is not None:
+        if error.response.status_code == 413:
+            return True
+    message = str(error).lower()
+    return any(marker in message for marker in _RESULT_LIMIT_MARKERS)
+
+
+def _rpc_error_payload(error: Exception) -> Optional[Dict[str, Any]]:
+    """Get the JSON-RPC error object ({"code", "message"}) carried by an exception.
+
+    web3 6 raises ValueError(error_dict); web3 7 raises Web3RPCError with the
+    whole response in rpc_response.
+
+    Args:
+        error: Exception raised by the RPC call
+
+    Returns:
+        The error object, or None if the exception is not a JSON-RPC error
+    """
+    if error.args and isinstance(error.args[0], dict):
+        return error.args[0]
+    response = getattr(error, "rpc_response", None)
+    if isinstance(response, dict) and isinstance(response.get("error"), dict):
+        return response["error"]
+    return None
+
+
+def is_transient_rpc_error(error: Exception) -> bool:
+    """Check whether an RPC error is worth retrying.
+
+    Timeouts, connection failures, HTTP 429 and 5xx, and JSON-RPC errors
+    with a limit-exceeded/internal-error code or rate-limit message are
+    transient; anything else, such as an invalid filter, fails the same way
+    on every attempt.
+
+    Args:
+        error: Exception raised by the RPC call
+
+    Returns:
+        True if the call may succeed when retried
+    """
+    if isinstance(error, (requests.Timeout, requests.ConnectionError)):
+        return True
+    if isinstance(error, requests.HTTPError) and error.response is not None:
+        status = error.response.status_code
+        return status == 429 or status >= 500
+    payload = _rpc_error_payload(error)
+    if payload is not None:
+        if payload.get("code") in _TRANSIENT_RPC_CODES:
+            return True
+        message = str(payload.get("message", "")).lower()
+    else:
+        message = str(error).lower()
+    return any(marker in message for marker in _TRANSIENT_ERROR_MARKERS)
+
+
+def is_address_list_rejected(error: Exception) -> bool:
+    """Check whether an eth_getLogs error means the node does not take address lists.
+
+    Args:
+        error: Exception raised by the RPC call
+
+    Returns:
+        True if the same filter with a single address may succeed
+    """
+    payload = _rpc_error_payload(error)
+    message = str(payload.get("message", "") if payload is not None else error).lower()
+    return any(marker in message for marker in _ADDRESS_LIST_REJECTION_MARKERS)
+
 
 class EthereumClient:
     """Ethereum RPC client with retry logic."""
@@ -22,7 +158,24 @@ class EthereumClient:
             config: Configuration object with RPC URL
         """
         self.config = config
-        self.web3 = Web3(Web3.HTTPProvider(config.rpc_url))
+        self.web3 = Web3(
+            Web3.HTTPProvider(
+                config.rpc_url,
+                request_kwargs={"timeout": RPC_TIMEOUT_SECONDS},
+                session=self._create_session(config),
+            )
+        )
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._checksum_cache: Dict[str, str] = {}
+        # Learned eth_getLogs stride: shrinks on result-limit errors, recovers on clean calls
+        self._log_stride = config.rpc_log_chunk_size
+        # Cleared once the node rejects a filter with an address list
+        self._multi_address_filters = True
+        self._head_lock = threading.Lock()
+        self._head: Optional[int] = None
+        self._head_fetched_at = 0.0
+        # Hashes of final blocks, oldest first; shared by single and batched lookups
+        self._final_hashes: Dict[int, str] = {}
         
         # Verify connection
         if not self.web3.is_connected():
@@ -30,19 +183,68 @@ class EthereumClient:
         
         logger.info(f"Connected to Ethereum RPC: {config.rpc_url}")
 
+    @staticmethod
+    def _create_session(config: Config) -> requests.Session:
+        """Create the HTTP session shared by all RPC calls on this client.
+
+        Keep-alive connections are pooled so requests (including concurrent
+        get_logs_parallel chunks) reuse TCP/TLS connections instead of
+        opening new ones.
+
+        Args:
+            config: Configuration object
+
+        Returns:
+            requests Session with a pool sized for the RPC concurrency
+        """
+        # +1 for the caller's own thread alongside the get_logs_parallel pool
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=config.rpc_max_concurrency + 1, max_retries=0)
+        session = requests.Session()
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
+    def _checksum(self, address: str) -> str:
+        """Get the checksum form of an address, computing it once per address.
+
+        Args:
+            address: Hex address in any case
+
+        Returns:
+            EIP-55 checksum address
+        """
+        checksum = self._checksum_cache.get(address)
+        if checksum is None:
+            checksum = Web3.to_checksum_address(address)
+            self._checksum_cache[address] = checksum
+        return checksum
+
     def get_latest_block(self) -> int:
         """Get latest block number with confirmations applied.
 
+        The chain head is cached for LATEST_BLOCK_CACHE_TTL_MS, so callers
+        asking again within one block interval do not repeat the RPC call.
+
         Returns:
             Block number (latest - confirmations)
         """
-        latest = self.web3.eth.block_number
+        ttl = self.config.latest_block_cache_ttl_ms / 1000
+        with self._head_lock:
+            if self._head is None or time.monotonic() - self._head_fetched_at >= ttl:
+                self._head = self.web3.eth.block_number
+                self._head_fetched_at = time.monotonic()
+            latest = self._head
         confirmed = max(0, latest - self.config.confirmations)
         return confirmed
 
     def get_block_hash(self, block_number: int) -> str:
         """Get block hash for a given block number.
 
+        Hashes are cached only for blocks more than reorg_rollback_blocks
+        below the last seen head; anything newer is fetched every time so
+        reorg detection always compares against the current chain (see
+        _remember_final_hashes).
+
         Args:
             block_number: Block number to query
 
@@ -52,26 +254,158 @@ class EthereumClient:
         Raises:
             ValueError: If block not found
         """
+        cached = self._final_hashes.get(block_number)
+        if cached is not None:
+            return cached
         try:
-            block = self.web3.eth.get_block(block_number)
-            return block["hash"].hex()
+            block_hash = self._fetch_block_hash(block_number)
         except Exception as e:
             raise ValueError(f"Failed to get block hash for block {block_number}: {e}") from e
+        self._remember_final_hashes({block_number: block_hash})
+        return block_hash
+
+    def get_blocks(self, block_numbers: Iterable[int]) -> Dict[int, BlockData]:
+        """Get several blocks (without transactions) using JSON-RPC batch requests.
+
+        Up to RPC_BATCH_SIZE eth_getBlockByNumber calls share one HTTP
+        round-trip, instead of one round-trip per block. web3 releases
+        without batch_requests (before 7) fetch the blocks one per call,
+        concurrently on the shared RPC pool.
+
+        Args:
+            block_numbers: Block numbers to query (duplicates are fetched once)
+
+        Returns:
+            Mapping of block number to block data
+
+        Raises:
+            ValueError: If any block cannot be fetched
+        """
+        numbers = sorted(set(block_numbers))
+        blocks: Dict[int, BlockData] = {}
+
+        if not hasattr(self.web3, "batch_requests"):
+            executor = self._get_executor()
+            futures = [executor.submit(self.web3.eth.get_block, number, False) for number in numbers]
+            for number, future in zip(numbers, futures):
+                try:
+                    blocks[number] = future.result()
+                except Exception as e:
+                    raise ValueError(f"Failed to get block {number}: {e}") from e
+            return blocks
+
+        for start in range(0, len(numbers), RPC_BATCH_SIZE):
+            chunk = numbers[start : start + RPC_BATCH_SIZE]
+            try:
+                with self.web3.batch_requests() as batch:
+                    for number in chunk:
+                        batch.add(self.web3.eth.get_block(number, False))
+                    results = batch.execute()
+            except Exception as e:
+                raise ValueError(f"Failed to get blocks {chunk[0]}-{chunk[-1]}: {e}") from e
+
+            blocks.update(zip(chunk, results))
+
+        return blocks
+
+    def get_block_hashes(self, block_numbers: Iterable[int]) -> Dict[int, str]:
+        """Get hashes for several blocks using JSON-RPC batch requests.
+
+        Final blocks already seen (by this or get_block_hash) are served from
+        the cache, so ranges that overlap earlier ones skip those blocks.
+
+        Args:
+            block_numbers: Block numbers to query (duplicates are fetched once)
+
+        Returns:
+            Mapping of block number to block hash
+
+        Raises:
+            ValueError: If any block cannot be fetched
+        """
+        hashes: Dict[int, str] = {}
+        missing = []
+        for number in set(block_numbers):
+            cached = self._final_hashes.get(number)
+            if cached is None:
+                missing.append(number)
+            else:
+                hashes[number] = cached
+
+        fetched = {number: block["hash"].hex() for number, block in self.get_blocks(missing).items()}
+        self._remember_final_hashes(fetched)
+        hashes.update(fetched)
+        return hashes
+
+    def get_log_block_hashes(self, logs: Iterable[LogReceipt]) -> Dict[int, str]:
+        """Get the block hash for each log's block, fetching only what the logs lack.
+
+        eth_getLogs already returns blockHash for mined logs, so normally no
+        RPC is made; blocks of logs without one (pending logs) are fetched
+        with get_block_hashes.
+
+        Args:
+            logs: Logs returned by get_logs / get_logs_for_addresses
+
+        Returns:
+            Mapping of block number to block hash
+
+        Raises:
+            ValueError: If a missing block cannot be fetched
+        """
+        hashes: Dict[int, str] = {}
+        missing = set()
+        for log in logs:
+            block_hash = log.get("blockHash")
+            if block_hash:
+                hashes[log["blockNumber"]] = block_hash.hex() if hasattr(block_hash, "hex") else block_hash
+            else:
+                missing.add(log["blockNumber"])
+
+        missing.difference_update(hashes)
+        if missing:
+            hashes.update(self.get_block_hashes(missing))
+        return hashes
+
+    def _remember_final_hashes(self, hashes: Dict[int, str]) -> None:
+        """Cache hashes of blocks more than reorg_rollback_blocks below the last seen head.
+
+        Newer blocks are never cached, so reorg detection always compares
+        against the current chain. The oldest entries are evicted beyond
+        BLOCK_HASH_CACHE_SIZE.
+
+        Args:
+            hashes: Mapping of block number to block hash
+        """
+        head = self._head
+        if head is None:
+            return
+        final = head - self.config.reorg_rollback_blocks
+        for number, block_hash in hashes.items():
+            if number <= final:
+                self._final_hashes[number] = block_hash
+        while len(self._final_hashes) > BLOCK_HASH_CACHE_SIZE:
+            self._final_hashes.pop(next(iter(self._final_hashes)), None)
+
+    def _fetch_block_hash(self, block_number: int) -> str:
+        """Fetch a block hash from the node (uncached)."""
+        block = self.web3.eth.get_block(block_number, full_transactions=False)
+        return block["hash"].hex()
 
     def get_logs(
         self,
-        address: Optional[str],
+        address: LogAddress,
         from_block: int,
         to_block: int,
-        topics: Optional[List[Optional[str]]] = None,
+        topics: LogTopics = None,
     ) -> List[LogReceipt]:
         """Get event logs for a contract address and block range.
 
         Args:
-            address: Contract address (None for all addresses)
+            address: Contract address or list of addresses (None for all addresses)
             from_block: Starting block number
             to_block: Ending block number (inclusive)
-            topics: Event topic filters (list of topic hashes)
+            topics: Event topic filters (per position: a hash, a list of hashes to OR, or None)
 
         Returns:
             List of log receipts
@@ -79,18 +413,17 @@ class EthereumClient:
         Raises:
             Exception: On RPC errors
         """
-        max_retries = 3
-        retry_delay = 1
-
-        for attempt in range(max_retries):
+        for attempt in range(RPC_MAX_RETRIES):
             try:
                 filter_params: dict[str, Any] = {
                     "fromBlock": from_block,
                     "toBlock": to_block,
                 }
                 
-                if address:
-                    filter_params["address"] = Web3.to_checksum_address(address)
+                if isinstance(address, str):
+                    filter_params["address"] = self._checksum(address)
+                elif address:
+                    filter_params["address"] = [self._checksum(a) for a in address]
                 
                 if topics:
                     # Web3.py expects topics as: [topic0, topic1, ...]
@@ -101,25 +434,232 @@ class EthereumClient:
                 return logs
 
             except Exception as e:
-                if attempt < max_retries - 1:
+                if is_result_limit_error(e) and from_block < to_block:
+                    # Provider caps logs per call: split the range until each half fits,
+                    # and start later chunks at the smaller stride
+                    mid = (from_block + to_block) // 2
+                    self._log_stride = max(1, min(self._log_stride, mid - from_block + 1))
+                    logger.info(
+                        f"Too many logs in blocks {from_block}-{to_block}, "
+                        f"splitting at {mid}"
+                    )
+                    return (
+                        self.get_logs(address, from_block, mid, topics)
+                        + self.get_logs(address, mid + 1, to_block, topics)
+                    )
+                if is_result_limit_error(e):
+                    # A single block over the cap fails the same way on retry;
+                    # callers with an address list narrow that instead
+                    raise
+                if not is_transient_rpc_error(e):
+                    logger.error(f"Failed to get logs (not retryable): {e}")
+                    raise
+                if attempt < RPC_MAX_RETRIES - 1:
+                    delay = min(RPC_RETRY_MAX_DELAY, RPC_RETRY_BASE_DELAY * 2 ** attempt)
+                    delay *= 0.5 + random.random()
                     logger.warning(
-                        f"RPC error (attempt {attempt + 1}/{max_retries}): {e}. Retrying..."
+                        f"RPC error (attempt {attempt + 1}/{RPC_MAX_RETRIES}): {e}. "
+                        f"Retrying in {delay:.1f}s..."
                     )
-                    time.sleep(retry_delay * (attempt + 1))
+                    time.sleep(delay)
                 else:
-                    logger.error(f"Failed to get logs after {max_retries} attempts: {e}")
+                    logger.error(f"Failed to get logs after {RPC_MAX_RETRIES} attempts: {e}")
                     raise
 
         return []  # Should never reach here
 
-    def get_block(self, block_number: int) -> dict[str, Any]:
-        """Get full block data.
+    def get_logs_parallel(
+        self,
+        address: LogAddress,
+        from_block: int,
+        to_block: int,
+        topics: LogTopics = None,
+        chunk_size: Optional[int] = None,
+    ) -> List[LogReceipt]:
+        """Get event logs for a block range as concurrent chunked requests.
+
+        The range is split into chunks of chunk_size blocks, fetched through
+        get_logs (with its per-chunk retries) on a pool of at most
+        RPC_MAX_CONCURRENCY threads shared by all calls on this client.
+
+        Without an explicit chunk_size the stride adapts: a chunk that hits
+        the provider's result limit is halved and later calls start from
+        that smaller stride; each call that needs no split doubles it back
+        towards RPC_LOG_CHUNK_SIZE, so sparse ranges return to few calls.
+
+        Args:
+            address: Contract address or list of addresses (None for all addresses)
+            from_block: Starting block number
+            to_block: Ending block number (inclusive)
+            topics: Event topic filters (per position: a hash, a list of hashes to OR, or None)
+            chunk_size: Blocks per request (default: adaptive, at most RPC_LOG_CHUNK_SIZE)
+
+        Returns:
+            List of log receipts in (blockNumber, logIndex) order
+
+        Raises:
+            Exception: On RPC errors in any chunk
+        """
+        adaptive = chunk_size is None
+        chunk_size = chunk_size or self._log_stride
+        ranges = [
+            (start, min(start + chunk_size - 1, to_block))
+            for start in range(from_block, to_block + 1, chunk_size)
+        ]
+        if len(ranges) <= 1:
+            logs = self.get_logs(address, from_block, to_block, topics)
+            if adaptive:
+                self._grow_log_stride(chunk_size)
+            return logs
+
+        executor = self._get_executor()
+        futures = [
+            executor.submit(self.get_logs, address, start, end, topics)
+            for start, end in ranges
+        ]
+        # Chunks are disjoint and in block order, so concatenating keeps log order
+        logs = [log for future in futures for log in future.result()]
+        if adaptive:
+            self._grow_log_stride(chunk_size)
+        return logs
+
+    def get_logs_for_addresses(
+        self,
+        addresses: Iterable[str],
+        from_block: int,
+        to_block: int,
+        topics: LogTopics = None,
+    ) -> List[LogReceipt]:
+        """Get event logs emitted by any of a set of contracts.
+
+        The addresses go into a single filter per LOG_FILTER_MAX_ADDRESSES
+        contracts, so the request count does not grow with the number of
+        contracts; pass topics like [[t1, t2, t3]] to match several events
+        in the same request. If the node rejects address lists (see
+        is_address_list_rejected), this and later calls fall back to one
+        request per address, run concurrently on the shared RPC pool; other
+        errors are raised and leave multi-address filters enabled.
+
+        Args:
+            addresses: Contract addresses
+            from_block: Starting block number
+            to_block: Ending block number (inclusive)
+            topics: Event topic filters (per position: a hash, a list of hashes to OR, or None)
+
+        Returns:
+            List of log receipts, without duplicates, in (blockNumber, logIndex) order
+
+        Raises:
+            Exception: On RPC errors
+        """
+        addresses = list(addresses)
+        logs: Optional[List[LogReceipt]] = None
+        chunks: List[List[LogReceipt]] = []
+        if self._multi_address_filters:
+            try:
+                chunks = [
+                    self._get_logs_for_address_list(
+                        addresses[i : i + LOG_FILTER_MAX_ADDRESSES], from_block, to_block, topics
+                    )
+                    for i in range(0, len(addresses), LOG_FILTER_MAX_ADDRESSES)
+                ]
+                # Single filter (the common case): use its list as is, no copy
+                logs = chunks[0] if len(chunks) == 1 else list(chain.from_iterable(chunks))
+            except Exception as e:
+                if not is_address_list_rejected(e):
+                    raise
+                logger.warning(f"Node rejected a multi-address log filter, fetching per address from now on: {e}")
+                self._multi_address_filters = False
+                logs = None
+
+        in_order = logs is not None and len(chunks) == 1
+        if logs is None:
+            executor = self._get_executor()
+            futures = [
+                executor.submit(self.get_logs, address, from_block, to_block, topics)
+                for address in addresses
+            ]
+            logs = [log for future in futures for log in future.result()]
+
+        # Some nodes repeat a log that matches the filter more than one way
+        unique = {(log["transactionHash"], log["logIndex"]): log for log in logs}
+        if in_order and len(unique) == len(logs):
+            return logs
+        return sorted(unique.values(), key=lambda log: (log["blockNumber"], log["logIndex"]))
+
+    def _get_logs_for_address_list(
+        self,
+        addresses: List[str],
+        from_block: int,
+        to_block: int,
+        topics: LogTopics,
+    ) -> List[LogReceipt]:
+        """Get logs for one multi-address filter, splitting the address list if needed.
+
+        get_logs already halves the block range on result-limit errors; a
+        single block that still has too many logs for all the addresses is
+        fetched as two filters with half the addresses each.
+
+        Args:
+            addresses: Contract addresses (at most LOG_FILTER_MAX_ADDRESSES)
+            from_block: Starting block number
+            to_block: Ending block number (inclusive)
+            topics: Event topic filters
+
+        Returns:
+            List of log receipts, in (blockNumber, logIndex) order
+
+        Raises:
+            Exception: On RPC errors
+        """
+        try:
+            return self.get_logs_parallel(addresses, from_block, to_block, topics)
+        except Exception as e:
+            if not is_result_limit_error(e) or len(addresses) == 1:
+                raise
+            mid = len(addresses) // 2
+            logger.info(
+                f"Too many logs in blocks {from_block}-{to_block} for {len(addresses)} addresses, "
+                f"splitting the address list"
+            )
+            logs = self._get_logs_for_address_list(addresses[:mid], from_block, to_block, topics)
+            logs += self._get_logs_for_address_list(addresses[mid:], from_block, to_block, topics)
+            logs.sort(key=lambda log: (log["blockNumber"], log["logIndex"]))
+            return logs
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Get the RPC thread pool shared by all log fetches on this client.
+
+        Tasks on it must not wait on other tasks submitted to it.
+
+        Returns:
+            Executor with at most RPC_MAX_CONCURRENCY threads
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.config.rpc_max_concurrency,
+                thread_name_prefix="rpc",
+            )
+        return self._executor
+
+    def _grow_log_stride(self, used_stride: int) -> None:
+        """Double the learned log stride after a call that needed no split.
+
+        Args:
+            used_stride: Stride the finished call started with
+        """
+        if self._log_stride == used_stride < self.config.rpc_log_chunk_size:
+            self._log_stride = min(used_stride * 2, self.config.rpc_log_chunk_size)
+
+    def get_block(self, block_number: int, full_transactions: bool = False) -> BlockData:
+        """Get block data.
 
         Args:
             block_number: Block number to query
+            full_transactions: Include full transaction objects instead of hashes
 
         Returns:
-            Block data dictionary
+            Block data (read-only mapping, returned as-is without copying)
         """
-        return dict(self.web3.eth.get_block(block_number))
+        return self.web3.eth.get_block(block_number, full_transactions=full_transactions)
 
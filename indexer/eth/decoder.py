@@ -1,53 +1,90 @@
 """Event log decoder."""
 
-import json
-from typing import Any, Dict, Optional
+import logging
+import sys
+import threading
+from typing import Any, Dict, Optional, Tuple
 
 from web3 import Web3
 from web3.types import LogReceipt
 
+import jsonutil
 from eth.abi_loader import get_campaign_abi, get_factory_abi
 from log import get_logger
 
 logger = get_logger(__name__)
 
-# Contract instances for decoding
-_factory_contract = None
-_campaign_contract = None
+# topic0 (raw bytes) -> (event name, contract event class) for the
+# Factory and Campaign ABIs together; built on first use under _topics_lock
+# and published complete in one assignment, so concurrent decoders never
+# see a partly filled table
+_topics: Optional[Dict[bytes, Tuple[str, Any]]] = None
+_topics_lock = threading.Lock()
 
 
-def _get_factory_contract() -> Any:
-    """Get Web3 contract instance for Factory.
+def _topic_key(topic: Any) -> bytes:
+    """Normalize a topic to raw bytes for dispatch lookups.
+
+    Topics from get_logs are already HexBytes (a bytes subclass) and are
+    used as-is; hex strings are converted.
+
+    Args:
+        topic: Topic as bytes/HexBytes or hex string
 
     Returns:
-        Web3 contract instance
+        32-byte topic
     """
-    global _factory_contract
-    if _factory_contract is None:
-        abi = get_factory_abi()
-        _factory_contract = Web3().eth.contract(abi=abi)
-    return _factory_contract
+    if isinstance(topic, bytes):
+        return topic
+    return bytes.fromhex(topic.removeprefix("0x"))
+
 
+def _build_topic_table(contract: Any) -> Dict[bytes, Tuple[str, Any]]:
+    """Map each event's signature hash to its name and decoder, once per contract.
 
-def _get_campaign_contract() -> Any:
-    """Get Web3 contract instance for Campaign.
+    Args:
+        contract: Web3 contract instance
 
     Returns:
-        Web3 contract instance
+        Dictionary of topic0 to (event name, contract event class)
     """
-    global _campaign_contract
-    if _campaign_contract is None:
-        abi = get_campaign_abi()
-        _campaign_contract = Web3().eth.contract(abi=abi)
-    return _campaign_contract
-
+    table = {}
+    for event_abi in contract.abi:
+        if event_abi.get("type") != "event":
+            continue
+        # Interned so every decoded event shares one string per event type and
+        # dispatch comparisons against literals hit the identity fast path
+        event_name = sys.intern(event_abi["name"])
+        input_types = [inp["type"] for inp in event_abi.get("inputs", [])]
+        signature = f"{event_name}({','.join(input_types)})"
+        table[bytes(Web3.keccak(text=signature))] = (event_name, getattr(contract.events, event_name))
+    return table
+
+
+def _get_topic_table() -> Dict[bytes, Tuple[str, Any]]:
+    """Get the topic0 dispatch table covering Factory and Campaign events.
 
-def decode_event(log: LogReceipt, contract_type: str = "campaign") -> Optional[Dict[str, Any]]:
-    """Decode a log receipt into structured event data.
+    Returns:
+        Dictionary of topic0 to (event name, contract event class)
+    """
+    global _topics
+    topics = _topics
+    if topics is None:
+        with _topics_lock:
+            topics = _topics
+            if topics is None:
+                topics = {}
+                for abi in (get_factory_abi(), get_campaign_abi()):
+                    topics.update(_build_topic_table(Web3().eth.contract(abi=abi)))
+                _topics = topics
+    return topics
+
+
+def decode_event(log: LogReceipt) -> Optional[Dict[str, Any]]:
+    """Decode a Factory or Campaign log receipt into structured event data.
 
     Args:
         log: Raw log receipt from get_logs
-        contract_type: "factory" or "campaign"
 
     Returns:
         Decoded event data with keys:
@@ -60,51 +97,32 @@ def decode_event(log: LogReceipt, contract_type: str = "campaign") -> Optional[D
         None if decoding fails
     """
     try:
-        if contract_type == "factory":
-            contract = _get_factory_contract()
-        elif contract_type == "campaign":
-            contract = _get_campaign_contract()
-        else:
-            logger.error(f"Unknown contract type: {contract_type}")
+        # The first topic is the event signature hash
+        if not log["topics"]:
             return None
+        event_topic = _topic_key(log["topics"][0])
 
-        # Try to decode with each event in the contract
-        # The first topic is the event signature hash
-        event_topic = log["topics"][0].hex() if log["topics"] else None
-        if not event_topic:
+        entry = _get_topic_table().get(event_topic)
+        if entry is None:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Event not found in ABIs for topic 0x%s", bytes(event_topic).hex())
             return None
 
-        # Find matching event by topic
-        for event_abi in contract.abi:
-            if event_abi.get("type") == "event":
-                # Compute event signature
-                event_name = event_abi["name"]
-                inputs = event_abi.get("inputs", [])
-                input_types = [inp["type"] for inp in inputs]
-                signature = f"{event_name}({','.join(input_types)})"
-                computed_topic = Web3.keccak(text=signature).hex()
-                
-                if computed_topic.lower() == event_topic.lower():
-                    # Found matching event, decode it
-                    try:
-                        event_handler = getattr(contract.events, event_name)
-                        decoded = event_handler().process_log(log)
-                        
-                        return {
-                            "event_name": decoded["event"],
-                            "args": dict(decoded["args"]),
-                            "block_number": log["blockNumber"],
-                            "tx_hash": log["transactionHash"].hex(),
-                            "log_index": log["logIndex"],
-                            "address": log["address"],
-                        }
-                    except Exception as decode_error:
-                        logger.debug(f"Error decoding {event_name}: {decode_error}")
-                        continue
-
-        # Event not found
-        logger.debug(f"Event not found in {contract_type} ABI for topic {event_topic}")
-        return None
+        event_name, event_class = entry
+        try:
+            decoded = event_class().process_log(log)
+        except Exception as decode_error:
+            logger.debug("Error decoding %s: %s", event_name, decode_error)
+            return None
+
+        return {
+            "event_name": event_name,
+            "args": dict(decoded["args"]),
+            "block_number": log["blockNumber"],
+            "tx_hash": log["transactionHash"].hex(),
+            "log_index": log["logIndex"],
+            "address": log["address"],
+        }
 
     except Exception as e:
         logger.warning(f"Failed to decode event: {e}")
@@ -112,7 +130,7 @@ def decode_event(log: LogReceipt, contract_type: str = "campaign") -> Optional[D
 
 
 def decode_factory_event(log: LogReceipt) -> Optional[Dict[str, Any]]:
-    """Decode a Factory contract event.
+    """Decode a Factory contract event (kept for callers; same as decode_event).
 
     Args:
         log: Raw log receipt
@@ -120,11 +138,11 @@ def decode_factory_event(log: LogReceipt) -> Optional[Dict[str, Any]]:
     Returns:
         Decoded event data or None
     """
-    return decode_event(log, contract_type="factory")
+    return decode_event(log)
 
 
 def decode_campaign_event(log: LogReceipt) -> Optional[Dict[str, Any]]:
-    """Decode a Campaign contract event.
+    """Decode a Campaign contract event (kept for callers; same as decode_event).
 
     Args:
         log: Raw log receipt
@@ -132,17 +150,17 @@ def decode_campaign_event(log: LogReceipt) -> Optional[Dict[str, Any]]:
     Returns:
         Decoded event data or None
     """
-    return decode_event(log, contract_type="campaign")
+    return decode_event(log)
 
 
-def event_data_to_json(event_data: Dict[str, Any]) -> str:
-    """Convert event data dictionary to JSON string.
+def event_data_to_dict(event_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert event data dictionary to JSON-serializable values.
 
     Args:
         event_data: Decoded event data
 
     Returns:
-        JSON string representation
+        Dictionary safe to store in a JSONB column
     """
     # Convert any non-serializable types
     serializable = {}
@@ -151,8 +169,29 @@ def event_data_to_json(event_data: Dict[str, Any]) -> str:
             serializable[key] = value
         elif hasattr(value, "hex"):  # HexBytes
             serializable[key] = value.hex()
+        elif isinstance(value, dict):  # Decoded args, read back by reorg replay
+            serializable[key] = event_data_to_dict(value)
         else:
             serializable[key] = str(value)
     
-    return json.dumps(serializable)
+    return serializable
+
+
+def _json_default(value: Any) -> str:
+    """Serialize values JSON has no type for (HexBytes/bytes as hex, else str)."""
+    if hasattr(value, "hex"):
+        return value.hex()
+    return str(value)
+
+
+def event_data_to_json(event_data: Dict[str, Any]) -> str:
+    """Convert event data dictionary to JSON string.
+
+    Args:
+        event_data: Decoded event data
+
+    Returns:
+        JSON string representation
+    """
+    return jsonutil.dumps(event_data, default=_json_default)
 
@@ -4,9 +4,6 @@ from web3 import Web3
 
 from eth.abi_loader import get_campaign_abi, get_factory_abi
 
-# Cache topic hashes
-_TOPIC_CACHE: dict[str, str] = {}
-
 
 def _compute_topic(event_signature: str) -> str:
     """Compute keccak256 hash of event signature.
@@ -25,17 +22,31 @@ def _compute_topic(event_signature: str) -> str:
     return hex_str
 
 
+# Canonical event signatures (indexed parameters noted for reference)
+_EVENT_SIGNATURES = {
+    # CampaignCreated(address indexed factory, address indexed campaign, address indexed creator, uint256 goal, uint256 deadline, string cid)
+    "CampaignCreated": "CampaignCreated(address,address,address,uint256,uint256,string)",
+    # DonationReceived(address indexed campaign, address indexed donor, uint256 amount, uint256 newTotalRaised, uint256 timestamp)
+    "DonationReceived": "DonationReceived(address,address,uint256,uint256,uint256)",
+    # Withdrawn(address indexed campaign, address indexed creator, uint256 amount, uint256 timestamp)
+    "Withdrawn": "Withdrawn(address,address,uint256,uint256)",
+    # Refunded(address indexed campaign, address indexed donor, uint256 amount, uint256 timestamp)
+    "Refunded": "Refunded(address,address,uint256,uint256)",
+}
+
+# Topic hashes, computed once at import
+TOPICS: dict[str, str] = {name: _compute_topic(sig) for name, sig in _EVENT_SIGNATURES.items()}
+
+_CAMPAIGN_TOPICS = [TOPICS["DonationReceived"], TOPICS["Withdrawn"], TOPICS["Refunded"]]
+
+
 def get_campaign_created_topic() -> str:
     """Get CampaignCreated event topic hash.
 
     Returns:
         Topic hash for CampaignCreated event
     """
-    if "CampaignCreated" not in _TOPIC_CACHE:
-        # CampaignCreated(address indexed factory, address indexed campaign, address indexed creator, uint256 goal, uint256 deadline, string cid)
-        signature = "CampaignCreated(address,address,address,uint256,uint256,string)"
-        _TOPIC_CACHE["CampaignCreated"] = _compute_topic(signature)
-    return _TOPIC_CACHE["CampaignCreated"]
+    return TOPICS["CampaignCreated"]
 
 
 def get_donation_received_topic() -> str:
@@ -44,11 +55,7 @@ def get_donation_received_topic() -> str:
     Returns:
         Topic hash for DonationReceived event
     """
-    if "DonationReceived" not in _TOPIC_CACHE:
-        # DonationReceived(address indexed campaign, address indexed donor, uint256 amount, uint256 newTotalRaised, uint256 timestamp)
-        signature = "DonationReceived(address,address,uint256,uint256,uint256)"
-        _TOPIC_CACHE["DonationReceived"] = _compute_topic(signature)
-    return _TOPIC_CACHE["DonationReceived"]
+    return TOPICS["DonationReceived"]
 
 
 def get_withdrawn_topic() -> str:
@@ -57,11 +64,7 @@ def get_withdrawn_topic() -> str:
     Returns:
         Topic hash for Withdrawn event
     """
-    if "Withdrawn" not in _TOPIC_CACHE:
-        # Withdrawn(address indexed campaign, address indexed creator, uint256 amount, uint256 timestamp)
-        signature = "Withdrawn(address,address,uint256,uint256)"
-        _TOPIC_CACHE["Withdrawn"] = _compute_topic(signature)
-    return _TOPIC_CACHE["Withdrawn"]
+    return TOPICS["Withdrawn"]
 
 
 def get_refunded_topic() -> str:
@@ -70,22 +73,13 @@ def get_refunded_topic() -> str:
     Returns:
         Topic hash for Refunded event
     """
-    if "Refunded" not in _TOPIC_CACHE:
-        # Refunded(address indexed campaign, address indexed donor, uint256 amount, uint256 timestamp)
-        signature = "Refunded(address,address,uint256,uint256)"
-        _TOPIC_CACHE["Refunded"] = _compute_topic(signature)
-    return _TOPIC_CACHE["Refunded"]
+    return TOPICS["Refunded"]
 
 
 def get_all_campaign_topics() -> list[str]:
     """Get all Campaign event topic hashes.
 
     Returns:
-        List of topic hashes for Campaign events
+        List of topic hashes for Campaign events (shared; do not mutate)
     """
-    return [
-        get_donation_received_topic(),
-        get_withdrawn_topic(),
-        get_refunded_topic(),
-    ]
-
+    return _CAMPAIGN_TOPICS
@@ -0,0 +1,71 @@
+"""Fast JSON encoding/decoding for event payloads.
+
+orjson is used when it can represent the data exactly. Wei amounts are
+uint256 and can exceed 64 bits, which orjson refuses to encode and silently
+decodes as floats, so those payloads fall back to the stdlib json module.
+"""
+
+import json
+from typing import Any, Callable, Optional
+
+import orjson
+
+
+def dumps(obj: Any, default: Optional[Callable[[Any], Any]] = None) -> str:
+    """Serialize an object to a JSON string.
+
+    Args:
+        obj: JSON-serializable object
+        default: Called for values that are not natively serializable
+
+    Returns:
+        JSON string
+    """
+    try:
+        return orjson.dumps(obj, default=default).decode()
+    except orjson.JSONEncodeError:
+        # Integers beyond 64 bits (large wei amounts)
+        return json.dumps(obj, default=default)
+
+
+def loads(data: str | bytes) -> Any:
+    """Deserialize a JSON string or bytes.
+
+    Event payloads never contain real floats, so a float in orjson's result
+    means an integer was too large for it and the payload is re-parsed
+    exactly with the stdlib.
+
+    Args:
+        data: JSON text
+
+    Returns:
+        Parsed object
+    """
+    try:
+        obj = orjson.loads(data)
+    except orjson.JSONDecodeError:
+        # Let the stdlib decide (and raise for genuinely malformed input)
+        return json.loads(data)
+    if _has_float(obj):
+        return json.loads(data)
+    return obj
+
+
+def _has_float(obj: Any) -> bool:
+    """Check whether a parsed JSON value contains a float.
+
+    Runs for every decoded payload (e.g. each JSONB row in a reorg replay),
+    so it walks with an explicit stack and exact type checks instead of
+    recursive any() generators; orjson only produces plain dict/list/float.
+    """
+    stack = [obj]
+    while stack:
+        value = stack.pop()
+        kind = type(value)
+        if kind is float:
+            return True
+        if kind is dict:
+            stack.extend(value.values())
+        elif kind is list:
+            stack.extend(value)
+    return False
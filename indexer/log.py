@@ -1,15 +1,29 @@
 """Logging configuration for """
 
+import atexit
 import logging
+import os
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
 from typing import Optional
 
 from config import Config
 
+# Per-process queue logging state (a forked worker must start its own listener)
+_queue_handler: Optional[QueueHandler] = None
+_stream_handler: Optional[logging.Handler] = None
+_listener: Optional[QueueListener] = None
+_listener_pid: Optional[int] = None
+
 
 def setup_logging(config: Optional[Config] = None, log_level: Optional[str] = None) -> None:
     """Configure Python logging.
 
+    Records are put on an in-process queue and written to stdout by a
+    background QueueListener thread, so logging calls on the message hot path
+    only enqueue. Each process gets its own queue and listener.
+
     Args:
         config: Config object (uses log_level from config if provided)
         log_level: Override log level (takes precedence over config)
@@ -27,19 +41,60 @@ def setup_logging(config: Optional[Config] = None, log_level: Optional[str] = No
     level = level_map.get(level_str.upper(), logging.INFO)
 
     # Configure root logger
-    logging.basicConfig(
-        level=level,
-        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S",
-        stream=sys.stdout,
+    global _queue_handler, _stream_handler, _listener, _listener_pid
+    root = logging.getLogger()
+    root.setLevel(level)
+
+    if _listener_pid == os.getpid():
+        # Already configured in this process: only the level can change
+        return
+
+    # Replace every root handler: ours inherited across fork (its listener
+    # thread does not exist here) and any installed by a host process or an
+    # earlier basicConfig, which would otherwise write each record twice
+    for handler in root.handlers[:]:
+        root.removeHandler(handler)
+
+    _stream_handler = logging.StreamHandler(sys.stdout)
+    _stream_handler.setFormatter(
+        logging.Formatter(
+            "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+            datefmt="%Y-%m-%d %H:%M:%S",
+        )
     )
 
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    _queue_handler = QueueHandler(log_queue)
+    root.addHandler(_queue_handler)
+
+    _listener = QueueListener(log_queue, _stream_handler)
+    _listener.start()
+    _listener_pid = os.getpid()
+    atexit.register(shutdown_logging)
+
     # Reduce noise from third-party libraries
     logging.getLogger("web3").setLevel(logging.WARNING)
     logging.getLogger("urllib3").setLevel(logging.WARNING)
     logging.getLogger("sqlalchemy.engine").setLevel(logging.WARNING)
 
 
+def shutdown_logging() -> None:
+    """Flush queued log records and stop this process's listener thread.
+
+    Call before a worker process exits; multiprocessing children skip atexit.
+    Later records are written synchronously by the listener's handlers.
+    """
+    global _queue_handler, _listener, _listener_pid
+    if _listener is not None and _listener_pid == os.getpid():
+        _listener.stop()
+        root = logging.getLogger()
+        root.removeHandler(_queue_handler)
+        root.addHandler(_stream_handler)
+        _queue_handler = None
+        _listener = None
+        _listener_pid = None
+
+
 def get_logger(name: str) -> logging.Logger:
     """Get a logger instance.
 
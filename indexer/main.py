@@ -3,13 +3,21 @@
 import argparse
 import signal
 import sys
-import time
-from typing import Optional
+import threading
+from contextlib import nullcontext
+from typing import Optional, Tuple
 
+from sqlalchemy import Row, func, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+from websockets.sync.client import connect as ws_connect
+
+import jsonutil
 from config import Config
 from db.healthcheck import check_chain_exists, check_tables_exist
-from db.models import Chain, SyncState
-from db.session import get_session, init_db
+from db.models import Campaign, Chain, SyncState
+from db.queries import SYNC_STATE_BY_CHAIN
+from db.session import get_readonly_session, get_session, init_db
 from eth.client import EthereumClient
 from log import get_logger, setup_logging
 from pipeline.campaign_indexer import CampaignIndexer
@@ -19,143 +27,197 @@ from pipeline.reorg import ReorgHandler
 
 logger = get_logger(__name__)
 
-# Global flag for graceful shutdown
-_shutdown = False
+# newHeads subscription reconnects back off exponentially, as RabbitMQ connects do
+WS_RETRY_DELAY = 1.0
+WS_MAX_RETRY_DELAY = 60.0
+
+# Set by signal_handler; loops wait on it so shutdown interrupts a sleep
+_shutdown = threading.Event()
 
 
 def signal_handler(signum, frame):
     """Handle shutdown signals."""
-    global _shutdown
     logger.info("Shutdown signal received, stopping ..")
-    _shutdown = True
+    _shutdown.set()
 
 
 def ensure_chain_exists(config: Config) -> None:
     """Ensure chain record exists in database.
 
+    Both rows are created with INSERT ... ON CONFLICT DO NOTHING, so an
+    existing chain costs two statements and no ORM loads.
+
     Args:
         config: Configuration object
     """
     with get_session() as session:
-        chain = session.query(Chain).filter(Chain.chain_id == config.chain_id).first()
-        
-        if not chain:
-            chain = Chain(
+        created_chain = session.execute(
+            pg_insert(Chain)
+            .values(
                 chain_id=config.chain_id,
                 name=f"Chain {config.chain_id}",
                 rpc_url=config.rpc_url,
             )
-            session.add(chain)
+            .on_conflict_do_nothing(index_elements=["chain_id"])
+            .returning(Chain.chain_id)
+        ).first()
+        if created_chain:
             logger.info(f"Created chain record: {config.chain_id}")
 
         # Ensure sync_state exists
-        sync_state = (
-            session.query(SyncState)
-            .filter(SyncState.chain_id == config.chain_id)
-            .first()
-        )
-        
-        if not sync_state:
-            sync_state = SyncState(
-                chain_id=config.chain_id,
-                last_block=0,
-                last_block_hash=None,
-            )
-            session.add(sync_state)
+        created_sync_state = session.execute(
+            pg_insert(SyncState)
+            .values(chain_id=config.chain_id, last_block=0, last_block_hash=None)
+            .on_conflict_do_nothing(index_elements=["chain_id"])
+            .returning(SyncState.chain_id)
+        ).first()
+        if created_sync_state:
             logger.info(f"Created sync_state for chain: {config.chain_id}")
 
 
-def get_sync_state(config: Config) -> SyncState:
+def get_sync_state(config: Config) -> Row:
     """Get current sync state.
 
     Args:
         config: Configuration object
 
     Returns:
-        SyncState object
+        Row with last_block and last_block_hash
+
+    Raises:
+        RuntimeError: If the chain has no sync_state row
     """
-    with get_session() as session:
-        sync_state = (
-            session.query(SyncState)
-            .filter(SyncState.chain_id == config.chain_id)
-            .first()
-        )
-        if not sync_state:
-            raise RuntimeError(f"Sync state not found for chain {config.chain_id}")
-        return sync_state
+    with get_readonly_session() as session:
+        sync_state = session.execute(SYNC_STATE_BY_CHAIN, {"chain_id": config.chain_id}).first()
+    if sync_state is None:
+        raise RuntimeError(f"Sync state not found for chain {config.chain_id}")
+    return sync_state
 
 
-def update_sync_state(config: Config, block_number: int, block_hash: str) -> None:
+def update_sync_state(
+    config: Config,
+    block_number: int,
+    block_hash: str,
+    session: Optional[Session] = None,
+) -> None:
     """Update sync state.
 
     Args:
         config: Configuration object
         block_number: Last processed block number
         block_hash: Last processed block hash
+        session: Session to write in, committed by the caller (default: own transaction)
     """
-    with get_session() as session:
-        sync_state = (
-            session.query(SyncState)
-            .filter(SyncState.chain_id == config.chain_id)
-            .first()
+    with (nullcontext(session) if session is not None else get_session()) as session:
+        session.execute(
+            update(SyncState)
+            .where(SyncState.chain_id == config.chain_id)
+            .values(last_block=block_number, last_block_hash=block_hash)
         )
-        if sync_state:
-            sync_state.last_block = block_number
-            sync_state.last_block_hash = block_hash
-        session.commit()
 
 
 def index_block_range(
     config: Config,
+    eth_client: EthereumClient,
     factory_indexer: FactoryIndexer,
     campaign_indexer: CampaignIndexer,
     from_block: int,
     to_block: int,
+    check_reorgs: bool = True,
 ) -> None:
     """Index a range of blocks.
 
+    Reorg checks only run for batches within reorg_rollback_blocks of
+    to_block; older blocks are final, so catching up after downtime does
+    not pay an RPC call and a query per batch.
+
     Args:
         config: Configuration object
+        eth_client: Ethereum client instance
         factory_indexer: Factory indexer instance
         campaign_indexer: Campaign indexer instance
         from_block: Starting block
         to_block: Ending block
+        check_reorgs: Check near-head batches for reorgs (False for backfills)
     """
     logger.info(f"Indexing blocks {from_block} to {to_block}")
 
     # Process in batches
     batch_size = config.block_batch_size
     current = from_block
+    reorg_handler = ReorgHandler(config, eth_client)
+    # (last_block, last_block_hash) written by the previous batch, so the
+    # reorg check does not read it back
+    synced: Optional[Tuple[int, Optional[str]]] = None
 
-    while current <= to_block and not _shutdown:
+    while current <= to_block and not _shutdown.is_set():
         batch_end = min(current + batch_size - 1, to_block)
 
         try:
             # Check for reorg
-            reorg_handler = ReorgHandler(config, factory_eth_client)
-            if reorg_handler.check_reorg(current):
+            near_head = batch_end > to_block - config.reorg_rollback_blocks
+            if check_reorgs and near_head and reorg_handler.check_reorg(current, synced):
                 rollback_to = max(0, current - config.reorg_rollback_blocks)
                 reorg_handler.handle_reorg(rollback_to, current)
                 current = rollback_to
+                synced = None
                 continue
 
-            # Index factory events
-            factory_index_block_range(current, batch_end)
+            # Events, state and sync state for the batch commit together
+            with get_session() as session:
+                # Index factory events
+                factory_indexer.index_block_range(current, batch_end, session=session)
 
-            # Index campaign events
-            campaign_index_block_range(current, batch_end)
+                # Index campaign events (sees campaigns created in this batch)
+                campaign_indexer.index_block_range(current, batch_end, session=session)
 
-            # Update sync state
-            block_hash = factory_eth_client.get_block_hash(batch_end)
-            update_sync_state(config, batch_end, block_hash)
+                # Update sync state
+                block_hash = eth_client.get_block_hash(batch_end)
+                update_sync_state(config, batch_end, block_hash, session=session)
+            synced = (batch_end, block_hash)
 
             logger.info(f"Indexed blocks {current} to {batch_end}")
             current = batch_end + 1
 
         except Exception as e:
             logger.error(f"Error indexing blocks {current}-{batch_end}: {e}", exc_info=True)
-            # Continue with next batch
-            current = batch_end + 1
+            # Stop here: sync_state still ends before this batch, so the next
+            # run retries it instead of indexing past the gap
+            break
+
+
+def sync_to_block(
+    config: Config,
+    eth_client: EthereumClient,
+    factory_indexer: FactoryIndexer,
+    campaign_indexer: CampaignIndexer,
+    latest_block: int,
+) -> None:
+    """Index any blocks between the sync state and latest_block.
+
+    Args:
+        config: Configuration object
+        eth_client: Ethereum client instance
+        factory_indexer: Factory indexer instance
+        campaign_indexer: Campaign indexer instance
+        latest_block: Latest block with confirmations applied
+    """
+    sync_state = get_sync_state(config)
+    last_block = sync_state.last_block
+
+    if latest_block > last_block:
+        # Index new blocks
+        logger.info(f"New blocks detected: {last_block + 1} to {latest_block}")
+        index_block_range(
+            config,
+            eth_client,
+            factory_indexer,
+            campaign_indexer,
+            last_block + 1,
+            latest_block,
+        )
+    else:
+        logger.debug(f"No new blocks (latest={latest_block}, last={last_block})")
 
 
 def run_indexer(config: Config) -> None:
@@ -174,40 +236,89 @@ def run_indexer(config: Config) -> None:
     reconciler = Reconciler(config)
 
     # Main polling loop
-    while not _shutdown:
+    while not _shutdown.is_set():
         try:
             # Get latest block with confirmations
             latest_block = eth_client.get_latest_block()
-            sync_state = get_sync_state(config)
-            last_block = sync_state.last_block
-
-            if latest_block > last_block:
-                # Index new blocks
-                logger.info(f"New blocks detected: {last_block + 1} to {latest_block}")
-                index_block_range(
-                    config,
-                    factory_indexer,
-                    campaign_indexer,
-                    last_block + 1,
-                    latest_block,
-                )
-            else:
-                logger.debug(f"No new blocks (latest={latest_block}, last={last_block})")
+            sync_to_block(config, eth_client, factory_indexer, campaign_indexer, latest_block)
 
             # Periodic reconciliation
             if reconciler.should_reconcile():
                 reconciler.reconcile()
 
-            # Sleep before next poll
-            if not _shutdown:
-                time.sleep(config.poll_interval_seconds)
+            # Sleep before next poll (returns early on shutdown)
+            if _shutdown.wait(config.poll_interval_seconds):
+                break
 
         except KeyboardInterrupt:
             logger.info("Keyboard interrupt received")
             break
         except Exception as e:
             logger.error(f"Error in polling loop: {e}", exc_info=True)
-            time.sleep(config.poll_interval_seconds)
+            _shutdown.wait(config.poll_interval_seconds)
+
+    logger.info("Indexer stopped")
+
+
+def run_indexer_subscribe(config: Config) -> None:
+    """Run the indexer driven by an eth_subscribe("newHeads") WebSocket.
+
+    Blocks are indexed when the node announces a new head instead of on
+    every poll tick. On connect the indexer first catches up to the
+    current head; dropped connections are retried with exponential
+    backoff. poll_interval_seconds bounds how long a receive waits, so
+    shutdown and reconciliation are still checked while the chain is idle.
+
+    Args:
+        config: Configuration object (ws_url must be set)
+    """
+    logger.info("Starting indexer in subscription mode")
+    logger.info(f"Factory address: {config.factory_address}")
+
+    # Initialize components
+    eth_client = EthereumClient(config)
+    factory_indexer = FactoryIndexer(config, eth_client)
+    campaign_indexer = CampaignIndexer(config, eth_client)
+    reconciler = Reconciler(config)
+
+    delay = WS_RETRY_DELAY
+    while not _shutdown.is_set():
+        try:
+            with ws_connect(config.ws_url) as ws:
+                ws.send(jsonutil.dumps({"jsonrpc": "2.0", "id": 1, "method": "eth_subscribe", "params": ["newHeads"]}))
+                reply = jsonutil.loads(ws.recv(timeout=config.poll_interval_seconds * 5))
+                if "error" in reply:
+                    raise RuntimeError(f"eth_subscribe failed: {reply['error']}")
+                logger.info(f"Subscribed to newHeads at {config.ws_url}")
+                delay = WS_RETRY_DELAY
+
+                # Heads announced before the subscription are not replayed
+                sync_to_block(config, eth_client, factory_indexer, campaign_indexer, eth_client.get_latest_block())
+
+                while not _shutdown.is_set():
+                    try:
+                        message = jsonutil.loads(ws.recv(timeout=config.poll_interval_seconds))
+                    except TimeoutError:
+                        message = None
+
+                    if message and message.get("method") == "eth_subscription":
+                        head = int(message["params"]["result"]["number"], 16)
+                        latest_block = max(0, head - config.confirmations)
+                        sync_to_block(config, eth_client, factory_indexer, campaign_indexer, latest_block)
+
+                    # Periodic reconciliation
+                    if reconciler.should_reconcile():
+                        reconciler.reconcile()
+
+        except KeyboardInterrupt:
+            logger.info("Keyboard interrupt received")
+            break
+        except Exception as e:
+            if _shutdown.is_set():
+                break
+            logger.warning(f"newHeads subscription failed: {e}. Reconnecting in {delay:.1f}s...")
+            _shutdown.wait(delay)
+            delay = min(delay * 2, WS_MAX_RETRY_DELAY)
 
     logger.info("Indexer stopped")
 
@@ -228,7 +339,15 @@ def backfill(config: Config, from_block: int, to_block: int) -> None:
     campaign_indexer = CampaignIndexer(config, eth_client)
 
     # Index the range
-    index_block_range(config, factory_indexer, campaign_indexer, from_block, to_block)
+    index_block_range(
+        config,
+        eth_client,
+        factory_indexer,
+        campaign_indexer,
+        from_block,
+        to_block,
+        check_reorgs=False,  # Historical blocks are final
+    )
 
     logger.info("Backfill complete")
 
@@ -253,9 +372,8 @@ def show_status(config: Config) -> None:
         print(f"Last Block Hash: {sync_state.last_block_hash}")
 
         # Count campaigns
-        with get_session() as session:
-            from db.models import Campaign
-            campaign_count = session.query(Campaign).count()
+        with get_readonly_session() as session:
+            campaign_count = session.scalar(select(func.count()).select_from(Campaign))
             print(f"Total Campaigns: {campaign_count}")
 
     except Exception as e:
@@ -269,7 +387,7 @@ def main() -> None:
     subparsers = parser.add_subparsers(dest="command", help="Command to run")
 
     # Run command
-    run_parser = subparsers.add_parser("run", help="Start polling indexer")
+    run_parser = subparsers.add_parser("run", help="Start indexer (newHeads subscription if WS_URL is set, else polling)")
 
     # Backfill command
     backfill_parser = subparsers.add_parser("backfill", help="Backfill historical blocks")
@@ -288,7 +406,6 @@ def main() -> None:
     # Load config
     try:
         config = Config.from_env()
-        config.validate()
     except Exception as e:
         print(f"Configuration error: {e}", file=sys.stderr)
         sys.exit(1)
@@ -316,7 +433,10 @@ def main() -> None:
     # Execute command
     try:
         if args.command == "run":
-            run_indexer(config)
+            if config.ws_url:
+                run_indexer_subscribe(config)
+            else:
+                run_indexer(config)
         elif args.command == "backfill":
             backfill(config, args.from_block, args.to_block)
         elif args.command == "status":
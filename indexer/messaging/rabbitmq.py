@@ -2,7 +2,7 @@
 
 import json
 import time
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import pika
 from pika.adapters.blocking_connection import BlockingChannel
@@ -16,12 +16,29 @@ from messaging.routing import (
     DLX_QUEUE_NAME,
     QUEUE_BINDINGS,
     ALL_EVENT_QUEUES,
+    RETRY_EXCHANGE_NAME,
+    RETRY_QUEUE_NAME,
     get_queue_arguments,
+    get_retry_queue_arguments,
 )
 from messaging.schema import BaseMessage
 
 logger = get_logger(__name__)
 
+# Shared by every publish: JSON body, persistent delivery
+PERSISTENT_JSON_PROPERTIES = pika.BasicProperties(
+    content_type="application/json",
+    delivery_mode=2,  # Persistent
+)
+
+# Messages published per transaction commit in RabbitMQPublisher.publish_batch
+PUBLISH_BATCH_SIZE = 500
+
+# Pause before reconnecting after a failed publish; doubles with each consecutive
+# failure across messages and resets on the next successful publish
+PUBLISH_FAILURE_BASE_DELAY = 0.5
+PUBLISH_FAILURE_MAX_DELAY = 30.0
+
 
 class RabbitMQConnection:
     """RabbitMQ connection manager with automatic reconnection."""
@@ -108,9 +125,61 @@ class RabbitMQConnection:
 
     @property
     def channel(self) -> BlockingChannel:
-        """Get the channel, ensuring connection is established."""
+        """Get the channel, ensuring connection is established.
+
+        Used for every publish and ack, so an open channel is returned
+        after a single check (pika closes a connection's channels with it).
+        """
+        channel = self._channel
+        if channel is None or channel.is_closed:
+            self.ensure_connected()
+            channel = self._channel
+        return channel
+
+    def open_channel(self) -> BlockingChannel:
+        """Open an additional channel on this connection.
+
+        Returns:
+            New channel (closed along with the connection)
+        """
         self.ensure_connected()
-        return self._channel
+        return self._connection.channel()
+
+    def call_later(self, delay: float, callback: Callable[[], None]) -> Any:
+        """Schedule a callback on the connection's I/O loop.
+
+        The callback runs from within start_consuming / process_data_events.
+
+        Args:
+            delay: Delay in seconds
+            callback: Callable taking no arguments
+
+        Returns:
+            Timer handle for remove_timeout()
+        """
+        self.ensure_connected()
+        return self._connection.call_later(delay, callback)
+
+    def add_callback_threadsafe(self, callback: Callable[[], None]) -> None:
+        """Run a callback on the connection's I/O loop from another thread.
+
+        This is the only BlockingConnection method that is safe to call from a
+        thread other than the one that owns the connection.
+
+        Args:
+            callback: Callable taking no arguments
+        """
+        if self._connection is not None and self._connection.is_open:
+            self._connection.add_callback_threadsafe(callback)
+
+    def remove_timeout(self, timer: Any) -> None:
+        """Cancel a callback scheduled with call_later().
+
+        Args:
+            timer: Timer handle returned by call_later()
+        """
+        if self._connection is not None and self._connection.is_open:
+            self._connection.remove_timeout(timer)
 
     def close(self) -> None:
         """Close the connection."""
@@ -131,6 +200,7 @@ class RabbitMQConnection:
         - Dead letter exchange
         - All event queues with bindings
         - Dead letter queue
+        - Retry exchange and delayed-retry queue
         """
         channel = self.channel
         
@@ -162,6 +232,23 @@ class RabbitMQConnection:
         )
         logger.info(f"Declared DLQ: {DLX_QUEUE_NAME}")
         
+        # Declare retry exchange and queue (fanout keeps the original routing key)
+        channel.exchange_declare(
+            exchange=RETRY_EXCHANGE_NAME,
+            exchange_type="fanout",
+            durable=True,
+        )
+        channel.queue_declare(
+            queue=RETRY_QUEUE_NAME,
+            durable=True,
+            arguments=get_retry_queue_arguments(),
+        )
+        channel.queue_bind(
+            queue=RETRY_QUEUE_NAME,
+            exchange=RETRY_EXCHANGE_NAME,
+        )
+        logger.info(f"Declared retry queue: {RETRY_QUEUE_NAME}")
+        
         # Declare event queues and bind them
         queue_args = get_queue_arguments()
         
@@ -190,7 +277,7 @@ class RabbitMQConnection:
         channel = self.channel
         status = {}
         
-        for queue_name in ALL_EVENT_QUEUES + [DLX_QUEUE_NAME]:
+        for queue_name in ALL_EVENT_QUEUES + [RETRY_QUEUE_NAME, DLX_QUEUE_NAME]:
             try:
                 result = channel.queue_declare(queue=queue_name, passive=True)
                 status[queue_name] = {
@@ -230,14 +317,44 @@ class RabbitMQPublisher:
         """
         self.connection = connection
         self._confirm_delivery_enabled = False
+        self._confirm_channel: Optional[BlockingChannel] = None
+        self._tx_channel: Optional[BlockingChannel] = None
+        self._failure_streak = 0
 
     def enable_confirm_delivery(self) -> None:
         """Enable publisher confirms for reliable delivery."""
         if not self._confirm_delivery_enabled:
-            self.connection.channel.confirm_delivery()
             self._confirm_delivery_enabled = True
+            self._publish_channel()
             logger.info("Publisher confirms enabled")
 
+    def _publish_channel(self) -> BlockingChannel:
+        """Get the channel for single publishes.
+
+        A reconnect replaces the connection's channel, so confirm mode is
+        re-enabled whenever the channel changes.
+
+        Returns:
+            Connection channel, in confirm mode if confirms are enabled
+        """
+        channel = self.connection.channel
+        if self._confirm_delivery_enabled and channel is not self._confirm_channel:
+            channel.confirm_delivery()
+            self._confirm_channel = channel
+        return channel
+
+    def _recover_from_failure(self) -> None:
+        """Back off, then reconnect after a failed publish.
+
+        The delay grows with consecutive failures across calls, so a run
+        of messages against an unavailable broker does not reconnect at
+        full speed once per message.
+        """
+        delay = min(PUBLISH_FAILURE_BASE_DELAY * 2 ** self._failure_streak, PUBLISH_FAILURE_MAX_DELAY)
+        self._failure_streak += 1
+        time.sleep(delay)
+        self.connection.connect()
+
     def publish(
         self,
         message: BaseMessage,
@@ -256,35 +373,88 @@ class RabbitMQPublisher:
         Returns:
             True if message was published successfully
         """
-        body = message.model_dump_json()
-        properties = pika.BasicProperties(
-            content_type="application/json",
-            delivery_mode=2,  # Persistent
-        )
-        
+        body = message.to_bytes()
+
         max_attempts = 3 if retry_on_failure else 1
         
         for attempt in range(max_attempts):
             try:
-                self.connection.ensure_connected()
-                self.connection.channel.basic_publish(
+                self._publish_channel().basic_publish(
                     exchange=exchange,
                     routing_key=routing_key,
                     body=body,
-                    properties=properties,
+                    properties=PERSISTENT_JSON_PROPERTIES,
                 )
+                self._failure_streak = 0
                 logger.debug(f"Published message to {routing_key}: {message.message_type}")
                 return True
             except (AMQPConnectionError, AMQPChannelError) as e:
                 logger.warning(f"Publish failed (attempt {attempt + 1}): {e}")
                 if attempt < max_attempts - 1:
-                    self.connection.connect()
+                    self._recover_from_failure()
                 else:
                     logger.error(f"Failed to publish message after {max_attempts} attempts")
                     return False
         
         return False
 
+    def publish_batch(
+        self,
+        messages: List[Tuple[BaseMessage, str]],
+        exchange: str = EXCHANGE_NAME,
+        retry_on_failure: bool = True,
+    ) -> int:
+        """Publish many messages with one broker round-trip per chunk.
+
+        With a blocking connection, confirm mode waits for the broker ack
+        of every single publish. Batches therefore go through a separate
+        transactional channel instead: up to PUBLISH_BATCH_SIZE messages
+        are written back to back and a single tx_commit makes them all
+        durable. A chunk that fails is published again as a whole, so its
+        messages may be delivered twice; consumers are idempotent on
+        (tx_hash, log_index).
+
+        Args:
+            messages: (message, routing_key) pairs, published in order
+            exchange: Exchange to publish to
+            retry_on_failure: Whether to retry a chunk on publish failure
+
+        Returns:
+            Number of messages committed (stops at the first failed chunk)
+        """
+        bodies = [(routing_key, message.to_bytes()) for message, routing_key in messages]
+        max_attempts = 3 if retry_on_failure else 1
+        published = 0
+
+        for start in range(0, len(bodies), PUBLISH_BATCH_SIZE):
+            chunk = bodies[start : start + PUBLISH_BATCH_SIZE]
+            for attempt in range(max_attempts):
+                try:
+                    if self._tx_channel is None or self._tx_channel.is_closed:
+                        self._tx_channel = self.connection.open_channel()
+                        self._tx_channel.tx_select()
+                    for routing_key, body in chunk:
+                        self._tx_channel.basic_publish(
+                            exchange=exchange,
+                            routing_key=routing_key,
+                            body=body,
+                            properties=PERSISTENT_JSON_PROPERTIES,
+                        )
+                    self._tx_channel.tx_commit()
+                    self._failure_streak = 0
+                    published += len(chunk)
+                    break
+                except (AMQPConnectionError, AMQPChannelError) as e:
+                    self._tx_channel = None
+                    logger.warning(f"Batch publish failed (attempt {attempt + 1}): {e}")
+                    if attempt < max_attempts - 1:
+                        self._recover_from_failure()
+                    else:
+                        logger.error(f"Failed to publish batch after {max_attempts} attempts")
+                        return published
+
+        return published
+
     def publish_event(self, message: "EventMessage") -> bool:
         """Publish an event message with automatic routing.
         
@@ -305,18 +475,29 @@ class RabbitMQConsumer:
         self,
         connection: RabbitMQConnection,
         prefetch_count: int = 10,
+        ack_batch_size: int = 1,
+        ack_flush_interval: float = 0.05,
     ):
         """Initialize consumer.
         
         Args:
             connection: RabbitMQ connection instance
             prefetch_count: Number of messages to prefetch
+            ack_batch_size: Acks coalesced into one multi-ack by maybe_ack()
+            ack_flush_interval: Max seconds a partial ack batch waits
         """
         self.connection = connection
         self.prefetch_count = prefetch_count
+        self.ack_batch_size = ack_batch_size
+        self.ack_flush_interval = ack_flush_interval
         self._consuming = False
         self._handlers: Dict[str, Callable] = {}
 
+        # Cumulative acks: last settled tag not yet acked, flushed by size or timer
+        self._pending_ack_tag: Optional[int] = None
+        self._pending_ack_count = 0
+        self._ack_timer = None
+
     def setup(self) -> None:
         """Set up the consumer channel."""
         self.connection.ensure_connected()
@@ -377,6 +558,51 @@ class RabbitMQConsumer:
         """
         self.connection.channel.basic_ack(delivery_tag=delivery_tag)
 
+    def maybe_ack(self, delivery_tag: int) -> None:
+        """Queue an acknowledgement, sending a multi-ack once the batch is full.
+
+        Tags must be queued in delivery order, and any delivery that will not
+        be acked (nack/reject) must be preceded by flush_acks() so the
+        multi-ack cannot cover it.
+
+        Args:
+            delivery_tag: Delivery tag of the processed message
+        """
+        self._pending_ack_tag = delivery_tag
+        self._pending_ack_count += 1
+
+        if self._pending_ack_count >= self.ack_batch_size:
+            self.flush_acks()
+        elif self._ack_timer is None:
+            self._ack_timer = self.connection.call_later(self.ack_flush_interval, self._on_ack_timer)
+
+    def ack_up_to(self, delivery_tag: int) -> None:
+        """Acknowledge every outstanding delivery up to and including a tag.
+
+        Args:
+            delivery_tag: Delivery tag of the newest message to acknowledge
+        """
+        self._pending_ack_tag = delivery_tag
+        self.flush_acks()
+
+    def flush_acks(self) -> None:
+        """Send the pending multi-ack, if any (call before shutdown)."""
+        if self._ack_timer is not None:
+            self.connection.remove_timeout(self._ack_timer)
+            self._ack_timer = None
+
+        if self._pending_ack_tag is None:
+            return
+
+        self.connection.channel.basic_ack(delivery_tag=self._pending_ack_tag, multiple=True)
+        self._pending_ack_tag = None
+        self._pending_ack_count = 0
+
+    def _on_ack_timer(self) -> None:
+        """Flush a partial batch so acknowledgement latency stays bounded."""
+        self._ack_timer = None
+        self.flush_acks()
+
     def nack(self, delivery_tag: int, requeue: bool = True) -> None:
         """Negative acknowledge a message.
         
@@ -1,7 +1,8 @@
 """Routing key constants and helpers for RabbitMQ."""
 
 from enum import Enum
-from typing import Dict, List, Tuple
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Tuple
 
 
 # Exchange configuration
@@ -12,6 +13,12 @@ EXCHANGE_TYPE = "topic"
 DLX_EXCHANGE_NAME = "blockchain_events.dlx"
 DLX_QUEUE_NAME = "dlq.events"
 
+# Delayed retry: messages wait out the TTL in the retry queue, then dead-letter
+# back to the main exchange under their original routing key
+RETRY_EXCHANGE_NAME = "blockchain_events.retry"
+RETRY_QUEUE_NAME = "queue.retry"
+RETRY_DELAY_MS = 1000
+
 
 class RoutingKey(str, Enum):
     """Routing key enumeration."""
@@ -61,6 +68,16 @@ QUEUE_MESSAGE_TTL = 604800000  # 7 days in milliseconds
 QUEUE_MAX_LENGTH = 100000
 
 
+# Event type -> routing key, built once (looked up for every published event);
+# read-only because every caller shares it
+EVENT_ROUTING_KEYS: Mapping[str, str] = MappingProxyType({
+    "CampaignCreated": RoutingKey.CAMPAIGN_CREATED.value,
+    "DonationReceived": RoutingKey.DONATION_RECEIVED.value,
+    "Withdrawn": RoutingKey.WITHDRAWN.value,
+    "Refunded": RoutingKey.REFUNDED.value,
+})
+
+
 def get_routing_key_for_event(event_type: str) -> str:
     """Get the routing key for a given event type.
     
@@ -70,13 +87,7 @@ def get_routing_key_for_event(event_type: str) -> str:
     Returns:
         Routing key string
     """
-    routing_map = {
-        "CampaignCreated": RoutingKey.CAMPAIGN_CREATED.value,
-        "DonationReceived": RoutingKey.DONATION_RECEIVED.value,
-        "Withdrawn": RoutingKey.WITHDRAWN.value,
-        "Refunded": RoutingKey.REFUNDED.value,
-    }
-    return routing_map.get(event_type, "event.unknown")
+    return EVENT_ROUTING_KEYS.get(event_type, "event.unknown")
 
 
 def get_queue_arguments() -> Dict:
@@ -91,3 +102,15 @@ def get_queue_arguments() -> Dict:
         "x-dead-letter-exchange": DLX_EXCHANGE_NAME,
         "x-dead-letter-routing-key": "dlq",
     }
+
+
+def get_retry_queue_arguments() -> Dict:
+    """Get queue arguments for the delayed-retry queue.
+
+    Returns:
+        Dictionary of queue arguments
+    """
+    return {
+        "x-message-ttl": RETRY_DELAY_MS,
+        "x-dead-letter-exchange": EXCHANGE_NAME,
+    }
@@ -2,9 +2,16 @@
 
 from datetime import datetime, timezone
 from enum import Enum
-from typing import Any, Dict, Literal, Optional
+from functools import partial
+from typing import Annotated, Any, Dict, Literal, Optional, Union
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, PrivateAttr, StringConstraints, TypeAdapter
+
+from messaging.routing import EVENT_ROUTING_KEYS
+
+
+# Hex string lowercased during validation inside pydantic-core (no Python callback)
+LowerHex = Annotated[str, StringConstraints(to_lower=True)]
 
 
 class MessageType(str, Enum):
@@ -24,13 +31,24 @@ class EventType(str, Enum):
 
 class BaseMessage(BaseModel):
     """Base message model with common fields."""
-    published_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    published_at: datetime = Field(default_factory=partial(datetime.now, timezone.utc))
+    _json: Optional[bytes] = PrivateAttr(default=None)
+
+    def to_bytes(self) -> bytes:
+        """Serialize the message to JSON bytes, once per instance.
+
+        Retries and repeated publishes of the same message reuse the first
+        encoding, so a message must not be modified after it is published.
 
-    class Config:
-        """Pydantic config."""
-        json_encoders = {
-            datetime: lambda v: v.isoformat(),
-        }
+        Returns:
+            UTF-8 JSON message body
+        """
+        if self._json is None:
+            # pydantic-core's serializer emits bytes directly, skipping the
+            # str round trip of model_dump_json(); unlike orjson it also
+            # encodes wei amounts beyond 64 bits
+            self._json = self.__pydantic_serializer__.to_json(self)
+        return self._json
 
 
 class EventMessage(BaseMessage):
@@ -52,28 +70,17 @@ class EventMessage(BaseMessage):
     event_type: Literal["CampaignCreated", "DonationReceived", "Withdrawn", "Refunded"]
     chain_id: int
     block_number: int
-    block_hash: str
-    tx_hash: str
+    block_hash: LowerHex
+    tx_hash: LowerHex
     log_index: int
-    address: str
+    address: LowerHex
     timestamp: int
     event_data: Dict[str, Any]
 
-    @field_validator("address", "tx_hash", "block_hash")
-    @classmethod
-    def lowercase_hex(cls, v: str) -> str:
-        """Ensure hex strings are lowercase."""
-        return v.lower() if v else v
-
     def to_routing_key(self) -> str:
         """Get the routing key for this event."""
-        event_routing_map = {
-            "CampaignCreated": "event.campaign_created",
-            "DonationReceived": "event.donation_received",
-            "Withdrawn": "event.withdrawn",
-            "Refunded": "event.refunded",
-        }
-        return event_routing_map.get(self.event_type, "event.unknown")
+        # event_type is a validated Literal, so the key is always present
+        return EVENT_ROUTING_KEYS[self.event_type]
 
 
 class RollbackMessage(BaseMessage):
@@ -106,6 +113,15 @@ class ReconciliationMessage(BaseMessage):
     reconciliation_type: str = "mark_expired_campaigns"
 
 
+# Dispatch on message_type happens inside pydantic-core, not in Python
+_MESSAGE_ADAPTER: TypeAdapter[Union[EventMessage, RollbackMessage, ReconciliationMessage]] = TypeAdapter(
+    Annotated[
+        Union[EventMessage, RollbackMessage, ReconciliationMessage],
+        Field(discriminator="message_type"),
+    ]
+)
+
+
 def parse_message(data: Dict[str, Any]) -> BaseMessage:
     """Parse a message dictionary into the appropriate message type.
     
@@ -116,15 +132,7 @@ def parse_message(data: Dict[str, Any]) -> BaseMessage:
         Parsed message object
         
     Raises:
-        ValueError: If message type is unknown
+        ValueError: If message type is unknown or the message is invalid
+            (pydantic.ValidationError is a ValueError)
     """
-    message_type = data.get("message_type")
-    
-    if message_type == "event":
-        return EventMessage(**data)
-    elif message_type == "rollback":
-        return RollbackMessage(**data)
-    elif message_type == "reconciliation":
-        return ReconciliationMessage(**data)
-    else:
-        raise ValueError(f"Unknown message type: {message_type}")
+    return _MESSAGE_ADAPTER.validate_python(data)
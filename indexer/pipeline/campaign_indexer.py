@@ -1,17 +1,20 @@
 """Campaign indexer - indexes Campaign contract events."""
 
-from typing import List, Set
+from contextlib import nullcontext
+from datetime import datetime
+from typing import Optional, Set, Tuple
 
-from web3.types import LogReceipt
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
 
 from config import Config
 from db.models import Campaign
-from db.session import get_session
+from db.session import get_readonly_session, get_session
 from eth.client import EthereumClient
 from eth.decoder import decode_campaign_event
 from eth.topics import get_all_campaign_topics
 from log import get_logger
-from services.state_updater import apply_event_state_update, insert_event
+from services.state_updater import store_events
 
 logger = get_logger(__name__)
 
@@ -28,32 +31,52 @@ class CampaignIndexer:
         """
         self.config = config
         self.eth_client = eth_client
+        # (newest created_at, addresses) from the last lookup
+        self._known_addresses: Optional[Tuple[Optional[datetime], Set[str]]] = None
 
-    def get_known_campaign_addresses(self) -> Set[str]:
+    def get_known_campaign_addresses(self, session: Optional[Session] = None) -> Set[str]:
         """Get all known campaign addresses from database.
 
+        Args:
+            session: Session to read in, so campaigns it has not committed yet
+                are included (default: own read-only session)
+
         Returns:
-            Set of campaign addresses (lowercase)
+            Set of campaign addresses (lowercase); cached between calls, do not modify
         """
-        with get_session() as session:
-            campaigns = session.query(Campaign).all()
-            addresses = {c.address.lower() for c in campaigns}
+        with (nullcontext(session) if session is not None else get_readonly_session()) as session:
+            session.flush()
+            # Campaigns are never deleted, so the newest created_at (one read of
+            # campaigns_created_at_idx) changes exactly when campaigns are added
+            stamp = session.scalar(select(func.max(Campaign.created_at)))
+            if self._known_addresses is not None and self._known_addresses[0] == stamp:
+                return self._known_addresses[1]
+
+            addresses = set(session.scalars(select(Campaign.address)))
+            self._known_addresses = (stamp, addresses)
             logger.debug(f"Found {len(addresses)} known campaigns in database")
             return addresses
 
-    def index_block_range(self, from_block: int, to_block: int, campaign_addresses: Set[str] = None) -> int:
+    def index_block_range(
+        self,
+        from_block: int,
+        to_block: int,
+        campaign_addresses: Set[str] = None,
+        session: Optional[Session] = None,
+    ) -> int:
         """Index Campaign events in a block range.
 
         Args:
             from_block: Starting block number
             to_block: Ending block number (inclusive)
             campaign_addresses: Set of campaign addresses to index (None = all known)
+            session: Session to write in, committed by the caller (default: own transaction)
 
         Returns:
             Number of events indexed
         """
         if campaign_addresses is None:
-            campaign_addresses = self.get_known_campaign_addresses()
+            campaign_addresses = self.get_known_campaign_addresses(session)
 
         if not campaign_addresses:
             logger.debug("No known campaigns to index")
@@ -67,29 +90,11 @@ class CampaignIndexer:
         # Get all campaign event topics
         topics = get_all_campaign_topics()
 
-        # Fetch logs for all campaigns (batch by address if many)
-        all_logs: List[LogReceipt] = []
-        
-        # Process in batches if many campaigns
-        batch_size = 50
-        campaign_list = list(campaign_addresses)
-        
-        for i in range(0, len(campaign_list), batch_size):
-            batch = campaign_list[i : i + batch_size]
-            for address in batch:
-                try:
-                    # Fetch logs for each event type separately
-                    # Web3.py doesn't support OR for first topic easily, so we fetch each topic
-                    for topic in topics:
-                        logs = self.eth_client.get_logs(
-                            address=address,
-                            from_block=from_block,
-                            to_block=to_block,
-                            topics=[topic],  # Filter by specific event topic
-                        )
-                        all_logs.extend(logs)
-                except Exception as e:
-                    logger.warning(f"Error fetching logs for campaign {address}: {e}")
+        # One filter for every campaign and event type (topic0 ORed). Errors
+        # propagate so the batch is retried rather than recorded as indexed
+        all_logs = self.eth_client.get_logs_for_addresses(
+            campaign_addresses, from_block, to_block, topics=[topics]
+        )
 
         if not all_logs:
             logger.debug(f"No Campaign events found in blocks {from_block}-{to_block}")
@@ -97,53 +102,31 @@ class CampaignIndexer:
 
         logger.info(f"Found {len(all_logs)} Campaign events in blocks {from_block}-{to_block}")
 
-        # Process events in a transaction
-        events_indexed = 0
-        with get_session() as session:
-            for log in all_logs:
-                try:
-                    # Decode event
-                    decoded = decode_campaign_event(log)
-                    if not decoded:
-                        logger.warning(f"Failed to decode Campaign event: {log['transactionHash'].hex()}")
-                        continue
-
-                    # Get block hash
-                    block_hash = self.eth_client.get_block_hash(log["blockNumber"])
-
-                    # Insert event (idempotent)
-                    event_inserted = insert_event(
-                        session=session,
-                        chain_id=self.config.chain_id,
-                        tx_hash=decoded["tx_hash"],
-                        log_index=decoded["log_index"],
-                        block_number=decoded["block_number"],
-                        block_hash=block_hash,
-                        address=decoded["address"],
-                        event_name=decoded["event_name"],
-                        event_data=decoded,
-                    )
-
-                    if event_inserted:
-                        # Apply state update
-                        apply_event_state_update(
-                            session=session,
-                            chain_id=self.config.chain_id,
-                            event_name=decoded["event_name"],
-                            event_data=decoded,
-                            block_number=decoded["block_number"],
-                            block_hash=block_hash,
-                            tx_hash=decoded["tx_hash"],
-                            log_index=decoded["log_index"],
-                        )
-                        events_indexed += 1
-                        logger.debug(
-                            f"Indexed {decoded['event_name']}: campaign={decoded['address']}"
-                        )
-
-                except Exception as e:
-                    logger.error(f"Error processing Campaign event: {e}", exc_info=True)
-                    # Continue with next event
+        # Logs carry their blockHash; only blocks of logs without one are fetched
+        block_hashes = self.eth_client.get_log_block_hashes(all_logs)
+
+        # Decode events
+        events = []
+        for log in all_logs:
+            try:
+                decoded = decode_campaign_event(log)
+                if not decoded:
+                    logger.warning("Failed to decode Campaign event: %s", log["transactionHash"].hex())
+                    continue
+
+                events.append((decoded, block_hashes[log["blockNumber"]]))
+
+            except Exception as e:
+                logger.error(f"Error processing Campaign event: {e}", exc_info=True)
+                # Continue with next event
+
+        # Insert events (idempotent) and apply state updates in a transaction
+        with (nullcontext(session) if session is not None else get_session()) as session:
+            indexed = store_events(session, self.config.chain_id, events)
+
+        for decoded in indexed:
+            logger.debug("Indexed %s: campaign=%s", decoded["event_name"], decoded["address"])
+        events_indexed = len(indexed)
 
         logger.info(f"Indexed {events_indexed} Campaign events from blocks {from_block}-{to_block}")
         return events_indexed
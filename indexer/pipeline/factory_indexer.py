@@ -1,7 +1,10 @@
 """Factory indexer - indexes CampaignCreated events from Factory contract."""
 
-from typing import List
+import logging
+from contextlib import nullcontext
+from typing import List, Optional
 
+from sqlalchemy.orm import Session
 from web3.types import LogReceipt
 
 from config import Config
@@ -10,7 +13,7 @@ from eth.client import EthereumClient
 from eth.decoder import decode_factory_event
 from eth.topics import get_campaign_created_topic
 from log import get_logger
-from services.state_updater import apply_event_state_update, insert_event
+from services.state_updater import store_events
 
 logger = get_logger(__name__)
 
@@ -29,12 +32,13 @@ class FactoryIndexer:
         self.eth_client = eth_client
         self.factory_address = config.factory_address.lower()
 
-    def index_block_range(self, from_block: int, to_block: int) -> int:
+    def index_block_range(self, from_block: int, to_block: int, session: Optional[Session] = None) -> int:
         """Index CampaignCreated events in a block range.
 
         Args:
             from_block: Starting block number
             to_block: Ending block number (inclusive)
+            session: Session to write in, committed by the caller (default: own transaction)
 
         Returns:
             Number of events indexed
@@ -45,7 +49,7 @@ class FactoryIndexer:
         # Get logs for CampaignCreated events
         topic = get_campaign_created_topic()
         logger.debug(f"Looking for CampaignCreated topic: {topic}")
-        logs = self.eth_client.get_logs(
+        logs = self.eth_client.get_logs_parallel(
             address=self.factory_address,
             from_block=from_block,
             to_block=to_block,
@@ -58,60 +62,40 @@ class FactoryIndexer:
 
         logger.info(f"Found {len(logs)} Factory events in blocks {from_block}-{to_block}")
 
-        # Process events in a transaction
-        events_indexed = 0
-        with get_session() as session:
-            for log in logs:
-                try:
-                    logger.debug(f"Processing log: tx={log['transactionHash'].hex()}, address={log['address']}, topics={[t.hex() if hasattr(t, 'hex') else t for t in log.get('topics', [])]}")
-                    
-                    # Decode event
-                    decoded = decode_factory_event(log)
-                    if not decoded:
-                        logger.warning(f"Failed to decode Factory event: tx={log['transactionHash'].hex()}, address={log['address']}, topics={[t.hex() if hasattr(t, 'hex') else t for t in log.get('topics', [])]}")
-                        continue
-                    
-                    logger.debug(f"Decoded event: {decoded['event_name']}, args={decoded['args']}")
-
-                    # Get block hash
-                    block_hash = self.eth_client.get_block_hash(log["blockNumber"])
-
-                    # Insert event (idempotent)
-                    event_inserted = insert_event(
-                        session=session,
-                        chain_id=self.config.chain_id,
-                        tx_hash=decoded["tx_hash"],
-                        log_index=decoded["log_index"],
-                        block_number=decoded["block_number"],
-                        block_hash=block_hash,
-                        address=decoded["address"],
-                        event_name=decoded["event_name"],
-                        event_data=decoded,
-                    )
-
-                    if event_inserted:
-                        logger.debug(f"Event inserted, applying state update for {decoded['event_name']}")
-                        # Apply state update
-                        apply_event_state_update(
-                            session=session,
-                            chain_id=self.config.chain_id,
-                            event_name=decoded["event_name"],
-                            event_data=decoded,
-                            block_number=decoded["block_number"],
-                            block_hash=block_hash,
-                            tx_hash=decoded["tx_hash"],
-                            log_index=decoded["log_index"],
+        # Logs carry their blockHash; only blocks of logs without one are fetched
+        block_hashes = self.eth_client.get_log_block_hashes(logs)
+
+        # Decode events
+        events = []
+        for log in logs:
+            try:
+                decoded = decode_factory_event(log)
+                if not decoded:
+                    if logger.isEnabledFor(logging.WARNING):
+                        logger.warning(
+                            "Failed to decode Factory event: tx=%s, address=%s, topics=%s",
+                            log["transactionHash"].hex(),
+                            log["address"],
+                            [t.hex() if hasattr(t, "hex") else t for t in log.get("topics", ())],
                         )
-                        events_indexed += 1
-                        logger.info(
-                            f"✅ Indexed {decoded['event_name']}: campaign={decoded['args'].get('campaign', 'N/A')}"
-                        )
-                    else:
-                        logger.debug(f"Event already exists (idempotent): tx={decoded['tx_hash']}, log_index={decoded['log_index']}")
+                    continue
+
+                logger.debug("Decoded event: %s, args=%s", decoded["event_name"], decoded["args"])
+                events.append((decoded, block_hashes[log["blockNumber"]]))
+
+            except Exception as e:
+                logger.error(f"Error processing Factory event: {e}", exc_info=True)
+                # Continue with next event
+
+        # Insert events (idempotent) and apply state updates in a transaction
+        with (nullcontext(session) if session is not None else get_session()) as session:
+            indexed = store_events(session, self.config.chain_id, events)
 
-                except Exception as e:
-                    logger.error(f"Error processing Factory event: {e}", exc_info=True)
-                    # Continue with next event
+        for decoded in indexed:
+            logger.info(
+                f"✅ Indexed {decoded['event_name']}: campaign={decoded['args'].get('campaign', 'N/A')}"
+            )
+        events_indexed = len(indexed)
 
         logger.info(f"Indexed {events_indexed} Factory events from blocks {from_block}-{to_block}")
         return events_indexed
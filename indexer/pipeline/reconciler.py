@@ -2,6 +2,8 @@
 
 import time
 
+from sqlalchemy import update
+
 from config import Config
 from db.models import Campaign
 from db.session import get_session
@@ -50,31 +52,27 @@ class Reconciler:
         logger.debug("Running campaign reconciliation")
 
         now_ts = int(time.time())
-        updated_count = 0
 
         with get_session() as session:
-            # Find expired active campaigns that haven't met goal
-            campaigns = (
-                session.query(Campaign)
-                .filter(
+            # Mark expired active campaigns that haven't met goal in one UPDATE
+            stmt = (
+                update(Campaign)
+                .where(
                     Campaign.status == "ACTIVE",
                     Campaign.deadline_ts < now_ts,
                     Campaign.total_raised_wei < Campaign.goal_wei,
                     Campaign.withdrawn == False,
                 )
-                .all()
+                .values(status="FAILED")
+                .returning(Campaign.address)
+                .execution_options(synchronize_session=False)
             )
+            marked = session.execute(stmt).scalars().all()
 
-            for campaign in campaigns:
-                campaign.status = "FAILED"
-                updated_count += 1
-                logger.info(
-                    f"Marked campaign {campaign.address} as FAILED: "
-                    f"deadline passed, goal not met"
-                )
-
-        if updated_count > 0:
-            logger.info(f"Reconciliation: updated {updated_count} campaigns to FAILED")
+        for address in marked:
+            logger.info(f"Marked campaign {address} as FAILED: deadline passed, goal not met")
 
-        return updated_count
+        if marked:
+            logger.info(f"Reconciliation: updated {len(marked)} campaigns to FAILED")
 
+        return len(marked)
@@ -1,12 +1,13 @@
 """Campaign indexer for producer - fetches Campaign events and publishes to RabbitMQ."""
 
-from typing import List, Set
+from datetime import datetime
+from typing import Optional, Set, Tuple
 
-from web3.types import LogReceipt
+from sqlalchemy import func, select
 
 from config import Config
 from db.models import Campaign
-from db.session import get_session
+from db.session import get_readonly_session
 from eth.client import EthereumClient
 from eth.decoder import decode_campaign_event
 from eth.topics import get_all_campaign_topics
@@ -35,16 +36,24 @@ class ProducerCampaignIndexer:
         self.config = config
         self.eth_client = eth_client
         self.publisher = publisher
+        # (newest created_at, addresses) from the last lookup
+        self._known_addresses: Optional[Tuple[Optional[datetime], Set[str]]] = None
 
     def get_known_campaign_addresses(self) -> Set[str]:
         """Get all known campaign addresses from database.
 
         Returns:
-            Set of campaign addresses (lowercase)
+            Set of campaign addresses (lowercase); cached between calls, do not modify
         """
-        with get_session() as session:
-            campaigns = session.query(Campaign).all()
-            addresses = {c.address.lower() for c in campaigns}
+        with get_readonly_session() as session:
+            # Campaigns are never deleted, so the newest created_at (one read of
+            # campaigns_created_at_idx) changes exactly when campaigns are added
+            stamp = session.scalar(select(func.max(Campaign.created_at)))
+            if self._known_addresses is not None and self._known_addresses[0] == stamp:
+                return self._known_addresses[1]
+
+            addresses = set(session.scalars(select(Campaign.address)))
+            self._known_addresses = (stamp, addresses)
             logger.debug(f"Found {len(addresses)} known campaigns in database")
             return addresses
 
@@ -79,26 +88,11 @@ class ProducerCampaignIndexer:
         # Get all campaign event topics
         topics = get_all_campaign_topics()
 
-        # Fetch logs for all campaigns
-        all_logs: List[LogReceipt] = []
-        batch_size = 50
-        campaign_list = list(campaign_addresses)
-
-        for i in range(0, len(campaign_list), batch_size):
-            batch = campaign_list[i : i + batch_size]
-            for address in batch:
-                try:
-                    # Fetch logs for each event type separately
-                    for topic in topics:
-                        logs = self.eth_client.get_logs(
-                            address=address,
-                            from_block=from_block,
-                            to_block=to_block,
-                            topics=[topic],
-                        )
-                        all_logs.extend(logs)
-                except Exception as e:
-                    logger.warning(f"Error fetching logs for campaign {address}: {e}")
+        # One filter for every campaign and event type (topic0 ORed). Errors
+        # propagate so the batch is retried rather than recorded as indexed
+        all_logs = self.eth_client.get_logs_for_addresses(
+            campaign_addresses, from_block, to_block, topics=[topics]
+        )
 
         if not all_logs:
             logger.debug(f"No Campaign events found in blocks {from_block}-{to_block}")
@@ -106,44 +100,43 @@ class ProducerCampaignIndexer:
 
         logger.info(f"Found {len(all_logs)} Campaign events in blocks {from_block}-{to_block}")
 
-        # Process and publish events
-        events_published = 0
+        # One batched RPC round-trip for all blocks instead of one per log
+        blocks = self.eth_client.get_blocks(log["blockNumber"] for log in all_logs)
+
+        # Decode events, then publish them as one burst
+        events = []
         for log in all_logs:
             try:
                 # Decode event
                 decoded = decode_campaign_event(log)
                 if not decoded:
-                    logger.warning(
-                        f"Failed to decode Campaign event: {log['transactionHash'].hex()}"
-                    )
+                    logger.warning("Failed to decode Campaign event: %s", log["transactionHash"].hex())
                     continue
 
-                # Get block info for timestamp
-                block = self.eth_client.get_block(log["blockNumber"])
+                # Block info for hash and timestamp
+                block = blocks[log["blockNumber"]]
                 block_hash = block["hash"].hex() if hasattr(block["hash"], "hex") else block["hash"]
                 timestamp = block.get("timestamp", 0)
 
-                # Publish to RabbitMQ
-                success = self.publisher.publish_event(
-                    event_type=decoded["event_name"],
-                    chain_id=self.config.chain_id,
-                    block_number=decoded["block_number"],
-                    block_hash=block_hash,
-                    tx_hash=decoded["tx_hash"],
-                    log_index=decoded["log_index"],
-                    address=decoded["address"],
-                    timestamp=timestamp,
-                    event_data=decoded["args"],
+                events.append(
+                    {
+                        "event_type": decoded["event_name"],
+                        "chain_id": self.config.chain_id,
+                        "block_number": decoded["block_number"],
+                        "block_hash": block_hash,
+                        "tx_hash": decoded["tx_hash"],
+                        "log_index": decoded["log_index"],
+                        "address": decoded["address"],
+                        "timestamp": timestamp,
+                        "event_data": decoded["args"],
+                    }
                 )
 
-                if success:
-                    events_published += 1
-                    logger.debug(
-                        f"Published {decoded['event_name']}: campaign={decoded['address']}"
-                    )
-
             except Exception as e:
                 logger.error(f"Error processing Campaign event: {e}", exc_info=True)
 
+        # Publish to RabbitMQ
+        events_published = self.publisher.publish_events(events)
+
         logger.info(f"Published {events_published} Campaign events from blocks {from_block}-{to_block}")
         return events_published
@@ -1,10 +1,11 @@
 """Factory indexer for producer - fetches CampaignCreated events and publishes to RabbitMQ."""
 
-from typing import List
+from typing import List, Optional, Set
 
 from web3.types import LogReceipt
 
 from config import Config
+from eth.address import canonical_address
 from eth.client import EthereumClient
 from eth.decoder import decode_factory_event
 from eth.topics import get_campaign_created_topic
@@ -35,12 +36,19 @@ class ProducerFactoryIndexer:
         self.publisher = publisher
         self.factory_address = config.factory_address.lower()
 
-    def index_block_range(self, from_block: int, to_block: int) -> int:
+    def index_block_range(
+        self,
+        from_block: int,
+        to_block: int,
+        created_campaigns: Optional[Set[str]] = None,
+    ) -> int:
         """Fetch CampaignCreated events and publish to RabbitMQ.
 
         Args:
             from_block: Starting block number
             to_block: Ending block number (inclusive)
+            created_campaigns: If given, addresses of the published campaigns
+                are added to it (lowercase)
 
         Returns:
             Number of events published
@@ -52,7 +60,7 @@ class ProducerFactoryIndexer:
         topic = get_campaign_created_topic()
         logger.debug(f"Looking for CampaignCreated topic: {topic}")
         
-        logs = self.eth_client.get_logs(
+        logs = self.eth_client.get_logs_parallel(
             address=self.factory_address,
             from_block=from_block,
             to_block=to_block,
@@ -65,47 +73,55 @@ class ProducerFactoryIndexer:
 
         logger.info(f"Found {len(logs)} Factory events in blocks {from_block}-{to_block}")
 
-        # Process and publish events
-        events_published = 0
+        # One batched RPC round-trip for all blocks instead of one per log
+        blocks = self.eth_client.get_blocks(log["blockNumber"] for log in logs)
+
+        # Decode events, then publish them as one burst
+        events = []
         for log in logs:
             try:
                 # Decode event
                 decoded = decode_factory_event(log)
                 if not decoded:
-                    logger.warning(
-                        f"Failed to decode Factory event: tx={log['transactionHash'].hex()}"
-                    )
+                    logger.warning("Failed to decode Factory event: tx=%s", log["transactionHash"].hex())
                     continue
 
-                logger.debug(f"Decoded event: {decoded['event_name']}, args={decoded['args']}")
+                logger.debug("Decoded event: %s, args=%s", decoded["event_name"], decoded["args"])
 
-                # Get block info for timestamp
-                block = self.eth_client.get_block(log["blockNumber"])
+                # Block info for hash and timestamp
+                block = blocks[log["blockNumber"]]
                 block_hash = block["hash"].hex() if hasattr(block["hash"], "hex") else block["hash"]
                 timestamp = block.get("timestamp", 0)
 
-                # Publish to RabbitMQ
-                success = self.publisher.publish_event(
-                    event_type=decoded["event_name"],
-                    chain_id=self.config.chain_id,
-                    block_number=decoded["block_number"],
-                    block_hash=block_hash,
-                    tx_hash=decoded["tx_hash"],
-                    log_index=decoded["log_index"],
-                    address=decoded["address"],
-                    timestamp=timestamp,
-                    event_data=decoded["args"],
+                events.append(
+                    {
+                        "event_type": decoded["event_name"],
+                        "chain_id": self.config.chain_id,
+                        "block_number": decoded["block_number"],
+                        "block_hash": block_hash,
+                        "tx_hash": decoded["tx_hash"],
+                        "log_index": decoded["log_index"],
+                        "address": decoded["address"],
+                        "timestamp": timestamp,
+                        "event_data": decoded["args"],
+                    }
                 )
 
-                if success:
-                    events_published += 1
-                    logger.info(
-                        f"Published {decoded['event_name']}: "
-                        f"campaign={decoded['args'].get('campaign', 'N/A')}"
-                    )
-
             except Exception as e:
                 logger.error(f"Error processing Factory event: {e}", exc_info=True)
 
+        # Publish to RabbitMQ
+        events_published = self.publisher.publish_events(events)
+        if created_campaigns is not None:
+            created_campaigns.update(
+                canonical_address(str(event["event_data"]["campaign"]))
+                for event in events[:events_published]
+            )
+        for event in events[:events_published]:
+            logger.info(
+                f"Published {event['event_type']}: "
+                f"campaign={event['event_data'].get('campaign', 'N/A')}"
+            )
+
         logger.info(f"Published {events_published} Factory events from blocks {from_block}-{to_block}")
         return events_published
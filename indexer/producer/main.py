@@ -2,14 +2,19 @@
 
 import signal
 import sys
-import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
-from typing import Optional
+from typing import Any, Optional, Tuple
+
+from sqlalchemy import Row, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 
 from config import Config
 from db.healthcheck import check_tables_exist
 from db.models import Chain, SyncState
-from db.session import get_session, init_db
+from db.queries import SYNC_STATE_BY_CHAIN
+from db.session import get_readonly_session, get_session, init_db
 from eth.client import EthereumClient
 from log import get_logger, setup_logging
 from producer.campaign_indexer import ProducerCampaignIndexer
@@ -19,80 +24,67 @@ from producer.reorg_detector import ReorgDetector
 
 logger = get_logger(__name__)
 
-# Global flag for graceful shutdown
-_shutdown = False
+# Set by signal_handler; loops wait on it so shutdown interrupts a sleep
+_shutdown = threading.Event()
 
 
 def signal_handler(signum, frame):
     """Handle shutdown signals."""
-    global _shutdown
     logger.info("Shutdown signal received, stopping producer...")
-    _shutdown = True
+    _shutdown.set()
 
 
 def ensure_chain_exists(config: Config) -> None:
     """Ensure chain record exists in database.
 
+    Both rows are created with INSERT ... ON CONFLICT DO NOTHING, so an
+    existing chain costs two statements and no ORM loads.
+
     Args:
         config: Configuration object
     """
     with get_session() as session:
-        chain = session.query(Chain).filter(Chain.chain_id == config.chain_id).first()
-
-        if not chain:
-            chain = Chain(
+        created_chain = session.execute(
+            pg_insert(Chain)
+            .values(
                 chain_id=config.chain_id,
                 name=f"Hardhat Localhost" if config.chain_id == 31337 else f"Chain {config.chain_id}",
                 rpc_url=config.rpc_url,
             )
-            session.add(chain)
+            .on_conflict_do_nothing(index_elements=["chain_id"])
+            .returning(Chain.chain_id)
+        ).first()
+        if created_chain:
             logger.info(f"Created chain record: {config.chain_id}")
 
         # Ensure sync_state exists
-        sync_state = (
-            session.query(SyncState)
-            .filter(SyncState.chain_id == config.chain_id)
-            .first()
-        )
-
-        if not sync_state:
-            sync_state = SyncState(
-                chain_id=config.chain_id,
-                last_block=0,
-                last_block_hash=None,
-            )
-            session.add(sync_state)
+        created_sync_state = session.execute(
+            pg_insert(SyncState)
+            .values(chain_id=config.chain_id, last_block=0, last_block_hash=None)
+            .on_conflict_do_nothing(index_elements=["chain_id"])
+            .returning(SyncState.chain_id)
+        ).first()
+        if created_sync_state:
             logger.info(f"Created sync_state for chain: {config.chain_id}")
 
 
-def get_sync_state(config: Config) -> SyncState:
+def get_sync_state(config: Config) -> Row:
     """Get current sync state.
 
     Args:
         config: Configuration object
 
     Returns:
-        SyncState object
+        Row with last_block and last_block_hash
+
+    Raises:
+        RuntimeError: If the chain has no sync_state row
     """
-    with get_session() as session:
-        sync_state = (
-            session.query(SyncState)
-            .filter(SyncState.chain_id == config.chain_id)
-            .first()
-        )
-        if not sync_state:
-            raise RuntimeError(f"Sync state not found for chain {config.chain_id}")
-        # Detach from session by accessing attributes
-        last_block = sync_state.last_block
-        last_block_hash = sync_state.last_block_hash
-        
-    # Return a simple object with the values
-    class SyncStateData:
-        def __init__(self, lb, lbh):
-            self.last_block = lb
-            self.last_block_hash = lbh
-    
-    return SyncStateData(last_block, last_block_hash)
+    with get_readonly_session() as session:
+        sync_state = session.execute(SYNC_STATE_BY_CHAIN, {"chain_id": config.chain_id}).first()
+    if sync_state is None:
+        raise RuntimeError(f"Sync state not found for chain {config.chain_id}")
+    return sync_state
 
 
 def update_sync_state(config: Config, block_number: int, block_hash: str) -> None:
@@ -104,15 +96,11 @@ def update_sync_state(config: Config, block_number: int, block_hash: str) -> Non
         block_hash: Last processed block hash
     """
     with get_session() as session:
-        sync_state = (
-            session.query(SyncState)
-            .filter(SyncState.chain_id == config.chain_id)
-            .first()
+        session.execute(
+            update(SyncState)
+            .where(SyncState.chain_id == config.chain_id)
+            .values(last_block=block_number, last_block_hash=block_hash)
         )
-        if sync_state:
-            sync_state.last_block = block_number
-            sync_state.last_block_hash = block_hash
-        session.commit()
 
 
 def index_block_range(
@@ -125,6 +113,9 @@ def index_block_range(
 ) -> int:
     """Index a range of blocks and publish events.
 
+    Reorg checks only run for batches within reorg_rollback_blocks of
+    to_block; older blocks are final.
+
     Args:
         config: Configuration object
         factory_indexer: Factory indexer instance
@@ -141,16 +132,21 @@ def index_block_range(
     total_events = 0
     batch_size = config.block_batch_size
     current = from_block
+    # (last_block, last_block_hash) written by the previous batch, so the
+    # reorg check does not read it back
+    synced: Optional[Tuple[int, Optional[str]]] = None
 
-    while current <= to_block and not _shutdown:
+    while current <= to_block and not _shutdown.is_set():
         batch_end = min(current + batch_size - 1, to_block)
 
         try:
             # Check for reorg
-            if reorg_detector.check_and_handle_reorg(current):
+            near_head = batch_end > to_block - config.reorg_rollback_blocks
+            if near_head and reorg_detector.check_and_handle_reorg(current, synced):
                 # Reorg detected and handled, restart from updated sync state
                 sync_state = get_sync_state(config)
                 current = sync_state.last_block + 1
+                synced = None
                 continue
 
             # Fetch and publish Factory events
@@ -168,14 +164,18 @@ def index_block_range(
                 update_sync_state(config, batch_end, block_hash)
             except Exception as e:
                 logger.warning(f"Could not get block hash for {batch_end}: {e}")
-                update_sync_state(config, batch_end, "")
+                block_hash = ""
+                update_sync_state(config, batch_end, block_hash)
+            synced = (batch_end, block_hash)
 
             logger.info(f"Processed blocks {current} to {batch_end}, published {factory_events + campaign_events} events")
             current = batch_end + 1
 
         except Exception as e:
             logger.error(f"Error processing blocks {current}-{batch_end}: {e}", exc_info=True)
-            current = batch_end + 1
+            # Stop here: sync_state still ends before this batch, so the next
+            # poll retries it (republished events are idempotent downstream)
+            break
 
     return total_events
 
@@ -204,7 +204,7 @@ def run_producer(config: Config) -> None:
 
     try:
         # Main polling loop
-        while not _shutdown:
+        while not _shutdown.is_set():
             try:
                 # Get latest block with confirmations
                 latest_block = eth_client.get_latest_block()
@@ -231,54 +231,155 @@ def run_producer(config: Config) -> None:
                     publisher.publish_reconciliation(config.chain_id)
                     last_reconciliation = now
 
-                # Sleep before next poll
-                if not _shutdown:
-                    time.sleep(config.poll_interval_seconds)
+                # Sleep before next poll (returns early on shutdown)
+                if _shutdown.wait(config.poll_interval_seconds):
+                    break
 
             except KeyboardInterrupt:
                 logger.info("Keyboard interrupt received")
                 break
             except Exception as e:
                 logger.error(f"Error in polling loop: {e}", exc_info=True)
-                time.sleep(config.poll_interval_seconds)
+                _shutdown.wait(config.poll_interval_seconds)
 
     finally:
         publisher.close()
         logger.info("Producer stopped")
 
 
+def _backfill_partition(indexer, config: Config, from_block: int, to_block: int, **kwargs: Any) -> Tuple[int, bool]:
+    """Fetch and publish one indexer's events for a backfill partition.
+
+    A failed batch is logged and skipped so the rest of the partition is
+    still published; the caller must not advance sync_state past it.
+
+    Args:
+        indexer: ProducerFactoryIndexer or ProducerCampaignIndexer
+        config: Configuration object
+        from_block: Starting block
+        to_block: Ending block
+        **kwargs: Extra index_block_range arguments
+
+    Returns:
+        (events published, True if every batch succeeded and none was skipped)
+    """
+    total_events = 0
+    complete = True
+    current = from_block
+
+    while current <= to_block:
+        if _shutdown.is_set():
+            return total_events, False
+        batch_end = min(current + config.block_batch_size - 1, to_block)
+        try:
+            total_events += indexer.index_block_range(current, batch_end, **kwargs)
+        except Exception as e:
+            logger.error(f"Error processing blocks {current}-{batch_end}: {e}", exc_info=True)
+            complete = False
+        current = batch_end + 1
+
+    return total_events, complete
+
+
 def backfill(config: Config, from_block: int, to_block: int) -> None:
     """Backfill historical blocks.
 
+    The range is split into at most BACKFILL_WORKERS partitions fetched
+    concurrently, each with its own RPC client and broker connection.
+    Historic blocks are final, so partitions skip reorg checks. Factory
+    events for the whole range are published first; the campaign partitions
+    then index the campaigns already in the database plus those the factory
+    phase found, since consumers may not have stored the new ones yet.
+    sync_state only moves to to_block if every partition succeeded.
+    RPC_MAX_CONCURRENCY bounds the concurrent eth_getLogs requests of all
+    partitions together.
+
     Args:
         config: Configuration object
         from_block: Starting block number
         to_block: Ending block number
     """
+    if from_block > to_block:
+        logger.info(f"Nothing to backfill: from block {from_block} is past to block {to_block}")
+        return
+
     logger.info(f"Backfilling blocks {from_block} to {to_block}")
 
-    # Initialize components
-    eth_client = EthereumClient(config)
-    publisher = EventPublisher(config)
-    publisher.connect()
-
-    factory_indexer = ProducerFactoryIndexer(config, eth_client, publisher)
-    campaign_indexer = ProducerCampaignIndexer(config, eth_client, publisher)
-    reorg_detector = ReorgDetector(config, eth_client, publisher)
+    span = to_block - from_block + 1
+    stride = max(config.block_batch_size, -(-span // config.backfill_workers))
+    partitions = [
+        (start, min(start + stride - 1, to_block))
+        for start in range(from_block, to_block + 1, stride)
+    ]
+    logger.info(f"Backfill split into {len(partitions)} partitions of up to {stride} blocks")
+
+    # One client and connection per partition: pika connections are not thread-safe.
+    # RPC_MAX_CONCURRENCY is split between the partitions' clients, so the
+    # backfill as a whole keeps to it (at least one request per partition)
+    partition_config = config.model_copy(
+        update={"rpc_max_concurrency": max(1, config.rpc_max_concurrency // len(partitions))}
+    )
+    eth_clients = [EthereumClient(partition_config) for _ in partitions]
+    publishers = [EventPublisher(config) for _ in partitions]
 
     try:
-        # Index the range
-        total_events = index_block_range(
-            config,
-            factory_indexer,
-            campaign_indexer,
-            reorg_detector,
-            from_block,
-            to_block,
-        )
+        for publisher in publishers:
+            publisher.connect()
+
+        factory_indexers = [
+            ProducerFactoryIndexer(config, eth_client, publisher)
+            for eth_client, publisher in zip(eth_clients, publishers)
+        ]
+        campaign_indexers = [
+            ProducerCampaignIndexer(config, eth_client, publisher)
+            for eth_client, publisher in zip(eth_clients, publishers)
+        ]
+
+        total_events = 0
+        complete = True
+        # One set per partition, so the threads never share one
+        created = [set() for _ in partitions]
+        with ThreadPoolExecutor(max_workers=len(partitions), thread_name_prefix="backfill") as executor:
+            futures = [
+                executor.submit(_backfill_partition, indexer, config, start, end, created_campaigns=found)
+                for indexer, (start, end), found in zip(factory_indexers, partitions, created)
+            ]
+            for future in futures:
+                events, ok = future.result()
+                total_events += events
+                complete = complete and ok
+
+            campaign_addresses = campaign_indexers[0].get_known_campaign_addresses().union(*created)
+            futures = [
+                executor.submit(
+                    _backfill_partition, indexer, config, start, end, campaign_addresses=campaign_addresses
+                )
+                for indexer, (start, end) in zip(campaign_indexers, partitions)
+            ]
+            for future in futures:
+                events, ok = future.result()
+                total_events += events
+                complete = complete and ok
+
+        if complete:
+            # Update sync state
+            try:
+                block = eth_clients[0].get_block(to_block)
+                block_hash = block["hash"].hex() if hasattr(block["hash"], "hex") else block["hash"]
+                update_sync_state(config, to_block, block_hash)
+            except Exception as e:
+                logger.warning(f"Could not get block hash for {to_block}: {e}")
+                update_sync_state(config, to_block, "")
+        else:
+            logger.error(
+                f"Backfill of blocks {from_block}-{to_block} incomplete; sync state left unchanged, "
+                f"rerun the backfill to retry the failed ranges"
+            )
+
         logger.info(f"Backfill complete. Total events published: {total_events}")
     finally:
-        publisher.close()
+        for publisher in publishers:
+            publisher.close()
 
 
 def show_status(config: Config) -> None:
@@ -317,7 +418,6 @@ def main(command: str, from_block: int = None, to_block: int = None) -> None:
     # Load config
     try:
         config = Config.from_env()
-        config.validate()
     except Exception as e:
         print(f"Configuration error: {e}", file=sys.stderr)
         sys.exit(1)
@@ -1,7 +1,7 @@
 """Publisher module for sending event messages to RabbitMQ."""
 
 from datetime import datetime, timezone
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 from config import Config
 from log import get_logger
@@ -101,12 +101,40 @@ class EventPublisher:
         
         if success:
             self._events_published += 1
-            logger.debug(f"Published {event_type} event: tx={tx_hash}, log_index={log_index}")
+            logger.debug("Published %s event: tx=%s, log_index=%s", event_type, tx_hash, log_index)
         else:
             logger.error(f"Failed to publish {event_type} event: tx={tx_hash}")
         
         return success
 
+    def publish_events(self, events: List[Dict[str, Any]]) -> int:
+        """Publish several blockchain events as one pipelined burst.
+
+        Args:
+            events: Keyword arguments for publish_event, one dict per event
+
+        Returns:
+            Number of events published (a prefix of events, in order)
+        """
+        self.ensure_connected()
+
+        published_at = datetime.now(timezone.utc)
+        messages = [
+            (
+                EventMessage(**event, published_at=published_at),
+                get_routing_key_for_event(event["event_type"]),
+            )
+            for event in events
+        ]
+
+        published = self._publisher.publish_batch(messages)
+        self._events_published += published
+
+        if published < len(events):
+            logger.error(f"Published only {published} of {len(events)} events")
+
+        return published
+
     def publish_rollback(
         self,
         chain_id: int,
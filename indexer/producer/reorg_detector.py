@@ -1,8 +1,11 @@
 """Reorg detector for producer - detects blockchain reorganizations."""
 
+from typing import Optional, Tuple
+
 from config import Config
 from db.models import SyncState
-from db.session import get_session
+from db.queries import SYNC_STATE_BY_CHAIN
+from db.session import get_readonly_session, get_session
 from eth.client import EthereumClient
 from log import get_logger
 from producer.publisher import EventPublisher
@@ -31,40 +34,39 @@ class ReorgDetector:
         self.publisher = publisher
         self.rollback_blocks = config.reorg_rollback_blocks
 
-    def check_reorg(self, block_number: int) -> bool:
+    def check_reorg(self, block_number: int, synced: Optional[Tuple[int, Optional[str]]] = None) -> bool:
         """Check if a reorg occurred at the given block.
 
         Args:
             block_number: Block number to check
+            synced: (last_block, last_block_hash) the caller just wrote to
+                sync_state, to skip reading it back (default: read it)
 
         Returns:
             True if reorg detected, False otherwise
         """
-        with get_session() as session:
-            sync_state = (
-                session.query(SyncState)
-                .filter(SyncState.chain_id == self.config.chain_id)
-                .first()
-            )
-
-            if not sync_state or sync_state.last_block < block_number:
-                # No previous state or block is new, no reorg
-                return False
-
-            if sync_state.last_block == block_number:
-                # Check block hash
-                stored_hash = sync_state.last_block_hash
-                if stored_hash:
-                    try:
-                        current_hash = self.eth_client.get_block_hash(block_number)
-                        if stored_hash.lower() != current_hash.lower():
-                            logger.warning(
-                                f"Reorg detected at block {block_number}: "
-                                f"stored={stored_hash}, current={current_hash}"
-                            )
-                            return True
-                    except Exception as e:
-                        logger.error(f"Error checking block hash: {e}")
+        if synced is None:
+            with get_readonly_session() as session:
+                synced = session.execute(SYNC_STATE_BY_CHAIN, {"chain_id": self.config.chain_id}).first()
+
+        if not synced or synced[0] < block_number:
+            # No previous state or block is new, no reorg
+            return False
+
+        last_block, stored_hash = synced
+        if last_block == block_number:
+            # Check block hash (both sides come from get_block_hash, already lowercase)
+            if stored_hash:
+                try:
+                    current_hash = self.eth_client.get_block_hash(block_number)
+                    if stored_hash != current_hash:
+                        logger.warning(
+                            f"Reorg detected at block {block_number}: "
+                            f"stored={stored_hash}, current={current_hash}"
+                        )
+                        return True
+                except Exception as e:
+                    logger.error(f"Error checking block hash: {e}")
 
         return False
 
@@ -126,16 +128,21 @@ class ReorgDetector:
                 session.commit()
                 logger.info(f"Updated sync state to block {new_last_block}")
 
-    def check_and_handle_reorg(self, block_number: int) -> bool:
+    def check_and_handle_reorg(
+        self,
+        block_number: int,
+        synced: Optional[Tuple[int, Optional[str]]] = None,
+    ) -> bool:
         """Check for reorg and handle if detected.
 
         Args:
             block_number: Block number to start checking from
+            synced: Sync state the caller just wrote (see check_reorg)
 
         Returns:
             True if reorg was detected and handled
         """
-        if self.check_reorg(block_number):
+        if self.check_reorg(block_number, synced):
             # Calculate rollback range
             to_block = block_number
             from_block = max(0, block_number - self.rollback_blocks)
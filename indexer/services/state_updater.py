@@ -1,12 +1,16 @@
 """State update service - applies event-driven state changes to database."""
 
-from typing import Dict, Any
+from typing import Any, Dict, List, Tuple
 
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
+from consumer.state_updater import ConsumerStateUpdater
+from db import bulk
 from db.models import Campaign, Contribution, Event
-from eth.decoder import event_data_to_json
+from eth.address import canonical_address
+from eth.decoder import event_data_to_dict
 from log import get_logger
 
 logger = get_logger(__name__)
@@ -23,7 +27,7 @@ def insert_event(
     event_name: str,
     event_data: Dict[str, Any],
 ) -> bool:
-    """Insert event into database (idempotent).
+    """Insert event into database (idempotent via ON CONFLICT DO NOTHING).
 
     Args:
         session: Database session
@@ -38,27 +42,94 @@ def insert_event(
 
     Returns:
         True if event was inserted, False if it already existed (idempotent)
+
+    Raises:
+        IntegrityError: On a foreign key violation
     """
-    try:
-        event = Event(
+    stmt = (
+        pg_insert(Event)
+        .values(
             chain_id=chain_id,
             tx_hash=tx_hash,
             log_index=log_index,
             block_number=block_number,
             block_hash=block_hash,
-            address=address,
+            address=canonical_address(address),
             event_name=event_name,
-            event_data=event_data_to_json(event_data),
+            event_data=event_data_to_dict(event_data),
             removed=False,
         )
-        session.add(event)
-        session.flush()  # Flush to trigger unique constraint check
-        return True
-    except IntegrityError:
-        # Event already exists (idempotent)
-        session.rollback()
-        logger.debug(f"Event already exists: {tx_hash}:{log_index}")
+        .on_conflict_do_nothing(index_elements=["chain_id", "tx_hash", "log_index"])
+    )
+
+    try:
+        result = session.execute(stmt)
+    except IntegrityError as e:
+        # Duplicates are absorbed by ON CONFLICT, so this is a FK violation
+        logger.error(f"Integrity error inserting event {tx_hash}:{log_index}: {e.orig or e}")
+        raise
+
+    if result.rowcount != 1:
+        logger.debug("Event already exists: %s:%s", tx_hash, log_index)
         return False
+    return True
+
+
+def store_events(
+    session: Session,
+    chain_id: int,
+    events: List[Tuple[Dict[str, Any], str]],
+) -> List[Dict[str, Any]]:
+    """Insert decoded events in bulk and apply state for the new ones.
+
+    Events are written with multi-row INSERT ... ON CONFLICT DO NOTHING
+    statements instead of one INSERT per event; state for the events that
+    were actually inserted is then applied as aggregated statements (see
+    ConsumerStateUpdater.apply_event_batch), not per-event ORM round trips.
+
+    Args:
+        session: Database session
+        chain_id: Chain ID
+        events: (decoded event, block hash) pairs in chain order
+
+    Returns:
+        Decoded events that were new and applied
+
+    Raises:
+        Exception: On database errors (the caller's transaction must be rolled back)
+    """
+    rows = [
+        {
+            "chain_id": chain_id,
+            "tx_hash": decoded["tx_hash"],
+            "log_index": decoded["log_index"],
+            "block_number": decoded["block_number"],
+            "block_hash": block_hash,
+            "address": canonical_address(decoded["address"]),
+            "event_name": decoded["event_name"],
+            "event_data": event_data_to_dict(decoded),
+            "removed": False,
+        }
+        for decoded, block_hash in events
+    ]
+    inserted = bulk.insert_events(session, rows)
+
+    new_events = []
+    for decoded, _ in events:
+        key = (decoded["tx_hash"], decoded["log_index"])
+        if key not in inserted:
+            logger.debug("Event already exists (idempotent): tx=%s, log_index=%s", key[0], key[1])
+            continue
+        inserted.discard(key)
+        new_events.append(decoded)
+
+    if new_events:
+        # Same aggregated executemany pass the consumer runs per ack batch
+        ConsumerStateUpdater(chain_id).apply_event_batch(
+            session, [(decoded["event_name"], decoded["args"]) for decoded in new_events]
+        )
+
+    return new_events
 
 
 def apply_campaign_created(
@@ -82,15 +153,15 @@ def apply_campaign_created(
         log_index: Log index
     """
     args = event_data["args"]
-    campaign_address = args["campaign"].lower()
-    factory_address = args["factory"].lower()
-    creator_address = args["creator"].lower()
+    campaign_address = canonical_address(args["campaign"])
+    factory_address = canonical_address(args["factory"])
+    creator_address = canonical_address(args["creator"])
     goal_wei = int(args["goal"])
     deadline_ts = int(args["deadline"])
     cid = args["cid"]
 
     # Insert/update campaign
-    campaign = session.query(Campaign).filter(Campaign.address == campaign_address).first()
+    campaign = session.get(Campaign, campaign_address)
     
     if campaign is None:
         campaign = Campaign(
@@ -139,13 +210,13 @@ def apply_donation_received(
         log_index: Log index
     """
     args = event_data["args"]
-    campaign_address = args["campaign"].lower()
-    donor_address = args["donor"].lower()
+    campaign_address = canonical_address(args["campaign"])
+    donor_address = canonical_address(args["donor"])
     amount = int(args["amount"])
     new_total_raised = int(args["newTotalRaised"])
 
     # Get or create campaign
-    campaign = session.query(Campaign).filter(Campaign.address == campaign_address).first()
+    campaign = session.get(Campaign, campaign_address)
     if campaign is None:
         logger.warning(f"Campaign not found for donation: {campaign_address}")
         return
@@ -201,11 +272,11 @@ def apply_withdrawn(
         log_index: Log index
     """
     args = event_data["args"]
-    campaign_address = args["campaign"].lower()
+    campaign_address = canonical_address(args["campaign"])
     amount = int(args["amount"])
 
     # Get campaign
-    campaign = session.query(Campaign).filter(Campaign.address == campaign_address).first()
+    campaign = session.get(Campaign, campaign_address)
     if campaign is None:
         logger.warning(f"Campaign not found for withdrawal: {campaign_address}")
         return
@@ -242,8 +313,8 @@ def apply_refunded(
         Status becomes "FAILED" via reconciler, not directly from this event.
     """
     args = event_data["args"]
-    campaign_address = args["campaign"].lower()
-    donor_address = args["donor"].lower()
+    campaign_address = canonical_address(args["campaign"])
+    donor_address = canonical_address(args["donor"])
     amount = int(args["amount"])
 
     # Get contribution
@@ -264,56 +335,4 @@ def apply_refunded(
 
     # Update refunded amount (keep contributed_wei as lifetime total)
     contribution.refunded_wei += amount
-    logger.debug(f"Refunded {amount} wei to {donor_address} for campaign {campaign_address}")
-
-
-def apply_event_state_update(
-    session: Session,
-    chain_id: int,
-    event_name: str,
-    event_data: Dict[str, Any],
-    block_number: int,
-    block_hash: str,
-    tx_hash: str,
-    log_index: int,
-) -> None:
-    """Apply state update for any event type.
-
-    Args:
-        session: Database session
-        chain_id: Chain ID
-        event_name: Event name
-        event_data: Decoded event data
-        block_number: Block number
-        block_hash: Block hash
-        tx_hash: Transaction hash
-        log_index: Log index
-    """
-    # Check if event already processed (idempotency)
-    existing = (
-        session.query(Event)
-        .filter(
-            Event.chain_id == chain_id,
-            Event.tx_hash == tx_hash,
-            Event.log_index == log_index,
-        )
-        .first()
-    )
-
-    if existing and not existing.removed:
-        # Event already processed, skip state update
-        logger.debug(f"Event already processed, skipping state update: {tx_hash}:{log_index}")
-        return
-
-    # Apply state update based on event type
-    if event_name == "CampaignCreated":
-        apply_campaign_created(session, chain_id, event_data, block_number, block_hash, tx_hash, log_index)
-    elif event_name == "DonationReceived":
-        apply_donation_received(session, chain_id, event_data, block_number, block_hash, tx_hash, log_index)
-    elif event_name == "Withdrawn":
-        apply_withdrawn(session, chain_id, event_data, block_number, block_hash, tx_hash, log_index)
-    elif event_name == "Refunded":
-        apply_refunded(session, chain_id, event_data, block_number, block_hash, tx_hash, log_index)
-    else:
-        logger.warning(f"Unknown event type: {event_name}")
-
+    logger.debug("Refunded %s wei to %s for campaign %s", amount, donor_address, campaign_address)
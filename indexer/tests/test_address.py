@@ -0,0 +1,12 @@
+"""Tests for address canonicalization."""
+
+from eth.address import canonical_address
+
+
+def test_canonical_address_lowercases_and_interns():
+    """Test that equal addresses map to one lowercase object."""
+    a = canonical_address("0x5FbDB2315678afecb367f032d93F642f64180aa3")
+    b = canonical_address("".join(["0x5fbdb2315678afecb367f032d93f642f64180aa3"]))
+
+    assert a == "0x5fbdb2315678afecb367f032d93f642f64180aa3"
+    assert a is b
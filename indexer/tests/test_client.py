@@ -0,0 +1,176 @@
+"""Tests for the Ethereum RPC client: error classification, log and block fetching."""
+
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import pytest
+import requests
+from hexbytes import HexBytes
+
+from eth.client import EthereumClient, is_result_limit_error, is_transient_rpc_error
+
+
+def _http_error(status: int) -> requests.HTTPError:
+    response = requests.Response()
+    response.status_code = status
+    return requests.HTTPError(response=response)
+
+
+@pytest.fixture
+def client():
+    """EthereumClient with a stubbed web3 and no RPC connection."""
+    client = EthereumClient.__new__(EthereumClient)
+    client.config = SimpleNamespace(rpc_log_chunk_size=1000, rpc_max_concurrency=4, reorg_rollback_blocks=10)
+    client.web3 = SimpleNamespace(eth=SimpleNamespace(get_logs=Mock(return_value=[]), get_block=Mock()))
+    client._executor = None
+    client._checksum_cache = {}
+    client._log_stride = 1000
+    client._multi_address_filters = True
+    client._head = None
+    client._final_hashes = {}
+    yield client
+    if client._executor is not None:
+        client._executor.shutdown()
+
+
+def test_transient_rpc_errors_are_retried():
+    """Test that timeouts, rate limits and 5xx are classified as transient."""
+    assert is_transient_rpc_error(requests.Timeout())
+    assert is_transient_rpc_error(requests.ConnectionError())
+    assert is_transient_rpc_error(_http_error(429))
+    assert is_transient_rpc_error(_http_error(503))
+    assert is_transient_rpc_error(ValueError({"code": -32005, "message": "rate limit exceeded"}))
+
+
+def test_permanent_rpc_errors_are_not_retried():
+    """Test that client errors and invalid params fail immediately."""
+    assert not is_transient_rpc_error(_http_error(400))
+    assert not is_transient_rpc_error(ValueError({"code": -32602, "message": "invalid argument 0"}))
+    # Status-like digits inside block numbers are not HTTP statuses
+    assert not is_transient_rpc_error(
+        ValueError({"code": -32602, "message": "invalid argument 0: block range 15030-15040 exceeds limit"})
+    )
+
+
+def test_result_limit_errors_are_detected():
+    """Test that provider log caps are told apart from other errors."""
+    assert is_result_limit_error(ValueError({"code": -32005, "message": "query returned more than 10000 results"}))
+    assert is_result_limit_error(_http_error(413))
+    assert not is_result_limit_error(ValueError({"code": -32005, "message": "rate limit exceeded"}))
+
+
+def test_log_stride_shrinks_on_result_limit_and_recovers(client):
+    """Test that get_logs_parallel learns a smaller stride and grows it back."""
+    def get_logs(params):
+        if params["toBlock"] - params["fromBlock"] + 1 > 100:
+            raise ValueError({"code": -32005, "message": "query returned more than 10000 results"})
+        return [params["fromBlock"]]
+
+    client.config.rpc_log_chunk_size = 400
+    client._log_stride = 400
+    client.web3.eth.get_logs = Mock(side_effect=get_logs)
+
+    logs = client.get_logs_parallel(None, 0, 799)
+
+    assert logs == list(range(0, 800, 100))
+    assert client._log_stride == 100
+
+    client.web3.eth.get_logs = Mock(return_value=[])
+    client.get_logs_parallel(None, 0, 799)
+
+    assert client._log_stride == 200
+
+
+def test_get_logs_for_addresses_uses_one_filter_and_dedupes(client):
+    """Test that many campaigns and topics share one eth_getLogs filter."""
+    log = {"transactionHash": b"\x01", "logIndex": 0, "blockNumber": 5}
+    client.web3.eth.get_logs = Mock(return_value=[log, dict(log)])
+    addresses = [f"0x{i:040x}" for i in range(1, 51)]
+
+    logs = client.get_logs_for_addresses(addresses, 0, 99, topics=[["0xaa", "0xbb"]])
+
+    assert logs == [log]
+    client.web3.eth.get_logs.assert_called_once()
+    params = client.web3.eth.get_logs.call_args.args[0]
+    assert len(params["address"]) == 50
+    assert params["topics"] == [["0xaa", "0xbb"]]
+
+
+def test_get_logs_for_addresses_falls_back_to_per_address_requests(client):
+    """Test that a node rejecting address lists gets concurrent per-address requests."""
+    def get_logs(params):
+        if isinstance(params["address"], list):
+            raise ValueError({"code": -32602, "message": "invalid argument 0: cannot unmarshal array"})
+        return [{"transactionHash": params["address"], "logIndex": 0, "blockNumber": int(params["address"], 16)}]
+
+    client.web3.eth.get_logs = Mock(side_effect=get_logs)
+    addresses = [f"0x{i:040x}" for i in range(5, 0, -1)]
+
+    logs = client.get_logs_for_addresses(addresses, 0, 99)
+
+    assert [log["blockNumber"] for log in logs] == [1, 2, 3, 4, 5]
+    assert client._multi_address_filters is False
+
+
+def test_get_logs_for_addresses_splits_addresses_on_result_limit(client):
+    """Test that a single-block result limit splits the address list and keeps multi-address filters."""
+    def get_logs(params):
+        if len(params["address"]) > 2:
+            raise ValueError({"code": -32005, "message": "query returned more than 10000 results"})
+        return [
+            {"transactionHash": address, "logIndex": 0, "blockNumber": int(address, 16)}
+            for address in params["address"]
+        ]
+
+    client.web3.eth.get_logs = Mock(side_effect=get_logs)
+    addresses = [f"0x{i:040x}" for i in range(4, 0, -1)]
+
+    logs = client.get_logs_for_addresses(addresses, 7, 7)
+
+    assert [log["blockNumber"] for log in logs] == [1, 2, 3, 4]
+    assert client._multi_address_filters is True
+
+
+def test_get_logs_for_addresses_raises_other_errors_without_fallback(client):
+    """Test that an ordinary bad request fails the call instead of disabling address lists."""
+    client.web3.eth.get_logs = Mock(side_effect=ValueError({"code": -32602, "message": "invalid topic"}))
+
+    with pytest.raises(ValueError):
+        client.get_logs_for_addresses([f"0x{i:040x}" for i in range(1, 4)], 0, 99)
+    assert client._multi_address_filters is True
+
+
+def test_block_hashes_cache_only_final_blocks(client):
+    """Test that batched lookups reuse final hashes but refetch blocks in the reorg window."""
+    client._head = 100
+    client.get_blocks = Mock(
+        side_effect=lambda numbers: {n: {"hash": bytes([n])} for n in numbers}
+    )
+
+    assert client.get_block_hashes([50, 95, 50]) == {50: "32", 95: "5f"}
+    assert client.get_block_hashes([50, 95]) == {50: "32", 95: "5f"}
+
+    assert sorted(client.get_blocks.call_args_list[0].args[0]) == [50, 95]
+    assert client.get_blocks.call_args_list[1].args[0] == [95]
+
+
+def test_log_block_hashes_fetch_only_logs_without_block_hash(client):
+    """Test that block hashes come from the logs and only missing ones hit the node."""
+    client.get_block_hashes = Mock(return_value={7: "0x07"})
+
+    logs = [
+        {"blockNumber": 5, "blockHash": HexBytes(b"\x05")},
+        {"blockNumber": 5, "blockHash": HexBytes(b"\x05")},
+        {"blockNumber": 7, "blockHash": None},
+    ]
+
+    assert client.get_log_block_hashes(logs) == {5: HexBytes(b"\x05").hex(), 7: "0x07"}
+    client.get_block_hashes.assert_called_once_with({7})
+
+
+def test_get_blocks_without_batch_requests_fetches_each_block(client):
+    """Test the per-block fallback for web3 releases without batch_requests."""
+    client.web3.eth.get_block = Mock(side_effect=lambda number, full: {"number": number})
+
+    assert client.get_blocks([3, 1, 3]) == {1: {"number": 1}, 3: {"number": 3}}
+    assert client.web3.eth.get_block.call_count == 2
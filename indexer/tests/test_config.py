@@ -0,0 +1,57 @@
+"""Tests for configuration loading."""
+
+import pytest
+from pydantic import ValidationError
+
+from config import Config
+
+
+@pytest.fixture
+def required_env(monkeypatch):
+    """Set the required environment variables."""
+    monkeypatch.setenv("FACTORY_ADDRESS", "0x5FbDB2315678afecb367f032d93F642f64180aa3")
+    monkeypatch.setenv("DB_URL", "postgresql://localhost/test")
+
+
+def test_from_env_parses_types(required_env, monkeypatch):
+    """Test that environment values are coerced to field types."""
+    monkeypatch.setenv("CONFIRMATIONS", "5")
+    monkeypatch.setenv("RABBITMQ_PREFETCH_COUNT", "64")
+
+    config = Config.from_env(env_file=None)
+
+    assert config.confirmations == 5
+    assert config.rabbitmq_prefetch_count == 64
+    assert config.poll_interval_seconds == 2
+
+
+def test_from_env_requires_factory_address(monkeypatch):
+    """Test that missing required values are rejected."""
+    monkeypatch.delenv("FACTORY_ADDRESS", raising=False)
+    monkeypatch.setenv("DB_URL", "postgresql://localhost/test")
+
+    with pytest.raises(ValidationError):
+        Config(_env_file=None)
+
+
+def test_from_env_rejects_invalid_values(required_env, monkeypatch):
+    """Test that field constraints replace manual validation."""
+    monkeypatch.setenv("BLOCK_BATCH_SIZE", "0")
+
+    with pytest.raises(ValidationError):
+        Config.from_env(env_file=None)
+
+
+def test_get_rabbitmq_connection_params():
+    """Test RabbitMQ connection parameters mapping."""
+    config = Config(
+        factory_address="0xabc", db_url="postgresql://localhost/test", rabbitmq_port=5673, _env_file=None
+    )
+
+    assert config.get_rabbitmq_connection_params() == {
+        "host": "localhost",
+        "port": 5673,
+        "user": "guest",
+        "password": "guest",
+        "vhost": "/",
+    }
@@ -0,0 +1,69 @@
+"""Tests for consumer worker batching, fallback and retry settlement."""
+
+import json
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import pytest
+
+from consumer.main import ConsumerWorker
+from messaging.routing import RETRY_EXCHANGE_NAME
+
+
+@pytest.fixture
+def worker():
+    """ConsumerWorker with mocked broker and handler, batching two events."""
+    config = SimpleNamespace(ack_batch_size=2, ack_flush_interval_ms=50, max_retries=3)
+    worker = ConsumerWorker(config, worker_id=0)
+    worker.connection = Mock()
+    worker.consumer = Mock()
+    worker.event_handler = Mock()
+    return worker
+
+
+def _delivery(tag: int):
+    """(channel, method, properties, body) for an event message."""
+    body = json.dumps({"message_type": "event", "tx_hash": f"0x{tag:064x}", "log_index": 0}).encode()
+    method = SimpleNamespace(delivery_tag=tag, routing_key="event.donation")
+    properties = SimpleNamespace(headers={}, content_type="application/json")
+    return Mock(), method, properties, body
+
+
+def test_event_batch_applied_once_and_multi_acked(worker):
+    """Test that a full buffer is applied as one batch and settled with one multi-ack."""
+    for tag in (1, 2):
+        worker._on_message(*_delivery(tag))
+
+    worker.event_handler.handle_event_batch.assert_called_once()
+    assert len(worker.event_handler.handle_event_batch.call_args.args[0]) == 2
+    worker.consumer.ack_up_to.assert_called_once_with(2)
+    worker.event_handler.handle_message.assert_not_called()
+
+
+def test_failed_batch_falls_back_to_per_message_handling(worker):
+    """Test that a failed batch is retried message by message: successes acked, failures sent to retry."""
+    worker.event_handler.handle_event_batch.side_effect = RuntimeError("constraint violation")
+    worker.event_handler.handle_message.side_effect = [True, False]
+
+    for tag in (1, 2):
+        worker._on_message(*_delivery(tag))
+
+    assert worker.event_handler.handle_message.call_count == 2
+    worker.consumer.ack_up_to.assert_not_called()
+    channel = worker.connection.channel
+    channel.basic_publish.assert_called_once()
+    assert channel.basic_publish.call_args.kwargs["exchange"] == RETRY_EXCHANGE_NAME
+    assert channel.basic_publish.call_args.kwargs["properties"].headers["x-retry-count"] == 1
+    assert [c.args[0] for c in worker.consumer.maybe_ack.call_args_list] == [1, 2]
+
+
+def test_retry_publish_failure_requeues_after_flushing_acks(worker):
+    """Test that a message whose retry copy cannot be published is nacked for requeue, not acked."""
+    channel, method, properties, body = _delivery(5)
+    channel.basic_publish.side_effect = RuntimeError("channel closed")
+
+    worker._retry_later(channel, method, properties, body, {"x-retry-count": 1})
+
+    worker.consumer.flush_acks.assert_called_once()
+    channel.basic_nack.assert_called_once_with(delivery_tag=5, requeue=True)
+    worker.consumer.maybe_ack.assert_not_called()
@@ -88,7 +88,7 @@ def test_unique_constraint_enforced(test_config):
             block_hash="0xabcd",
             address="0x5FbDB2315678afecb367f032d93F642f64180aa3",
             event_name="CampaignCreated",
-            event_data='{"test": "data"}',
+            event_data={"test": "data"},
         )
         session.add(event1)
         session.commit()
@@ -102,7 +102,7 @@ def test_unique_constraint_enforced(test_config):
             block_hash="0xefgh",
             address="0x5FbDB2315678afecb367f032d93F642f64180aa3",
             event_name="CampaignCreated",
-            event_data='{"test": "data2"}',
+            event_data={"test": "data2"},
         )
         session.add(event2)
         
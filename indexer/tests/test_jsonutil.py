@@ -0,0 +1,29 @@
+"""Tests for JSON payload encoding."""
+
+import jsonutil
+
+
+def test_round_trip_small_values():
+    """Test that regular payloads round-trip unchanged."""
+    data = {"campaign": "0xabc", "amount": 1000, "cid": "Qm"}
+
+    assert jsonutil.loads(jsonutil.dumps(data)) == data
+
+
+def test_round_trip_large_wei_values():
+    """Test that amounts beyond 64 bits keep full precision."""
+    data = {"amount": 20000000000000000001, "newTotalRaised": 2**200}
+
+    encoded = jsonutil.dumps(data)
+
+    assert jsonutil.loads(encoded) == data
+    assert jsonutil.loads(encoded.encode()) == data
+
+
+def test_default_applies_on_both_paths():
+    """Test that the default hook is used with and without large integers."""
+    data = {"tx": b"\x01\x02", "amount": 1}
+
+    assert jsonutil.loads(jsonutil.dumps(data, default=bytes.hex)) == {"tx": "0102", "amount": 1}
+    data["amount"] = 2**70
+    assert jsonutil.loads(jsonutil.dumps(data, default=bytes.hex)) == {"tx": "0102", "amount": 2**70}
@@ -0,0 +1,26 @@
+"""Tests for consumer acknowledgement batching."""
+
+from unittest.mock import Mock
+
+from messaging.rabbitmq import RabbitMQConsumer
+
+
+def test_maybe_ack_coalesces_into_multi_ack():
+    """Test that acks are sent as one multi-ack per full batch and flushed on demand."""
+    connection = Mock()
+    consumer = RabbitMQConsumer(connection, prefetch_count=8, ack_batch_size=3)
+
+    for tag in (1, 2, 3, 4):
+        consumer.maybe_ack(tag)
+
+    connection.channel.basic_ack.assert_called_once_with(delivery_tag=3, multiple=True)
+    connection.call_later.assert_called()
+
+    consumer.flush_acks()
+
+    connection.channel.basic_ack.assert_called_with(delivery_tag=4, multiple=True)
+    assert connection.channel.basic_ack.call_count == 2
+    connection.remove_timeout.assert_called()
+
+    consumer.flush_acks()
+    assert connection.channel.basic_ack.call_count == 2
@@ -3,7 +3,7 @@
 import pytest
 
 from config import Config
-from db.models import Campaign, Event, SyncState
+from db.models import Campaign, Contribution, Event, SyncState
 from db.session import get_session, init_db
 from pipeline.reorg import ReorgHandler
 
@@ -93,7 +93,7 @@ def test_reorg_rollback_marks_events_removed(test_config, mock_eth_client):
                 block_hash="0xoldhash",
                 address="0xe7f1725e7734ce288f8367e1bb143e90bb3f0512",
                 event_name="DonationReceived",
-                event_data='{"test": "data"}',
+                event_data={"test": "data"},
                 removed=False,
             )
             session.add(event)
@@ -124,3 +124,82 @@ def test_reorg_rollback_marks_events_removed(test_config, mock_eth_client):
         for event in events:
             assert event.removed is True
 
+
+
+def _clear_campaign(session, address):
+    """Remove a test campaign and everything referencing it."""
+    session.query(Event).filter(Event.address == address).delete()
+    session.query(Contribution).filter(Contribution.campaign_address == address).delete()
+    session.query(Campaign).filter(Campaign.address == address).delete()
+
+
+def test_consumer_rollback_rebuilds_state_from_surviving_events(test_config):
+    """Test a consumer rollback resets totals and contributions and replays the remaining events."""
+    from consumer.rollback_handler import RollbackHandler
+
+    init_db(test_config)
+    campaign_address = "0x9fe46736679d2d9a65f0992f2272de9f3c7fa6e0"
+    donor = "0x3c44cdddb6a900fa2b585dd299e03d12fa4293bc"
+
+    with get_session() as session:
+        _clear_campaign(session, campaign_address)
+        session.add(
+            Campaign(
+                address=campaign_address,
+                factory_address="0x5fbdb2315678afecb367f032d93f642f64180aa3",
+                creator_address="0x70997970c51812dc3a010c7d01b50e0d17dc79c8",
+                goal_wei=10000000000000000000,  # 10 ETH
+                deadline_ts=1735689600,
+                cid="QmTest123",
+                status="ACTIVE",
+                total_raised_wei=5000000000000000000,
+                withdrawn=False,
+            )
+        )
+        session.add(
+            Contribution(
+                campaign_address=campaign_address,
+                donor_address=donor,
+                contributed_wei=5000000000000000000,
+                refunded_wei=1000000000000000000,
+            )
+        )
+        # 2 ETH donated before the rolled-back range, 3 ETH and a 1 ETH refund inside it
+        events = [
+            (10, "DonationReceived", {"amount": 2000000000000000000, "newTotalRaised": 2000000000000000000}),
+            (60, "DonationReceived", {"amount": 3000000000000000000, "newTotalRaised": 5000000000000000000}),
+            (61, "Refunded", {"amount": 1000000000000000000}),
+        ]
+        for i, (block_number, event_name, args) in enumerate(events):
+            session.add(
+                Event(
+                    chain_id=31337,
+                    tx_hash=f"0x{0xabc0 + i:064x}",
+                    log_index=0,
+                    block_number=block_number,
+                    block_hash="0xoldhash",
+                    address=campaign_address,
+                    event_name=event_name,
+                    event_data={"campaign": campaign_address, "donor": donor, **args},
+                    removed=False,
+                )
+            )
+        session.commit()
+
+    with get_session() as session:
+        RollbackHandler(31337).handle_rollback(session, 50, 100, reason="reorg_detected")
+        session.commit()
+
+    with get_session() as session:
+        campaign = session.get(Campaign, campaign_address)
+        contribution = session.query(Contribution).filter(
+            Contribution.campaign_address == campaign_address,
+            Contribution.donor_address == donor,
+        ).one()
+
+        assert campaign.total_raised_wei == 2000000000000000000
+        assert contribution.contributed_wei == 2000000000000000000
+        assert contribution.refunded_wei == 0
+
+        _clear_campaign(session, campaign_address)
+        session.commit()
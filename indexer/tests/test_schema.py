@@ -0,0 +1,36 @@
+"""Tests for message schema parsing."""
+
+import pytest
+
+from messaging.schema import EventMessage, ReconciliationMessage, RollbackMessage, parse_message
+
+
+def test_parse_message_dispatches_on_message_type():
+    """Test that each message_type tag yields its own model."""
+    event = parse_message(
+        {
+            "message_type": "event",
+            "event_type": "DonationReceived",
+            "chain_id": 1,
+            "block_number": 10,
+            "block_hash": "0xAB",
+            "tx_hash": "0xCD",
+            "log_index": 0,
+            "address": "0xEF",
+            "timestamp": 1,
+            "event_data": {"amount": 2**200},
+        }
+    )
+
+    assert isinstance(event, EventMessage)
+    assert event.address == "0xef"
+    assert isinstance(parse_message({"message_type": "rollback", "chain_id": 1, "from_block": 1, "to_block": 2}), RollbackMessage)
+    assert isinstance(parse_message({"message_type": "reconciliation", "chain_id": 1}), ReconciliationMessage)
+
+
+def test_parse_message_rejects_unknown_type():
+    """Test that unknown or missing tags raise ValueError."""
+    with pytest.raises(ValueError):
+        parse_message({"message_type": "unknown", "chain_id": 1})
+    with pytest.raises(ValueError):
+        parse_message({"chain_id": 1})
@@ -286,3 +286,23 @@ def test_refunded_state_update(test_config):
         assert contribution.refunded_wei == 5000000000000000000
         assert contribution.contributed_wei == 5000000000000000000  # Lifetime total preserved
 
+
+def test_aggregate_events_collapses_per_row():
+    """Test that batched replay aggregation matches per-event application."""
+    from consumer.state_updater import _aggregate_events
+
+    campaign = "0xE7f1725E7734CE288F8367e1Bb143E90bb3F0512"
+    donor = "0x3c44cdddb6a900fa2b585dd299e03d12fa4293bc"
+    agg = _aggregate_events([
+        ("DonationReceived", {"campaign": campaign, "donor": donor, "amount": 3, "newTotalRaised": 3}),
+        ("DonationReceived", {"campaign": campaign, "donor": donor, "amount": 4, "newTotalRaised": 7}),
+        ("Refunded", {"campaign": campaign, "donor": donor, "amount": 2}),
+        ("Withdrawn", {"campaign": campaign, "amount": 7}),
+    ])
+
+    key = (campaign.lower(), donor)
+    assert agg.contrib_deltas == {key: 7}
+    assert agg.campaign_totals == {campaign.lower(): 7}
+    assert agg.campaign_peaks == {campaign.lower(): 7}
+    assert agg.refunds == {key: 2}
+    assert agg.withdrawn == {campaign.lower(): 7}